@@ -0,0 +1,171 @@
+import json
+import random
+import asyncio
+from typing import Any, AsyncGenerator, Dict, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import errors, types
+from pydantic import Field
+
+# Canned JSON for each agent, valid against agents/schemas.py
+CANNED_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "TranscriptionAgent": {"transcript": "Host: Welcome to the show.", "word_count": 5},
+    "ResearchAgent": {
+        "summary": "Background on the episode topic.",
+        "bullets": ["Key fact one", "Key fact two"],
+        "citations": [{"title": "Example source", "url": "https://example.com", "snippet": "Supporting detail."}],
+    },
+    "OutlineAgent": {
+        "hook": "Why this topic matters now.",
+        "segments": [{"title": "Introduction", "summary": "Setting the scene."}],
+        "closing": "Thanks for listening.",
+    },
+    "ShowNotesAgent": {"summary": "Episode summary.", "bullets": ["Takeaway one", "Takeaway two"]},
+    "TimestampAgent": {"chapters": [{"start": "00:00", "title": "Introduction"}]},
+    "QuoteAgent": {"quotes": ["A memorable line from the episode."]},
+    "SocialMediaAgent": {
+        "twitter_thread": ["1/ New episode out now."],
+        "linkedin_posts": ["New episode out now."],
+        "instagram_captions": ["New episode 🎙️"],
+    },
+    "SEOAgent": {"title": "Episode title", "meta_description": "Episode description.", "keywords": ["podcast"]},
+    "SummaryAgent": {"summary": "Summary of this part of the episode.", "key_points": ["Point one"]},
+}
+
+
+# Reply for malformed_rate: no JSON, so the orchestrator's parse retry kicks in
+MALFORMED_RESPONSE = "Sure! Here is what I found about the episode, in plain prose this time."
+
+
+class FakeBackend:
+    """
+    Behaviour and counters shared by every FakeLlm of a run, i.e. one simulated API quota.
+
+    A call is rejected with a 429 (RESOURCE_EXHAUSTED, carrying a RetryInfo
+    retryDelay) with probability `rate_limit_rate`, or whenever `max_concurrency`
+    calls are already in flight. Otherwise it fails with a 503 with probability
+    `failure_rate`, or answers without JSON with probability `malformed_rate`
+    (unless the request carries a response schema, which a real model is
+    constrained to follow).
+
+    `latency` is the time to the first token; with `tokens_per_second` the reply
+    is then streamed at that rate (about 4 characters per token). Given a `seed`,
+    the same sequence of calls sees the same failures.
+    """
+
+    def __init__(self, latency: float = 0.05, rate_limit_rate: float = 0.0, max_concurrency: Optional[int] = None, retry_after: float = 1.0, chunk_chars: int = 32, seed: Optional[int] = None, tokens_per_second: Optional[float] = None, failure_rate: float = 0.0, malformed_rate: float = 0.0):
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.max_concurrency = max_concurrency
+        self.retry_after = retry_after
+        self.chunk_chars = chunk_chars
+        self.tokens_per_second = tokens_per_second
+        self.failure_rate = failure_rate
+        self.malformed_rate = malformed_rate
+        self.random = random.Random(seed)
+
+        self.calls = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.malformed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+
+    def rate_limit_error(self) -> errors.ClientError:
+        return errors.ClientError(429, {
+            "error": {
+                "code": 429,
+                "message": "Resource has been exhausted (e.g. check quota).",
+                "status": "RESOURCE_EXHAUSTED",
+                "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": f"{self.retry_after:g}s"}],
+            }
+        })
+
+    def server_error(self) -> errors.ServerError:
+        return errors.ServerError(503, {
+            "error": {"code": 503, "message": "The model is overloaded. Please try again later.", "status": "UNAVAILABLE"}
+        })
+
+    def should_reject(self) -> bool:
+        if self.max_concurrency is not None and self.in_flight >= self.max_concurrency:
+            return True
+        return self.random.random() < self.rate_limit_rate
+
+    def stream_delay(self, chars: int) -> float:
+        return (chars / 4) / self.tokens_per_second if self.tokens_per_second else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "rate_limited": self.rate_limited,
+            "failures": self.failures,
+            "malformed": self.malformed,
+            "max_in_flight": self.max_in_flight,
+            "prompt_tokens": self.prompt_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+class FakeLlm(BaseLlm):
+    """Offline model that answers with CANNED_RESPONSES[agent_name], streamed in chunks when asked to."""
+
+    agent_name: str = ""
+    backend: Any = Field(default=None, repr=False, exclude=True)
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        backend = self.backend or FakeBackend()
+        backend.calls += 1
+        if backend.should_reject():
+            backend.rate_limited += 1
+            raise backend.rate_limit_error()
+
+        backend.in_flight += 1
+        backend.max_in_flight = max(backend.max_in_flight, backend.in_flight)
+        try:
+            await asyncio.sleep(backend.latency)
+            roll = backend.random.random()
+            if roll < backend.failure_rate:
+                backend.failures += 1
+                raise backend.server_error()
+            constrained = llm_request.config is not None and llm_request.config.response_schema is not None
+            if roll < backend.failure_rate + backend.malformed_rate and not constrained:
+                backend.malformed += 1
+                text = MALFORMED_RESPONSE
+            else:
+                text = json.dumps(CANNED_RESPONSES.get(self.agent_name, {}), ensure_ascii=False)
+
+            prompt_chars = sum(len(p.text or "") for c in llm_request.contents for p in (c.parts or []))
+            usage = types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_chars // 4,
+                candidates_token_count=len(text) // 4,
+                total_token_count=(prompt_chars + len(text)) // 4,
+            )
+            backend.prompt_tokens += prompt_chars // 4
+            backend.output_tokens += len(text) // 4
+
+            if stream and backend.chunk_chars:
+                for i in range(0, len(text), backend.chunk_chars):
+                    chunk = text[i:i + backend.chunk_chars]
+                    if backend.tokens_per_second:
+                        await asyncio.sleep(backend.stream_delay(len(chunk)))
+                    yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=chunk)]), partial=True)
+            elif backend.tokens_per_second:
+                await asyncio.sleep(backend.stream_delay(len(text)))
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=text)]), usage_metadata=usage)
+        finally:
+            backend.in_flight -= 1
+
+
+def use_fake_models(registry: Any, backend: Optional[FakeBackend] = None) -> FakeBackend:
+    """Point every agent in an AgentRegistry at a FakeLlm sharing one backend; returns the backend."""
+    from pipeline.registry import AGENT_FACTORIES
+
+    backend = backend or FakeBackend()
+    for key in AGENT_FACTORIES:
+        agent = registry.agent(key)
+        agent.model = FakeLlm(model=f"fake-{agent.name}", agent_name=agent.name, backend=backend)
+    return backend
@@ -1,5 +1,6 @@
 from google.adk import Agent
 from config import Config
+from agents.schemas import OutlineOutput
 
 def build_outline_agent():
     return Agent(
@@ -18,5 +19,6 @@ Return ONLY JSON structured as:
   "closing": "<one-line closing>"
 }
 Return exactly JSON only.
-        """
+        """,
+        output_schema=OutlineOutput,
     )
@@ -1,6 +1,6 @@
 from google.adk import Agent
 from config import Config
-from tools.search_tool import web_search
+from tools.search_tool import web_search, web_search_many
 
 def build_research_agent():
     return Agent(
@@ -11,6 +11,8 @@ You are an expert researcher.
 Call the tool 'web_search' with:
   - query (string)
   - num_results (integer, default 3)
+To look up several angles at once, call 'web_search_many' with a list of queries instead;
+the searches run in parallel.
 Return ONLY JSON with:
 {
   "summary": "<3-5 sentence summary>",
@@ -19,5 +21,5 @@ Return ONLY JSON with:
 }
 Do not include extra commentary.
         """,
-        tools=[web_search]
+        tools=[web_search, web_search_many]
     )
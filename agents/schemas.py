@@ -55,3 +55,8 @@ class SEOOutput(BaseModel):
     title: str
     meta_description: str
     keywords: List[str]
+
+# 9. Summary Agent (transcript chunks and the merged episode digest)
+class SummaryOutput(BaseModel):
+    summary: str
+    key_points: List[str]
@@ -1,6 +1,6 @@
 from google.adk import Agent
 from config import Config
-from tools.custom_tools import save_to_file
+from agents.schemas import SEOOutput
 import json
 
 def build_seo_agent():
@@ -18,17 +18,6 @@ You MUST return ONLY valid JSON with this structure:
 }
 
 DO NOT return text outside JSON.
-
-After producing JSON:
-Call the tool save_to_file(filename: str, content: str)
-with:
-{
-  "filename": "seo.json",
-  "content": "<the SAME JSON you produced>"
-}
-
-The final reply after tool call must be ONLY:
-{"status": "saved"}
         """,
-        tools=[save_to_file]
+        output_schema=SEOOutput,
     )
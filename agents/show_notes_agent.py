@@ -1,6 +1,6 @@
 from google.adk import Agent
 from config import Config
-from tools.custom_tools import save_to_file
+from agents.schemas import ShowNotesOutput
 
 def build_show_notes_agent():
     return Agent(
@@ -27,14 +27,6 @@ RULES:
 - No plain text.
 - No extra commentary.
 - Do NOT create .md files.
-- After generating the JSON, you MUST call save_to_file with:
-  {
-    "filename": "show_notes.json",
-    "content": "<the SAME JSON you produced>"
-  }
-
-Your final assistant message MUST be:
-{"status": "saved"}
         """,
-        tools=[save_to_file]
+        output_schema=ShowNotesOutput,
     )
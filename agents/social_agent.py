@@ -1,6 +1,6 @@
 from google.adk import Agent
 from config import Config
-from tools.custom_tools import save_to_file
+from agents.schemas import SocialOutput
 
 def build_social_agent():
     return Agent(
@@ -38,18 +38,7 @@ Your output MUST follow this exact structure:
 - LinkedIn posts must be 2–4 sentences each.
 - Instagram captions must include emojis and 3–6 hashtags.
 
-### TOOL CALL REQUIREMENT
-After generating the JSON, you MUST call save_to_file with:
-
-{
-  "filename": "social.json",
-  "content": "<the EXACT SAME JSON you produced>"
-}
-
-Finally, as your last assistant message, reply ONLY with:
-{"status": "saved"}
-
 NO extra text. NO explanations. NO markdown.
 """,
-        tools=[save_to_file]
+        output_schema=SocialOutput,
     )
@@ -0,0 +1,22 @@
+from google.adk import Agent
+from config import Config
+from agents.schemas import SummaryOutput
+
+def build_summary_agent():
+    return Agent(
+        name="SummaryAgent",
+        model=Config.MODEL_NAME,
+        instruction="""
+You condense podcast material into a compact digest.
+The input is either a part of a transcript or a list of earlier summaries.
+Keep names, numbers, claims and memorable lines; drop filler and repetition.
+Keep any [HH:MM:SS] timecodes that mark where a topic starts.
+Return ONLY JSON structured as:
+{
+  "summary": "<one dense paragraph, at most 200 words>",
+  "key_points": ["point 1", "point 2", ...]
+}
+Return exactly JSON only.
+        """,
+        output_schema=SummaryOutput,
+    )
@@ -1,6 +1,6 @@
 from google.adk import Agent
 from config import Config
-from tools.custom_tools import save_to_file
+from agents.schemas import TimestampOutput
 
 def build_timestamp_agent():
     return Agent(
@@ -30,16 +30,6 @@ RULES:
 - No .txt file creation.
 - No extra commentary.
 - No text outside JSON.
-
-After producing JSON:
-You MUST call save_to_file with:
-{
-  "filename": "timestamps.json",
-  "content": "<the SAME JSON you produced>"
-}
-
-Finally, the assistant MUST return:
-{"status": "saved"}
         """,
-        tools=[save_to_file]
+        output_schema=TimestampOutput,
     )
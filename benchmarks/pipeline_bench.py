@@ -0,0 +1,308 @@
+"""
+End-to-end pipeline benchmark against the offline FakeLlm.
+
+Every transcript size runs in its own process (clean caches, accurate peak
+memory) through PodcastOrchestrator.run_lifecycle with every agent answered by
+agents/fake_llm.py. Reports wall time, per-stage latency, event-loop blocking
+and peak memory, and saves them as JSON; --compare flags regressions against
+an earlier result file.
+
+    python -m benchmarks.pipeline_bench
+    python -m benchmarks.pipeline_bench --sizes 1000 10000 --repeat 3 --compare benchmarks/results/baseline.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+console = Console()
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Isolated from the user's caches, session database, live event log and trace/metrics files
+BENCH_ENV = {
+    "CACHE_ENABLED": "0",
+    "SESSION_BACKEND": "memory",
+    "EVENTS_PATH": "",
+    "TRACING_ENABLED": "0",
+}
+
+# Compared by --compare; higher is worse for all of them
+REGRESSION_METRICS = ("wall_s", "peak_rss_mb", "max_stall_ms")
+
+_VOCABULARY = (
+    "the model data team launch users growth product market research question idea really think "
+    "because people build learn platform problem customer value story early feedback scale time "
+    "focus important different actually change company process system quality simple future"
+).split()
+
+
+def make_transcript(words: int, seed: int = 0) -> str:
+    """Deterministic two-speaker transcript of about `words` words."""
+    rng = random.Random(seed)
+    lines = []
+    remaining = words
+    speaker = 0
+    while remaining > 0:
+        n = min(remaining, rng.randint(12, 40))
+        lines.append(("Host: " if speaker == 0 else "Guest: ") + " ".join(rng.choices(_VOCABULARY, k=n)) + ".")
+        remaining -= n
+        speaker ^= 1
+    return "\n".join(lines)
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# ----------------------------------------------------------------- child: one run -----------------------------------------------------------------
+
+def run_once(args: argparse.Namespace) -> Dict[str, Any]:
+    import asyncio
+    from agents.fake_llm import FakeBackend, use_fake_models
+    from orchestrator import PodcastOrchestrator
+    from pipeline.output_sink import LoopStallMonitor
+    from pipeline.registry import get_registry
+
+    backend = use_fake_models(get_registry(), FakeBackend(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        rate_limit_rate=args.rate_limit_rate,
+        failure_rate=args.failure_rate,
+        malformed_rate=args.malformed_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    ))
+    orchestrator = PodcastOrchestrator(session_id=f"bench_{args.words}", output_dir=args.output_dir, show_progress=False, use_cache=False)
+    rss_before = peak_rss_mb()
+
+    async def main():
+        # Covers the whole run, including ingest and the final writes outside the stage graph
+        async with LoopStallMonitor() as monitor:
+            start = time.perf_counter()
+            error = None
+            try:
+                await orchestrator.run_lifecycle(topic="Benchmark Episode", transcript_path=args.transcript)
+            except Exception as e:
+                error = str(e)
+            return time.perf_counter() - start, monitor.stats(), error
+
+    wall, loop, error = asyncio.run(main())
+    timings = orchestrator.stage_timings
+    return {
+        "words": args.words,
+        "ok": error is None,
+        "error": error,
+        "wall_s": round(wall, 3),
+        "stages": {t["stage"]: t["duration_s"] for t in timings},
+        "stage_status": {t["stage"]: t["status"] for t in timings},
+        "max_stall_ms": loop["max_stall_ms"],
+        "stalled_ms": loop["stalled_ms"],
+        "peak_rss_mb": peak_rss_mb(),
+        "rss_at_start_mb": rss_before,
+        "model_calls": orchestrator.model_calls,
+        "parse_failures": orchestrator.parse_failures,
+        "fake_llm": backend.stats(),
+    }
+
+
+# --------------------------------------------------------------- parent: the suite ---------------------------------------------------------------
+
+def run_child(words: int, transcript: str, args: argparse.Namespace, workdir: str) -> Dict[str, Any]:
+    output_dir = tempfile.mkdtemp(prefix=f"run_{words}_", dir=workdir)
+    result_path = os.path.join(output_dir, "result.json")
+    cmd = [
+        sys.executable, "-m", "benchmarks.pipeline_bench", "--child",
+        "--words", str(words), "--transcript", transcript, "--output-dir", output_dir, "--result", result_path,
+        "--latency", str(args.latency), "--rate-limit-rate", str(args.rate_limit_rate),
+        "--failure-rate", str(args.failure_rate), "--malformed-rate", str(args.malformed_rate),
+        "--retry-after", str(args.retry_after), "--seed", str(args.seed),
+    ]
+    if args.tokens_per_second:
+        cmd += ["--tokens-per-second", str(args.tokens_per_second)]
+
+    env = {**os.environ, **BENCH_ENV}
+    out = None if args.verbose else subprocess.DEVNULL
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, env=env, stdout=out, stderr=out)
+    if proc.returncode != 0 or not os.path.exists(result_path):
+        return {"words": words, "ok": False, "error": f"benchmark process exited with {proc.returncode}"}
+    with open(result_path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def summarize(words: int, runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ok = [r for r in runs if r.get("ok")]
+    summary = {"words": words, "runs": runs, "ok_runs": len(ok)}
+    for metric in REGRESSION_METRICS:
+        values = [r[metric] for r in ok if r.get(metric) is not None]
+        summary[metric] = round(statistics.median(values), 3) if values else None
+    stages = sorted({s for r in ok for s in r["stages"]})
+    summary["stages"] = {s: round(statistics.median(r["stages"][s] for r in ok if s in r["stages"]), 3) for s in stages}
+    return summary
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(report: Dict[str, Any]):
+    table = Table(title=f"Pipeline Benchmark ({report['git_commit'] or 'unknown commit'})")
+    table.add_column("Words", justify="right")
+    table.add_column("Runs", justify="right")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("Max stall (ms)", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("Slowest stages")
+    for r in report["results"]:
+        slowest = sorted(r["stages"].items(), key=lambda kv: -kv[1])[:3]
+        table.add_row(
+            f"{r['words']:,}",
+            f"{r['ok_runs']}/{len(r['runs'])}",
+            f"{r['wall_s']}" if r["wall_s"] is not None else "-",
+            f"{r['max_stall_ms']}" if r["max_stall_ms"] is not None else "-",
+            f"{r['peak_rss_mb']}" if r["peak_rss_mb"] is not None else "-",
+            ", ".join(f"{s} {d:.2f}s" for s, d in slowest),
+        )
+    console.print(table)
+
+
+def compare(report: Dict[str, Any], baseline_path: str, threshold: float) -> List[str]:
+    """Metrics more than `threshold` (fraction) worse than the baseline, per transcript size."""
+    with open(baseline_path, "r", encoding="utf-8") as fh:
+        baseline = {r["words"]: r for r in json.load(fh)["results"]}
+
+    table = Table(title=f"Compared with {os.path.basename(baseline_path)}")
+    table.add_column("Words", justify="right")
+    for metric in REGRESSION_METRICS:
+        table.add_column(metric, justify="right")
+
+    regressions = []
+    for r in report["results"]:
+        base = baseline.get(r["words"])
+        if base is None:
+            continue
+        cells = []
+        for metric in REGRESSION_METRICS:
+            new, old = r.get(metric), base.get(metric)
+            if not new or not old:
+                cells.append("-")
+                continue
+            change = (new - old) / old
+            worse = change > threshold
+            if worse:
+                regressions.append(f"{r['words']} words: {metric} {old} -> {new} ({change:+.0%})")
+            cells.append(f"[{'red' if worse else 'green'}]{old} -> {new} ({change:+.0%})[/]")
+        table.add_row(f"{r['words']:,}", *cells)
+    console.print(table)
+    return regressions
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="End-to-end pipeline benchmark with a fake LLM")
+    p.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Transcript sizes in words")
+    p.add_argument("--repeat", type=int, default=1, help="Runs per size (medians are reported)")
+    p.add_argument("--latency", type=float, default=0.05, help="Fake model time to first token (s)")
+    p.add_argument("--tokens-per-second", type=float, default=1000, help="Fake model output streaming rate (0: instant)")
+    p.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of calls answered with a 429")
+    p.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of calls failing with a 503")
+    p.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of replies without JSON")
+    p.add_argument("--retry-after", type=float, default=0.5, help="retryDelay sent with fake 429s (s)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--out", default=None, help="Result file (default: benchmarks/results/bench-<time>.json)")
+    p.add_argument("--compare", default=None, help="Earlier result file to check for regressions")
+    p.add_argument("--threshold", type=float, default=0.2, help="Regression threshold for --compare (fraction)")
+    p.add_argument("--verbose", action="store_true", help="Show the pipeline's own output")
+    # Internal: a single run in a fresh process
+    p.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    p.add_argument("--words", type=int, help=argparse.SUPPRESS)
+    p.add_argument("--transcript", help=argparse.SUPPRESS)
+    p.add_argument("--output-dir", help=argparse.SUPPRESS)
+    p.add_argument("--result", help=argparse.SUPPRESS)
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.child:
+        result = run_once(args)
+        with open(args.result, "w", encoding="utf-8") as fh:
+            json.dump(result, fh)
+        return
+
+    workdir = tempfile.mkdtemp(prefix="podcast_bench_")
+    results = []
+    try:
+        for words in args.sizes:
+            transcript = os.path.join(workdir, f"transcript_{words}.txt")
+            with open(transcript, "w", encoding="utf-8") as fh:
+                fh.write(make_transcript(words, seed=args.seed))
+            runs = []
+            for i in range(args.repeat):
+                console.print(f"[cyan]{words:,} words: run {i + 1}/{args.repeat}[/cyan]")
+                runs.append(run_child(words, transcript, args, workdir))
+                if not runs[-1].get("ok"):
+                    console.print(f"[red]{words:,} words failed: {runs[-1].get('error')}[/red]")
+            results.append(summarize(words, runs))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "latency": args.latency,
+            "tokens_per_second": args.tokens_per_second,
+            "rate_limit_rate": args.rate_limit_rate,
+            "failure_rate": args.failure_rate,
+            "malformed_rate": args.malformed_rate,
+            "retry_after": args.retry_after,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    print_results(report)
+
+    out = args.out or os.path.join(RESULTS_DIR, f"bench-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    console.print(f"Results: {out}")
+
+    if args.compare:
+        regressions = compare(report, args.compare, args.threshold)
+        if regressions:
+            console.print("[red]Regressions:[/red]\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
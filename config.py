@@ -9,6 +9,7 @@ class Config:
     PROJECT_ID: str = os.getenv("GOOGLE_PROJECT_ID", "")
     LOCATION: str = os.getenv("GOOGLE_LOCATION", "asia-south1")
     MODEL_NAME: str = os.getenv("MODEL_NAME", "gemini-2.0-flash")
+    GENAI_STUB: bool = os.getenv("GENAI_STUB", "0") in ("1", "true", "True")
 
     # Required Folders
     ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +17,122 @@ class Config:
     AUDIO_DIR = os.path.join(ROOT_DIR, "podcast_recordings")
     TESTDATA_DIR = os.path.join(ROOT_DIR, "test_data")
 
+    # Output files: "indented" (readable) or "compact"; context.json and the session snapshot are always compact
+    OUTPUT_JSON_FORMAT: str = os.getenv("OUTPUT_JSON_FORMAT", "indented")
+
+    # Pipeline progress events (JSON Lines, streamed by the dashboard); empty disables the file
+    EVENTS_PATH: str = os.getenv("EVENTS_PATH", os.path.join(OUTPUT_DIR, "events.jsonl"))
+
+    # Tracing: spans for stages, agent calls and tools (JSONL) plus aggregated Prometheus metrics
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "1") not in ("0", "false", "False")
+    TRACE_PATH: str = os.getenv("TRACE_PATH", os.path.join(OUTPUT_DIR, "trace.jsonl"))
+    METRICS_PATH: str = os.getenv("METRICS_PATH", os.path.join(OUTPUT_DIR, "metrics.prom"))
+
+    # Content-addressed store for large blobs (outputs/artifacts); compression: auto (gzip) | gzip | none,
+    # or zstd (opt-in, needs the zstandard package wherever artifacts are read; gzip without it)
+    ARTIFACT_COMPRESSION: str = os.getenv("ARTIFACT_COMPRESSION", "auto")
+    ARTIFACT_MIN_BYTES: int = int(os.getenv("ARTIFACT_MIN_KB", "64")) * 1024
+
+    # Session state: sqlite (persisted per key in SESSION_DB_PATH, WAL mode) | memory (process-local) | none
+    SESSION_BACKEND: str = os.getenv("SESSION_BACKEND", "sqlite")
+    SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", os.path.join(ROOT_DIR, ".cache", "sessions.db"))
+    SESSION_HISTORY_MAX: int = int(os.getenv("SESSION_HISTORY_MAX", "200"))
+
+    # Batch mode
+    BATCH_MAX_EPISODES: int = int(os.getenv("BATCH_MAX_EPISODES", "4"))
+    MAX_CONCURRENT_MODEL_CALLS: int = int(os.getenv("MAX_CONCURRENT_MODEL_CALLS", "8"))
+
+    # Model rate limiting (0 disables a bucket)
+    MODEL_RPM: int = int(os.getenv("MODEL_RPM", "0"))
+    MODEL_TPM: int = int(os.getenv("MODEL_TPM", "0"))
+    EXPECTED_OUTPUT_TOKENS: int = int(os.getenv("EXPECTED_OUTPUT_TOKENS", "1000"))
+    BACKOFF_BASE_SECONDS: float = float(os.getenv("BACKOFF_BASE_SECONDS", "2"))
+    BACKOFF_MAX_SECONDS: float = float(os.getenv("BACKOFF_MAX_SECONDS", "60"))
+    MAX_RATE_LIMIT_RETRIES: int = int(os.getenv("MAX_RATE_LIMIT_RETRIES", "6"))
+
+    # Per-episode budget (0: unlimited); usage and estimated cost are saved to <output_dir>/usage.json.
+    # As the budget is used up, calls move to a cheaper model, transcript excerpts shrink and optional
+    # assets are skipped before anything fails: the first entry of BUDGET_SKIP_ORDER from BUDGET_SKIP_AT,
+    # each later one a further even step towards the full budget (85%, 90%, 95% by default).
+    EPISODE_TOKEN_BUDGET: int = int(os.getenv("EPISODE_TOKEN_BUDGET", "0"))
+    EPISODE_COST_BUDGET_USD: float = float(os.getenv("EPISODE_COST_BUDGET_USD", "0"))
+    BUDGET_FALLBACK_MODEL: str = os.getenv("BUDGET_FALLBACK_MODEL", "gemini-2.0-flash-lite")
+    BUDGET_DOWNGRADE_AT: float = float(os.getenv("BUDGET_DOWNGRADE_AT", "0.5"))
+    BUDGET_SHRINK_AT: float = float(os.getenv("BUDGET_SHRINK_AT", "0.7"))
+    BUDGET_SHRINK_FACTOR: float = float(os.getenv("BUDGET_SHRINK_FACTOR", "0.5"))
+    BUDGET_SKIP_AT: float = float(os.getenv("BUDGET_SKIP_AT", "0.85"))
+    BUDGET_SKIP_ORDER = [s for s in os.getenv("BUDGET_SKIP_ORDER", "social,seo,quotes").split(",") if s]
+
+    # USD per 1M (input, output) tokens, for cost estimates; override with MODEL_PRICE_<MODEL>="in,out"
+    MODEL_PRICES = {
+        "gemini-2.0-flash": (0.10, 0.40),
+        "gemini-2.0-flash-lite": (0.075, 0.30),
+        "gemini-2.5-flash": (0.30, 2.50),
+        "gemini-2.5-flash-lite": (0.10, 0.40),
+        "gemini-2.5-pro": (1.25, 10.00),
+    }
+
+    # Agent result cache
+    CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(ROOT_DIR, ".cache", "agent_results"))
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "1") not in ("0", "false", "False")
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "500"))
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_MB", "200")) * 1024 * 1024
+    CACHE_MAX_AGE_HOURS: float = float(os.getenv("CACHE_MAX_AGE_HOURS", "168"))
+
+    # Research reuse across episodes (TF-IDF similarity of topics)
+    RESEARCH_INDEX_PATH = os.getenv("RESEARCH_INDEX_PATH", os.path.join(ROOT_DIR, ".cache", "research_index.json"))
+    RESEARCH_INDEX_MAX_ENTRIES: int = int(os.getenv("RESEARCH_INDEX_MAX_ENTRIES", "1000"))
+    RESEARCH_REUSE_SIMILARITY: float = float(os.getenv("RESEARCH_REUSE_SIMILARITY", "0.8"))
+    RESEARCH_REFRESH_SIMILARITY: float = float(os.getenv("RESEARCH_REFRESH_SIMILARITY", "0.5"))
+    RESEARCH_FRESH_DAYS: float = float(os.getenv("RESEARCH_FRESH_DAYS", "7"))
+    RESEARCH_MAX_AGE_DAYS: float = float(os.getenv("RESEARCH_MAX_AGE_DAYS", "30"))
+
+    # Web search (research agent)
+    SEARCH_ENDPOINT: str = os.getenv("SEARCH_ENDPOINT", "https://html.duckduckgo.com/html/")
+    SEARCH_TIMEOUT: float = float(os.getenv("SEARCH_TIMEOUT", "10"))
+    SEARCH_MAX_CONNECTIONS: int = int(os.getenv("SEARCH_MAX_CONNECTIONS", "10"))
+    SEARCH_CACHE_DIR = os.getenv("SEARCH_CACHE_DIR", os.path.join(ROOT_DIR, ".cache", "search"))
+    SEARCH_CACHE_TTL_HOURS: float = float(os.getenv("SEARCH_CACHE_TTL_HOURS", "24"))
+
+    # Long-audio transcription (overlapping chunks transcribed concurrently)
+    TRANSCRIBE_CHUNK_SECONDS: float = float(os.getenv("TRANSCRIBE_CHUNK_SECONDS", "600"))
+    TRANSCRIBE_CHUNK_OVERLAP_SECONDS: float = float(os.getenv("TRANSCRIBE_CHUNK_OVERLAP_SECONDS", "8"))
+    TRANSCRIBE_MAX_WORKERS: int = int(os.getenv("TRANSCRIBE_MAX_WORKERS", "4"))
+    TRANSCRIBE_MAX_UPLOADS: int = int(os.getenv("TRANSCRIBE_MAX_UPLOADS", "8"))
+
+    # Transcript context given to agents (approximate tokens)
+    CONTEXT_TOKEN_BUDGET: int = int(os.getenv("CONTEXT_TOKEN_BUDGET", "6000"))
+    CONTEXT_WINDOW_TOKENS: int = int(os.getenv("CONTEXT_WINDOW_TOKENS", "800"))
+    CONTEXT_BUDGETS = {
+        "outline": 8000,
+        "show_notes": 6000,
+        "timestamps": 8000,
+        "quotes": 6000,
+        "social": 3000,
+        "seo": 2000,
+    }
+
+    # Map-reduce episode digest for long transcripts
+    DIGEST_THRESHOLD_TOKENS: int = int(os.getenv("DIGEST_THRESHOLD_TOKENS", "30000"))
+    DIGEST_CHUNK_TOKENS: int = int(os.getenv("DIGEST_CHUNK_TOKENS", "6000"))
+    DIGEST_MAX_CONCURRENCY: int = int(os.getenv("DIGEST_MAX_CONCURRENCY", "4"))
+    DIGEST_FAN_IN: int = int(os.getenv("DIGEST_FAN_IN", "8"))
+
+    @staticmethod
+    def context_budget(agent_key: str) -> int:
+        """Token budget for an agent's transcript excerpt; override with CONTEXT_BUDGET_<AGENT>."""
+        default = Config.CONTEXT_BUDGETS.get(agent_key, Config.CONTEXT_TOKEN_BUDGET)
+        return int(os.getenv(f"CONTEXT_BUDGET_{agent_key.upper()}", default))
+
+    @staticmethod
+    def model_price(model: str) -> tuple:
+        """USD per 1M (input, output) tokens; unknown models cost nothing."""
+        override = os.getenv("MODEL_PRICE_" + "".join(c if c.isalnum() else "_" for c in model).upper())
+        if override:
+            price_in, price_out = override.split(",")
+            return float(price_in), float(price_out)
+        return Config.MODEL_PRICES.get(model, (0.0, 0.0))
+
     @staticmethod
     def init_directories():
         """Ensure essential folders exist."""
@@ -1,5 +1,6 @@
-from flask import Flask, send_file, render_template, abort, jsonify
-import os, json
+from flask import Flask, Response, request, send_file, render_template, abort, jsonify
+from collections import OrderedDict
+import os, sys, json, gzip, time, hashlib, argparse, threading
 
 app = Flask(__name__, template_folder='templates', static_folder='static')
 
@@ -8,6 +9,36 @@ ROOT = os.path.abspath(os.path.dirname(__file__))
 PROJECT_ROOT = os.path.dirname(ROOT)
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "outputs")
 
+# Response cache: serialized bodies keyed by path, valid while the file's mtime and size are unchanged
+CACHE_MAX_BYTES = int(os.getenv("DASHBOARD_CACHE_MAX_MB", "64")) * 1024 * 1024
+GZIP_MIN_BYTES = 1024
+
+# Live progress: the pipeline's event log, tailed by /api/events
+EVENTS_PATH = os.getenv("EVENTS_PATH", os.path.join(OUTPUT_DIR, "events.jsonl"))
+EVENTS_POLL_SECONDS = 0.5
+# Also how soon a closed tab is noticed (the write fails) and its stream slot freed
+EVENTS_KEEPALIVE_SECONDS = 5
+
+# Tracing output of the pipeline: spans (timeline view) and Prometheus metrics
+TRACE_PATH = os.getenv("TRACE_PATH", os.path.join(OUTPUT_DIR, "trace.jsonl"))
+METRICS_PATH = os.getenv("METRICS_PATH", os.path.join(OUTPUT_DIR, "metrics.prom"))
+
+# Serving (see __main__): production by default; every open dashboard tab holds one thread for /api/events
+HOST = os.getenv("DASHBOARD_HOST", "127.0.0.1")
+PORT = int(os.getenv("DASHBOARD_PORT", "5000"))
+THREADS = int(os.getenv("DASHBOARD_THREADS", "16"))
+
+# Concurrent /api/events streams; beyond it new streams get a 503, so live tabs cannot take every
+# worker thread. Defaults to half the threads, leaving the rest for the API, downloads and /healthz
+MAX_EVENT_STREAMS = int(os.getenv("DASHBOARD_MAX_EVENT_STREAMS", "0")) or max(1, THREADS // 2)
+event_stream_slots = threading.BoundedSemaphore(MAX_EVENT_STREAMS)
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+STARTED_AT = time.time()
+
+# Shared helpers from the project (artifact references in outputs)
+sys.path.insert(0, PROJECT_ROOT)
+from memory.artifact_store import ARTIFACT_KEY, load_resolved
+
 def safe_listdir(path):
     try:
         return sorted(os.listdir(path))
@@ -25,45 +56,335 @@ def list_json_files(path):
         files.append(f)
     return files
 
+# Artifact references (e.g. the transcript) are inlined from the output folder's artifact store
 def load_json_safe(path):
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return load_resolved(path)
     except Exception:
         return None
 
+class CachedBody:
+    def __init__(self, body, etag, has_refs=False):
+        self.body = body
+        self.etag = etag
+        # The source held artifact references, so the body is not the file as stored
+        self.has_refs = has_refs
+        self._gzipped = None
+
+    @property
+    def gzipped(self):
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+    @property
+    def size(self):
+        return len(self.body) + len(self._gzipped or b"")
+
+class ResponseCache:
+    """
+    LRU of pre-serialized JSON bodies. An entry is reused while its validator
+    (mtime_ns and size of the source) matches, so unchanged files are served
+    without reading or parsing them again. Gzipped bodies are built on first use.
+    `build` returns the body, or (body, has_refs) for sources that may hold artifact references.
+    """
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, validator, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == validator:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        built = build()
+        body, has_refs = built if isinstance(built, tuple) else (built, False)
+        cached = CachedBody(body, hashlib.blake2b(body, digest_size=16).hexdigest(), has_refs)
+        with self._lock:
+            self._entries[key] = (validator, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > 1 and sum(e[1].size for e in self._entries.values()) > self.max_bytes:
+                self._entries.popitem(last=False)
+        return cached
+
+response_cache = ResponseCache()
+
+def file_validator(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+# 304 when the client already has this body; gzip when accepted and worth it.
+# The gzip variant has its own strong ETag, since its bytes differ from the identity body
+def cached_response(cached):
+    use_gzip = len(cached.body) >= GZIP_MIN_BYTES and "gzip" in request.accept_encodings
+    etag = cached.etag + "-gz" if use_gzip else cached.etag
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    elif use_gzip:
+        resp = Response(cached.gzipped, mimetype="application/json")
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(cached.body, mimetype="application/json")
+    resp.set_etag(etag)
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+# Files without artifact references are served as stored; only the first read after a change validates them
+def build_json_body(path):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    if ARTIFACT_KEY.encode("utf-8") not in raw:
+        json.loads(raw)
+        return raw, False
+    return json.dumps(load_resolved(path), ensure_ascii=False).encode("utf-8"), True
+
+def cached_json(path):
+    return response_cache.get(("json", path), file_validator(path), lambda: build_json_body(path))
+
 def is_safe_path(basedir, path):
     abs_base = os.path.abspath(basedir)
     abs_target = os.path.abspath(path)
     return abs_target.startswith(abs_base)
 
+@app.route("/healthz")
+def healthz():
+    ok = os.path.isdir(OUTPUT_DIR)
+    body = {
+        "status": "ok" if ok else "degraded",
+        "outputs_dir": OUTPUT_DIR,
+        "uptime_s": round(time.time() - STARTED_AT, 1),
+        "cached_responses": len(response_cache._entries),
+        "event_streams_max": MAX_EVENT_STREAMS,
+    }
+    return jsonify(body), (200 if ok else 503)
+
 @app.route("/")
 def dashboard():
     return render_template("dashboard.html")
 
 @app.route("/api/list")
 def api_list():
-    files = list_json_files(OUTPUT_DIR)
-    return jsonify({"files": files})
+    try:
+        validator = file_validator(OUTPUT_DIR)
+    except OSError:
+        validator = None
+    # The directory's mtime changes whenever a file is added, removed or renamed into place
+    cached = response_cache.get(
+        ("list", OUTPUT_DIR), validator,
+        lambda: json.dumps({"files": list_json_files(OUTPUT_DIR)}).encode("utf-8"),
+    )
+    return cached_response(cached)
 
 @app.route("/api/json/<path:filename>")
 def get_json(filename):
     candidate = os.path.abspath(os.path.join(OUTPUT_DIR, filename))
     if not is_safe_path(OUTPUT_DIR, candidate) or not os.path.isfile(candidate):
         return abort(404)
-    
-    data = load_json_safe(candidate)
-    if data is None:
+
+    try:
+        cached = cached_json(candidate)
+    except Exception:
         return jsonify({"error": "Could not load file"}), 500
-    return jsonify(data)
+    return cached_response(cached)
+
+# Spans grouped by trace (one per run_lifecycle), each trace's spans in start order
+def build_trace_body(path):
+    traces = {}
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                span = json.loads(line)
+            except ValueError:
+                continue
+            traces.setdefault(span["trace_id"], []).append(span)
+
+    result = []
+    for trace_id, spans in traces.items():
+        spans.sort(key=lambda sp: sp["start"])
+        root = next((sp for sp in spans if sp["parent_id"] is None), spans[0])
+        end = max(sp["start"] + sp["duration_ms"] / 1000 for sp in spans)
+        result.append({
+            "trace_id": trace_id,
+            "name": root["name"],
+            "session_id": root["attributes"].get("session_id"),
+            "complete": root["parent_id"] is None and root["kind"] == "run",
+            "start": spans[0]["start"],
+            "duration_ms": round((end - spans[0]["start"]) * 1000, 3),
+            "spans": spans,
+        })
+    result.sort(key=lambda t: t["start"])
+    return json.dumps({"traces": result}, ensure_ascii=False).encode("utf-8")
+
+@app.route("/api/trace")
+def api_trace():
+    if not os.path.isfile(TRACE_PATH):
+        return jsonify({"traces": []})
+    try:
+        cached = response_cache.get(("trace", TRACE_PATH), file_validator(TRACE_PATH), lambda: build_trace_body(TRACE_PATH))
+    except Exception:
+        return jsonify({"error": "Could not load trace"}), 500
+    return cached_response(cached)
+
+# Prometheus text format, written by the pipeline at the end of each run
+@app.route("/metrics")
+def metrics():
+    if not os.path.isfile(METRICS_PATH):
+        return Response("", mimetype="text/plain; version=0.0.4")
+    with open(METRICS_PATH, "r", encoding="utf-8") as fh:
+        return Response(fh.read(), mimetype="text/plain; version=0.0.4")
+
+def json_file_mtimes(path):
+    mtimes = {}
+    for f in list_json_files(path):
+        try:
+            mtimes[f] = os.stat(os.path.join(path, f)).st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+def sse_message(event, data, event_id=None):
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {data}\n\n"
+
+# Server-Sent Events: "pipeline" (one per line of the event log; the id is the byte offset, so a
+# reconnect resumes where it stopped), "reset" (a new run started the log over), "files" (the
+# output listing changed) and "output" (an output file was rewritten)
+@app.route("/api/events")
+def api_events():
+    try:
+        start = int(request.headers.get("Last-Event-ID", "0"))
+    except ValueError:
+        start = 0
+
+    if not event_stream_slots.acquire(blocking=False):
+        resp = jsonify({"error": f"Too many live event streams (limit {MAX_EVENT_STREAMS})"})
+        resp.status_code = 503
+        resp.headers["Retry-After"] = "10"
+        return resp
+
+    def stream():
+        offset = start
+        seen = None
+        last_sent = time.monotonic()
+        yield "retry: 2000\n\n"
+        while True:
+            messages = []
+            try:
+                size = os.path.getsize(EVENTS_PATH)
+            except OSError:
+                size = 0
+            if size < offset:
+                offset = 0
+                messages.append(sse_message("reset", "{}"))
+            if size > offset:
+                with open(EVENTS_PATH, "rb") as fh:
+                    fh.seek(offset)
+                    chunk = fh.read(size - offset)
+                # Only complete lines; a partly written one is picked up on the next poll
+                for line in chunk[:chunk.rfind(b"\n") + 1].split(b"\n")[:-1]:
+                    offset += len(line) + 1
+                    if line.strip():
+                        messages.append(sse_message("pipeline", line.decode("utf-8", "replace"), offset))
+
+            current = json_file_mtimes(OUTPUT_DIR)
+            if seen is None or current.keys() != seen.keys():
+                messages.append(sse_message("files", json.dumps({"files": sorted(current)})))
+            if seen is not None:
+                for name, mtime in current.items():
+                    if name in seen and seen[name] != mtime:
+                        messages.append(sse_message("output", json.dumps({"file": name})))
+            seen = current
+
+            if messages:
+                last_sent = time.monotonic()
+                yield "".join(messages)
+            elif time.monotonic() - last_sent > EVENTS_KEEPALIVE_SECONDS:
+                last_sent = time.monotonic()
+                yield ": keepalive\n\n"
+            time.sleep(EVENTS_POLL_SECONDS)
+
+    resp = Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    # Runs when the server closes the response (client gone), also if the stream never started
+    resp.call_on_close(event_stream_slots.release)
+    return resp
 
 @app.route("/download/<path:filename>")
 def download_file(filename):
     candidate = os.path.abspath(os.path.join(OUTPUT_DIR, filename))
     if not is_safe_path(OUTPUT_DIR, candidate) or not os.path.isfile(candidate):
         return abort(404)
-    return send_file(candidate, as_attachment=True)
+
+    # JSON holding artifact references is downloaded with the content inlined, encoded as it is sent.
+    # Whether a file has references comes from its (shared) /api/json cache entry, so a file already
+    # viewed is not read again and one without references goes straight to send_file
+    if candidate.lower().endswith(".json"):
+        try:
+            has_refs = cached_json(candidate).has_refs
+        except Exception:
+            has_refs = False
+        if has_refs:
+            data = load_json_safe(candidate)
+            if data is None:
+                return jsonify({"error": "Could not load file"}), 500
+            return Response(
+                stream_json(data),
+                mimetype="application/json",
+                headers={"Content-Disposition": f"attachment; filename={os.path.basename(candidate)}"},
+            )
+    # Streamed from disk in blocks by the server's file wrapper; conditional enables ETag/Range (resumable downloads)
+    return send_file(candidate, as_attachment=True, conditional=True, max_age=0)
+
+def stream_json(data):
+    pending, size = [], 0
+    for piece in json.JSONEncoder(ensure_ascii=False, indent=2).iterencode(data):
+        pending.append(piece)
+        size += len(piece)
+        if size >= DOWNLOAD_CHUNK_BYTES:
+            yield "".join(pending).encode("utf-8")
+            pending, size = [], 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
+
+def set_event_stream_limit(limit):
+    global MAX_EVENT_STREAMS, event_stream_slots
+    MAX_EVENT_STREAMS = max(1, limit)
+    event_stream_slots = threading.BoundedSemaphore(MAX_EVENT_STREAMS)
+
+# Production: waitress when installed, otherwise werkzeug's threaded server; debug is off either way
+def serve(host=HOST, port=PORT, threads=THREADS):
+    # Keep the default event stream cap at half of the pool actually used
+    if not os.getenv("DASHBOARD_MAX_EVENT_STREAMS") and threads != THREADS:
+        set_event_stream_limit(threads // 2)
+
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        waitress_serve = None
+
+    if waitress_serve is not None:
+        print(f"Serving dashboard with waitress ({threads} threads) at http://{host}:{port} — outputs dir: {OUTPUT_DIR}")
+        waitress_serve(app, host=host, port=port, threads=threads)
+        return
+
+    from werkzeug.serving import make_server
+    print(f"Serving dashboard (threaded) at http://{host}:{port} — outputs dir: {OUTPUT_DIR}")
+    make_server(host, port, app, threaded=True).serve_forever()
 
 if __name__ == "__main__":
-    print(f"Serving dashboard — outputs dir: {OUTPUT_DIR}")
-    app.run(debug=True, use_reloader=False)
+    parser = argparse.ArgumentParser(description="Outputs dashboard")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--threads", type=int, default=THREADS, help="Worker threads (production mode)")
+    parser.add_argument("--dev", action="store_true", help="Flask development server with debug on")
+    args = parser.parse_args()
+
+    if args.dev or os.getenv("DASHBOARD_MODE") == "dev":
+        print(f"Serving dashboard (development) — outputs dir: {OUTPUT_DIR}")
+        app.run(host=args.host, port=args.port, debug=True, use_reloader=False)
+    else:
+        serve(args.host, args.port, args.threads)
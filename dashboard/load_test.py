@@ -0,0 +1,143 @@
+"""
+Load test for the dashboard API.
+
+Runs concurrent keep-alive clients against /api/list and /api/json/<file>
+(every listed output file, or --files) for a fixed duration and reports
+requests per second and latency percentiles per route.
+
+    python dashboard/dashboard_server.py &
+    python dashboard/load_test.py --concurrency 16 --duration 10
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def fetch(conn, path, headers):
+    conn.request("GET", path, headers=headers)
+    resp = conn.getresponse()
+    body = resp.read()
+    return resp.status, body
+
+
+def worker(base, paths, headers, deadline, offset, results, lock):
+    conn = http.client.HTTPConnection(base.hostname, base.port or 80, timeout=30)
+    local = {path: [] for path in paths}
+    errors = {path: 0 for path in paths}
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            status, _ = fetch(conn, path, headers)
+            if status not in (200, 304):
+                errors[path] += 1
+                continue
+        except (OSError, http.client.HTTPException):
+            errors[path] += 1
+            conn.close()
+            conn = http.client.HTTPConnection(base.hostname, base.port or 80, timeout=30)
+            continue
+        local[path].append(time.perf_counter() - start)
+    conn.close()
+
+    with lock:
+        for path in paths:
+            results[path]["latencies"].extend(local[path])
+            results[path]["errors"] += errors[path]
+
+
+def route_name(path):
+    return "/api/json" if path.startswith("/api/json/") else path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard API load test")
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    parser.add_argument("--files", nargs="*", help="Output files for /api/json (default: every listed file)")
+    parser.add_argument("--gzip", action="store_true", help="Send Accept-Encoding: gzip")
+    parser.add_argument("--revalidate", action="store_true", help="Send If-None-Match with each file's ETag (304 path)")
+    parser.add_argument("--out", default=None, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    base = urlsplit(args.url)
+    conn = http.client.HTTPConnection(base.hostname, base.port or 80, timeout=30)
+    status, body = fetch(conn, "/api/list", {})
+    if status != 200:
+        raise SystemExit(f"/api/list returned {status}")
+    files = args.files or json.loads(body)["files"]
+    paths = ["/api/list"] + [f"/api/json/{f}" for f in files]
+
+    headers = {"Accept-Encoding": "gzip"} if args.gzip else {}
+    if args.revalidate:
+        # One ETag per path is not expressible in shared headers; list all of them (If-None-Match accepts a list)
+        etags = []
+        for path in paths:
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            resp.read()
+            if resp.getheader("ETag"):
+                etags.append(resp.getheader("ETag"))
+        headers["If-None-Match"] = ", ".join(etags)
+    conn.close()
+
+    results = {path: {"latencies": [], "errors": 0} for path in paths}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=worker, args=(base, paths, headers, deadline, n, results, lock))
+        for n in range(args.concurrency)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    # Aggregate per route: /api/json covers every file
+    routes = {}
+    for path, r in results.items():
+        route = routes.setdefault(route_name(path), {"latencies": [], "errors": 0})
+        route["latencies"].extend(r["latencies"])
+        route["errors"] += r["errors"]
+    routes["all"] = {
+        "latencies": [x for r in results.values() for x in r["latencies"]],
+        "errors": sum(r["errors"] for r in results.values()),
+    }
+
+    report = {"url": args.url, "concurrency": args.concurrency, "duration_s": round(elapsed, 2), "files": files, "routes": {}}
+    print(f"{'route':<12} {'requests':>9} {'errors':>7} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, r in routes.items():
+        lat = sorted(r["latencies"])
+        row = {
+            "requests": len(lat),
+            "errors": r["errors"],
+            "rps": round(len(lat) / elapsed, 1),
+            "p50_ms": round(percentile(lat, 50) * 1000, 2),
+            "p95_ms": round(percentile(lat, 95) * 1000, 2),
+            "p99_ms": round(percentile(lat, 99) * 1000, 2),
+        }
+        report["routes"][name] = row
+        print(f"{name:<12} {row['requests']:>9} {row['errors']:>7} {row['rps']:>9} {row['p50_ms']:>8} {row['p95_ms']:>8} {row['p99_ms']:>8}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
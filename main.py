@@ -4,10 +4,34 @@ import os
 import sys
 import time
 import subprocess
+import urllib.request
 from rich import print
+from config import Config
 from orchestrator import PodcastOrchestrator
+from pipeline.batch import discover_episodes, run_batch
 
 
+DASHBOARD_URL = "http://127.0.0.1:5000"
+DASHBOARD_STARTUP_TIMEOUT = 15
+
+
+# Poll until the server answers (True), the process exits or the timeout passes (False)
+def wait_for_dashboard(process, timeout=DASHBOARD_STARTUP_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(f"{DASHBOARD_URL}/healthz", timeout=1) as resp:
+                if resp.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
 # Dashboard
 def launch_dashboard():
     dashboard_script = os.path.join("dashboard", "dashboard_server.py")
@@ -16,22 +40,26 @@ def launch_dashboard():
         print(f"[red]❌ Dashboard server not found at: {dashboard_script}[/red]")
         return None
 
-    print("\n[cyan]🌐 Launching Dashboard at http://127.0.0.1:5000 ...[/cyan]\n")
+    print(f"\n[cyan]🌐 Launching Dashboard at {DASHBOARD_URL} ...[/cyan]\n")
 
     try:
-        process = subprocess.Popen([sys.executable, dashboard_script], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Output goes to a file: an undrained pipe would block the server once its buffer filled up
+        log_path = os.path.join(Config.OUTPUT_DIR, "dashboard.log")
+        log = open(log_path, "wb")
+        process = subprocess.Popen([sys.executable, dashboard_script], stdout=log, stderr=subprocess.STDOUT)
+        log.close()
         
-        # Give dashboard a moment
-        time.sleep(2)
-        
-        # Check if Process already exited
-        if process.poll() is not None:
-            _, stderr = process.communicate()
-            print(f"[red]❌ Dashboard crashed on startup: {stderr.decode()}[/red]")
-            return None
-        else:
+        # Wait until it answers rather than a fixed delay
+        if wait_for_dashboard(process):
             print("[green]✓ Dashboard server started successfully![/green]")
             return process
+
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        with open(log_path, "r", encoding="utf-8", errors="replace") as fh:
+            print(f"[red]❌ Dashboard crashed on startup: {fh.read()[-2000:]}[/red]")
+        return None
             
     except Exception as e:
         print(f"[red]❌ Failed to launch Dashboard: {e}[/red]")
@@ -52,14 +80,20 @@ Examples:
   
   # Auto-detect from directories
   python main.py --topic "AI in Healthcare"
+
+  # Watch stages and outputs live in the dashboard while the pipeline runs
+  python main.py --topic "AI in Healthcare" --dashboard
+
+  # Batch: every episode in podcast_recordings/ and test_data/ (topic from filename)
+  python main.py --batch --max-episodes 4 --max-model-calls 8
         """
     )
 
     parser.add_argument(
         "--topic",
         type=str,
-        required=True,
-        help="Topic or title of the podcast episode",
+        default=None,
+        help="Topic or title of the podcast episode (required unless --batch)",
     )
 
     parser.add_argument(
@@ -76,7 +110,48 @@ Examples:
         help="Path to transcript text file (.txt)"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Process every episode in podcast_recordings/ and test_data/ in one run"
+    )
+
+    parser.add_argument(
+        "--max-episodes",
+        type=int,
+        default=None,
+        help="Batch mode: episodes processed at the same time (default: BATCH_MAX_EPISODES)"
+    )
+
+    parser.add_argument(
+        "--max-model-calls",
+        type=int,
+        default=None,
+        help="Batch mode: global cap on concurrent model calls (default: MAX_CONCURRENT_MODEL_CALLS)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the agent result cache and always call the model"
+    )
+
+    parser.add_argument(
+        "--dashboard",
+        action="store_true",
+        help="Start the dashboard before the pipeline and watch progress live"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the last checkpoint: skip finished stages, rerun failed or missing assets"
+    )
+
+    args = parser.parse_args()
+    if not args.batch and not args.topic:
+        parser.error("--topic is required unless --batch is given")
+    return args
 
 # File Detection
 def detect_inputs(args):
@@ -144,12 +219,68 @@ def detect_inputs(args):
     sys.exit(1)
 
 
+# Batch Mode
+def run_batch_mode(args):
+    episodes = discover_episodes(topic=args.topic)
+    if not episodes:
+        print(
+            "[red]❌ No podcast audio or transcripts found for batch mode.[/red]\n"
+            "[yellow]Add audio files to podcast_recordings/ or transcripts to test_data/[/yellow]"
+        )
+        sys.exit(1)
+
+    print(f"\n[bold cyan]📦 Batch:[/bold cyan] {len(episodes)} episode(s)")
+
+    try:
+        summary = asyncio.run(
+            run_batch(
+                episodes,
+                max_episodes=args.max_episodes,
+                max_model_calls=args.max_model_calls,
+                use_cache=not args.no_cache,
+                resume=args.resume,
+            )
+        )
+    except KeyboardInterrupt:
+        print("\n[yellow]⚠️  Batch interrupted by user[/yellow]")
+        sys.exit(0)
+
+    if summary.failed:
+        sys.exit(1)
+
+
+# Keep the dashboard in the foreground until Ctrl+C
+def serve_dashboard(dashboard_process):
+    print(f"\n[bold cyan]📌 Dashboard is running at {DASHBOARD_URL}[/bold cyan]")
+    print("[cyan]Visit dashboard to view your post podcast assets[/cyan]")
+    print("[yellow]Press Ctrl+C to stop the dashboard and exit[/yellow]\n")
+    
+    try:
+        # Keep running until user stops it
+        dashboard_process.wait()
+    except KeyboardInterrupt:
+        stop_dashboard(dashboard_process)
+        print("[green]✓ Dashboard stopped. Goodbye![/green]")
+
+def stop_dashboard(dashboard_process):
+    print("\n[yellow]⚠️  Stopping dashboard...[/yellow]")
+    dashboard_process.terminate()
+    
+    # Try graceful shutdown (5s)
+    try:
+        dashboard_process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        # kill if it doesn't stop gracefully
+        dashboard_process.kill()
+        dashboard_process.wait()
+
+
 def main():
     """
     Main Workflow:
       1. Parse command-line arguments
       2. Detect & validate input audio or transcript
-      3. Run orchestrator
+      3. Run orchestrator (with --dashboard, the dashboard is started first and shows progress live)
       4. Optionally launch dashboard for viewing output content bundle
     """
     print("[bold blue]🎙️ Post-Podcast Lifecycle Automator (Powered by Gemini / ADK)[/bold blue]")
@@ -157,11 +288,15 @@ def main():
     # Parse arguments
     args = parse_args()
 
+    if args.batch:
+        run_batch_mode(args)
+        return
+
     # Detect and validate inputs (audio or transcript)
     audio_path, transcript_path = detect_inputs(args)
 
     # Initialize the orchestrator
-    orchestrator = PodcastOrchestrator()
+    orchestrator = PodcastOrchestrator(use_cache=not args.no_cache)
 
     # Display configuration
     print(f"\n[bold cyan]📌 Topic:[/bold cyan] {args.topic}")
@@ -170,6 +305,9 @@ def main():
     if transcript_path:
         print(f"[cyan]📄 Using podcast transcript file:[/cyan] {transcript_path}")
 
+    # Live view: the dashboard streams stage and agent events while the pipeline runs
+    dashboard_process = launch_dashboard() if args.dashboard else None
+
     # Run the multi-agent pipeline
     try:
         asyncio.run(
@@ -177,14 +315,24 @@ def main():
                 topic=args.topic,
                 audio_path=audio_path,
                 transcript_path=transcript_path,
+                resume=args.resume,
             )
         )
     except KeyboardInterrupt:
         print("\n[yellow]⚠️  Pipeline interrupted by user[/yellow]")
+        if dashboard_process:
+            stop_dashboard(dashboard_process)
         sys.exit(0)
     except Exception as e:
         print(f"\n[red]❌ Pipeline failed: {e}[/red]")
+        if dashboard_process:
+            # Leave the dashboard up so the failed stages can be inspected
+            serve_dashboard(dashboard_process)
         sys.exit(1)
+
+    if dashboard_process:
+        serve_dashboard(dashboard_process)
+        return
     
     # Ask user to launch dashboard
     print("\n" + "="*60)
@@ -194,26 +342,7 @@ def main():
         dashboard_process = launch_dashboard()
         
         if dashboard_process:
-            print("\n[bold cyan]📌 Dashboard is running at http://127.0.0.1:5000[/bold cyan]")
-            print("[cyan]Visit dashboard to view your post podcast assets[/cyan]")
-            print("[yellow]Press Ctrl+C to stop the dashboard and exit[/yellow]\n")
-            
-            try:
-                # Keep running until user stops it
-                dashboard_process.wait()
-            except KeyboardInterrupt:
-                print("\n[yellow]⚠️  Stopping dashboard...[/yellow]")
-                dashboard_process.terminate()
-                
-                # Try graceful shutdown (5s)
-                try:
-                    dashboard_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    # kill if it doesn't stop gracefully
-                    dashboard_process.kill()
-                    dashboard_process.wait()
-                
-                print("[green]✓ Dashboard stopped. Goodbye![/green]")
+            serve_dashboard(dashboard_process)
         else:
             print("\n[red]Failed to start dashboard. Check the error above.[/red]")
     else:
@@ -0,0 +1,129 @@
+from typing import Any, Dict, Optional
+import hashlib
+import gzip
+import json
+import sys
+import os
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARTIFACT_KEY = "$artifact"
+
+_EXTENSIONS = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+
+def resolve_compression(name: str) -> str:
+    """
+    'auto' is gzip, which every reader can decompress. zstd is opt-in: it needs the
+    zstandard package (not in requirements.txt) wherever the artifacts are read.
+    """
+    name = (name or "auto").lower()
+    if name == "auto":
+        return "gzip"
+    if name == "zstd" and zstandard is None:
+        return "gzip"
+    if name not in _EXTENSIONS:
+        raise ValueError(f"Unknown artifact compression: {name}")
+    return name
+
+
+class ArtifactStore:
+    """
+    Content-addressed blob store for large values (transcripts).
+
+    A blob is stored once under its SHA-256 (of the uncompressed text) and files
+    that need it hold a small reference instead:
+        {"$artifact": "<sha256>", "encoding": "gzip", "bytes": 1234567}
+    Storing the same content again is a no-op. Blobs are written to a temp file
+    and renamed, so a reference never points at a partial blob.
+    """
+
+    def __init__(self, directory: str, compression: str = "auto"):
+        self.directory = directory
+        self.compression = resolve_compression(compression)
+        self._cache: Dict[str, str] = {}
+
+    @staticmethod
+    def is_ref(value: Any) -> bool:
+        return isinstance(value, dict) and ARTIFACT_KEY in value
+
+    def _path(self, sha: str, encoding: str) -> str:
+        return os.path.join(self.directory, sha[:2], f"{sha}.txt{_EXTENSIONS[encoding]}")
+
+    @staticmethod
+    def _compress(payload: bytes, encoding: str) -> bytes:
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(payload)
+        if encoding == "gzip":
+            return gzip.compress(payload, compresslevel=5)
+        return payload
+
+    @staticmethod
+    def _decompress(payload: bytes, encoding: str) -> bytes:
+        if encoding == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Artifact is zstd-compressed but the zstandard package is not installed.")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        if encoding == "gzip":
+            return gzip.decompress(payload)
+        return payload
+
+    def put_text(self, text: str) -> Dict[str, Any]:
+        payload = text.encode("utf-8")
+        sha = hashlib.sha256(payload).hexdigest()
+        ref = {ARTIFACT_KEY: sha, "encoding": self.compression, "bytes": len(payload)}
+
+        path = self._path(sha, self.compression)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(self._compress(payload, self.compression))
+            os.replace(tmp_path, path)
+
+        self._cache[sha] = text
+        return ref
+
+    def get_text(self, ref: Dict[str, Any]) -> str:
+        sha = ref[ARTIFACT_KEY]
+        text = self._cache.get(sha)
+        if text is None:
+            encoding = ref.get("encoding", "none")
+            with open(self._path(sha, encoding), "rb") as fh:
+                text = self._decompress(fh.read(), encoding).decode("utf-8")
+            self._cache[sha] = text
+        return text
+
+    def resolve(self, value: Any) -> Any:
+        """Copy of `value` with every artifact reference replaced by its content."""
+        if self.is_ref(value):
+            return self.get_text(value)
+        if isinstance(value, dict):
+            return {k: self.resolve(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        return value
+
+
+def load_resolved(path: str, artifacts_dir: Optional[str] = None) -> Any:
+    """Load a JSON output file with artifact references inlined (artifacts_dir defaults to <outputs>/artifacts)."""
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    if artifacts_dir is None:
+        folder = os.path.dirname(os.path.abspath(path))
+        if os.path.basename(folder) == "agents_rawdata":
+            folder = os.path.dirname(folder)
+        artifacts_dir = os.path.join(folder, "artifacts")
+    return ArtifactStore(artifacts_dir).resolve(data)
+
+
+if __name__ == "__main__":
+    # python -m memory.artifact_store outputs/transcription.json
+    if len(sys.argv) != 2:
+        print("usage: python -m memory.artifact_store <output.json>")
+        sys.exit(2)
+    json.dump(load_resolved(sys.argv[1]), sys.stdout, ensure_ascii=False, indent=2)
+    print()
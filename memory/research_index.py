@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import threading
+import math
+import json
+import time
+import re
+import os
+
+_WORD_RE = re.compile(r"\w+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in into is it its of on or the this to vs what when where which who why with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [w for w in _WORD_RE.findall((text or "").lower()) if w not in STOPWORDS]
+
+
+@dataclass
+class ResearchMatch:
+    topic: str
+    research: Dict[str, Any]
+    score: float
+    age_seconds: float
+
+
+class ResearchIndex:
+    """
+    Persistent store of validated research results with TF-IDF topic lookup.
+
+    Each entry keeps the topic, its research output and when it was made. lookup()
+    scores a new topic against every stored topic by cosine similarity of TF-IDF
+    vectors (IDF over the stored topics), so rephrasings of a recurring subject
+    match while unrelated topics sharing one common word do not. The index is a
+    single JSON file written atomically; the oldest entries are dropped beyond
+    `max_entries`.
+
+    add() only updates memory; flush() writes the file when something changed,
+    so the adds of a run (or of concurrent batch episodes) share one write.
+    flush() blocks on disk I/O, so async callers run it in a thread.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Orders writes, so an older snapshot never replaces a newer one on disk
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self.saves = 0
+        self.entries: List[Dict[str, Any]] = self._load()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh).get("entries", [])
+        except (OSError, ValueError):
+            return []
+
+    def flush(self) -> bool:
+        """Write the index if it changed since the last write; returns whether it wrote."""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False
+                # Entries are never mutated in place, so a copy of the list is a consistent snapshot
+                entries = list(self.entries)
+                self._dirty = False
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as fh:
+                    json.dump({"entries": entries}, fh, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                with self._lock:
+                    self._dirty = True
+                raise
+            self.saves += 1
+            return True
+
+    def _idf(self) -> Dict[str, float]:
+        df: Dict[str, int] = {}
+        for entry in self.entries:
+            for term in set(entry["terms"]):
+                df[term] = df.get(term, 0) + 1
+        n = len(self.entries)
+        return {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+
+    @staticmethod
+    def _vector(terms: List[str], idf: Dict[str, float], default_idf: float) -> Dict[str, float]:
+        tf: Dict[str, int] = {}
+        for term in terms:
+            tf[term] = tf.get(term, 0) + 1
+        vec = {term: count * idf.get(term, default_idf) for term, count in tf.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        return {term: v / norm for term, v in vec.items()}
+
+    def lookup(self, topic: str, max_age_seconds: Optional[float] = None) -> Optional[ResearchMatch]:
+        """Most similar stored topic no older than max_age_seconds, or None."""
+        terms = tokenize(topic)
+        if not terms:
+            return None
+
+        now = time.time()
+        with self._lock:
+            candidates = [e for e in self.entries if not max_age_seconds or now - e["created"] <= max_age_seconds]
+            if not candidates:
+                return None
+
+            idf = self._idf()
+            default_idf = math.log(1 + len(self.entries)) + 1
+            query = self._vector(terms, idf, default_idf)
+
+            best, best_score = None, 0.0
+            for entry in candidates:
+                vec = self._vector(entry["terms"], idf, default_idf)
+                score = sum(w * vec.get(term, 0.0) for term, w in query.items())
+                # Ties go to the newer result
+                if score > best_score or (best is not None and score == best_score and entry["created"] > best["created"]):
+                    best, best_score = entry, score
+
+        if best is None:
+            return None
+        return ResearchMatch(topic=best["topic"], research=best["research"], score=round(best_score, 4), age_seconds=now - best["created"])
+
+    def add(self, topic: str, research: Dict[str, Any]):
+        with self._lock:
+            # Latest result for a topic replaces the previous one
+            self.entries = [e for e in self.entries if e["topic"] != topic]
+            self.entries.append({"topic": topic, "terms": tokenize(topic), "created": time.time(), "research": research})
+            if len(self.entries) > self.max_entries:
+                self.entries.sort(key=lambda e: e["created"])
+                self.entries = self.entries[-self.max_entries:]
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+_default_index: Optional[ResearchIndex] = None
+
+
+def get_research_index(path: str, max_entries: int = 1000) -> ResearchIndex:
+    """Process-wide index for `path`, so batch episodes see each other's research."""
+    global _default_index
+    if _default_index is None or _default_index.path != path:
+        _default_index = ResearchIndex(path, max_entries=max_entries)
+    return _default_index
@@ -0,0 +1,156 @@
+from typing import Any, List, Optional, Tuple
+import threading
+import hashlib
+import json
+import time
+import os
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache: one JSON file per key under `directory`.
+    Entries expire after `max_age_seconds`; when the cache grows past
+    `max_entries` or `max_bytes` the least recently used entries are removed.
+
+    Entry count and size are tracked in memory (the directory is scanned once,
+    on the first put), so a put only scans and sorts the directory when a limit
+    is crossed. Methods do blocking file I/O; async callers run them in a thread.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 500, max_bytes: int = 200 * 1024 * 1024, max_age_seconds: Optional[float] = None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self._count: Optional[int] = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _expired(self, created: float) -> bool:
+        return bool(self.max_age_seconds) and time.time() - created > self.max_age_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if self._expired(entry.get("created", 0)):
+            self._forget(path)
+            self.misses += 1
+            return None
+
+        # Touch for LRU eviction
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return entry.get("value")
+
+    def put(self, key: str, value: Any):
+        path = self._path(key)
+        payload = json.dumps({"created": time.time(), "value": value}, ensure_ascii=False).encode("utf-8")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(payload)
+        with self._lock:
+            if self._count is None:
+                self._rescan()
+            try:
+                replaced = os.stat(path).st_size
+            except OSError:
+                replaced = None
+            os.replace(tmp_path, path)
+            if replaced is None:
+                self._count += 1
+            self._bytes += len(payload) - (replaced or 0)
+            over = self._count > self.max_entries or self._bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_mtime, st.st_size))
+        return entries
+
+    def _remove(self, path: str) -> int:
+        """Delete an entry file; returns its size, or -1 if it was already gone."""
+        try:
+            size = os.stat(path).st_size
+            os.remove(path)
+            return size
+        except OSError:
+            return -1
+
+    def _forget(self, path: str):
+        with self._lock:
+            size = self._remove(path)
+            if size >= 0 and self._count is not None:
+                self._count -= 1
+                self._bytes -= size
+
+    def _rescan(self):
+        entries = self._entries()
+        self._count = len(entries)
+        self._bytes = sum(e[2] for e in entries)
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until within limits."""
+        with self._lock:
+            return self._evict()
+
+    def _evict(self) -> int:
+        removed = 0
+        entries = []
+        now = time.time()
+        for path, mtime, size in self._entries():
+            # mtime is refreshed on reads, so age is checked against it only as a cheap pre-filter
+            if self.max_age_seconds and now - mtime > self.max_age_seconds:
+                self._remove(path)
+                removed += 1
+            else:
+                entries.append((path, mtime, size))
+
+        entries.sort(key=lambda e: e[1])
+        total = sum(e[2] for e in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            path, _, size = entries.pop(0)
+            self._remove(path)
+            total -= size
+            removed += 1
+        self._count, self._bytes = len(entries), total
+        return removed
+
+    def clear(self):
+        with self._lock:
+            for path, _, _ in self._entries():
+                self._remove(path)
+            self._count, self._bytes = 0, 0
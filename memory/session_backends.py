@@ -0,0 +1,275 @@
+from typing import Dict, List, Optional, Tuple
+import threading
+import sqlite3
+import atexit
+import queue
+import time
+import os
+
+
+class SessionBackend:
+    """
+    Storage behind SessionStore. Values are passed as JSON text; every call
+    touches one key or one history entry, so stores persist incrementally.
+    `durable` backends survive a restart and can serve as the resume checkpoint.
+    """
+
+    durable = False
+
+    def keys(self, session_id: str) -> List[str]:
+        raise NotImplementedError
+
+    def get(self, session_id: str, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, session_id: str, key: str, value: str):
+        raise NotImplementedError
+
+    def append_history(self, session_id: str, entry: Dict[str, str], limit: int):
+        raise NotImplementedError
+
+    def history(self, session_id: str, limit: int) -> List[Dict[str, str]]:
+        raise NotImplementedError
+
+    def delete_session(self, session_id: str):
+        raise NotImplementedError
+
+    def sessions(self) -> List[str]:
+        raise NotImplementedError
+
+
+class MemoryBackend(SessionBackend):
+    """Process-local backend; sessions outlive a SessionStore object but not the process."""
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, str]] = {}
+        self._history: Dict[str, List[Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def keys(self, session_id: str) -> List[str]:
+        return list(self._data.get(session_id, {}))
+
+    def get(self, session_id: str, key: str) -> Optional[str]:
+        return self._data.get(session_id, {}).get(key)
+
+    def set(self, session_id: str, key: str, value: str):
+        with self._lock:
+            self._data.setdefault(session_id, {})[key] = value
+
+    def append_history(self, session_id: str, entry: Dict[str, str], limit: int):
+        with self._lock:
+            entries = self._history.setdefault(session_id, [])
+            entries.append(entry)
+            del entries[:-limit]
+
+    def history(self, session_id: str, limit: int) -> List[Dict[str, str]]:
+        return list(self._history.get(session_id, [])[-limit:])
+
+    def delete_session(self, session_id: str):
+        with self._lock:
+            self._data.pop(session_id, None)
+            self._history.pop(session_id, None)
+
+    def sessions(self) -> List[str]:
+        return sorted(set(self._data) | set(self._history))
+
+
+class SQLiteBackend(SessionBackend):
+    """
+    SQLite backend in WAL mode: readers (the dashboard, other workers) never
+    block the writer, and each set()/append_history() touches one row instead
+    of rewriting the whole snapshot. Many sessions share one file, keyed by
+    session_id; history is trimmed to the newest `limit` rows per session.
+
+    Writes are queued and applied by a writer thread, which commits everything
+    queued so far in one transaction, so callers on the event loop never wait
+    for a commit and a burst of checkpoints costs one fsync. A read first waits
+    for the queued writes of its own session only (read-your-writes), not for
+    other sessions' writes; flush() waits for all of them, and close() (also
+    run at exit) drains the queue.
+    """
+
+    durable = True
+
+    def __init__(self, path: str, timeout: float = 10.0):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS session_data (
+                session_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (session_id, key)
+            );
+            CREATE TABLE IF NOT EXISTS session_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                preview TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_history_session ON session_history (session_id, id);
+            """
+        )
+        self.commits = 0
+        self.writes = 0
+        self.write_error: Optional[Exception] = None
+        self._closed = False
+        # Each item is one write: (session_id, the statements to run together), or None to stop the writer
+        self._queue: "queue.Queue[Optional[Tuple[str, List[Tuple[str, tuple]]]]]" = queue.Queue()
+        # Queued, not yet committed writes per session
+        self._pending: Dict[str, int] = {}
+        self._pending_cond = threading.Condition()
+        self._writer = threading.Thread(target=self._write_loop, name="session-db-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _apply(self, writes: List[Tuple[str, List[Tuple[str, tuple]]]]):
+        self._conn.execute("BEGIN")
+        try:
+            for _, statements in writes:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self.commits += 1
+
+    def _write_loop(self):
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes = [item for item in items if item is not None]
+            try:
+                with self._lock:
+                    if writes:
+                        try:
+                            self._apply(writes)
+                        except Exception:
+                            # One bad write must not take the rest of the batch down with it
+                            for write in writes:
+                                try:
+                                    self._apply([write])
+                                except Exception as e:
+                                    self.write_error = e
+                    self.writes += len(writes)
+            finally:
+                with self._pending_cond:
+                    for session_id, _ in writes:
+                        self._pending[session_id] -= 1
+                        if not self._pending[session_id]:
+                            del self._pending[session_id]
+                    self._pending_cond.notify_all()
+                for _ in items:
+                    self._queue.task_done()
+            if len(writes) < len(items):
+                return
+
+    def _submit(self, session_id: str, statements: List[Tuple[str, tuple]]):
+        if self._closed:
+            raise RuntimeError("Session backend is closed.")
+        with self._pending_cond:
+            self._pending[session_id] = self._pending.get(session_id, 0) + 1
+        self._queue.put((session_id, statements))
+
+    def flush(self):
+        """Wait until every queued write is committed; raises the last write error, if any."""
+        self._queue.join()
+        error, self.write_error = self.write_error, None
+        if error is not None:
+            raise error
+
+    # Reads of one session wait only for that session's queued writes; session_id=None waits for all
+    def _execute(self, session_id: Optional[str], sql: str, params: tuple = ()) -> List[tuple]:
+        with self._pending_cond:
+            self._pending_cond.wait_for(lambda: not self._pending if session_id is None else session_id not in self._pending)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def keys(self, session_id: str) -> List[str]:
+        return [row[0] for row in self._execute(session_id, "SELECT key FROM session_data WHERE session_id = ?", (session_id,))]
+
+    def get(self, session_id: str, key: str) -> Optional[str]:
+        rows = self._execute(session_id, "SELECT value FROM session_data WHERE session_id = ? AND key = ?", (session_id, key))
+        return rows[0][0] if rows else None
+
+    def set(self, session_id: str, key: str, value: str):
+        self._submit(session_id, [(
+            "INSERT INTO session_data (session_id, key, value, updated) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (session_id, key) DO UPDATE SET value = excluded.value, updated = excluded.updated",
+            (session_id, key, value, time.time()),
+        )])
+
+    def append_history(self, session_id: str, entry: Dict[str, str], limit: int):
+        self._submit(session_id, [
+            (
+                "INSERT INTO session_history (session_id, timestamp, agent, preview) VALUES (?, ?, ?, ?)",
+                (session_id, entry["timestamp"], entry["agent"], entry["preview"]),
+            ),
+            # Ring buffer: keep the newest `limit` rows of this session
+            (
+                "DELETE FROM session_history WHERE session_id = ? AND id NOT IN "
+                "(SELECT id FROM session_history WHERE session_id = ? ORDER BY id DESC LIMIT ?)",
+                (session_id, session_id, limit),
+            ),
+        ])
+
+    def history(self, session_id: str, limit: int) -> List[Dict[str, str]]:
+        rows = self._execute(
+            session_id,
+            "SELECT timestamp, agent, preview FROM session_history WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+            (session_id, limit),
+        )
+        return [{"timestamp": t, "agent": a, "preview": p} for t, a, p in reversed(rows)]
+
+    def delete_session(self, session_id: str):
+        self._submit(session_id, [
+            ("DELETE FROM session_data WHERE session_id = ?", (session_id,)),
+            ("DELETE FROM session_history WHERE session_id = ?", (session_id,)),
+        ])
+
+    def sessions(self) -> List[str]:
+        rows = self._execute(None, "SELECT session_id FROM session_data UNION SELECT session_id FROM session_history ORDER BY 1")
+        return [row[0] for row in rows]
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            self._conn.close()
+
+
+_backends: Dict[str, SessionBackend] = {}
+
+
+def get_session_backend(kind: str, path: Optional[str] = None) -> Optional[SessionBackend]:
+    """Process-wide backend for SESSION_BACKEND: 'memory', 'sqlite' (at `path`), or 'none' for plain in-object state."""
+    kind = (kind or "none").lower()
+    if kind == "none":
+        return None
+    cache_key = f"{kind}:{path}"
+    backend = _backends.get(cache_key)
+    if backend is None:
+        if kind == "memory":
+            backend = MemoryBackend()
+        elif kind == "sqlite":
+            backend = SQLiteBackend(path)
+        else:
+            raise ValueError(f"Unknown session backend: {kind}")
+        _backends[cache_key] = backend
+    return backend
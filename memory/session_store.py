@@ -1,41 +1,132 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set
 from dataclasses import dataclass, field
+from collections import deque
 import json
 import time
 import os
 
+from memory.artifact_store import ArtifactStore
+from memory.session_backends import SessionBackend
+
 @dataclass
 class SessionStore:
     session_id: str
     data: Dict[str, Any] = field(default_factory=dict)
-    history: List[Dict[str, str]] = field(default_factory=list)
+    # Ring buffer: only the newest max_history steps are kept (in memory and in the backend)
+    history: Deque[Dict[str, str]] = field(default_factory=deque)
+    # Large values live in the artifact store; snapshots hold their references
+    artifacts: Optional[ArtifactStore] = field(default=None, repr=False, compare=False)
+    refs: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False, compare=False)
+    # Optional persistent backend (memory.session_backends); every set()/log_step() is written through
+    backend: Optional[SessionBackend] = field(default=None, repr=False, compare=False)
+    max_history: int = 200
+    # Keys present in the backend but not read yet
+    _unloaded: Set[str] = field(default_factory=set, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.history = deque(self.history, maxlen=self.max_history)
+
+    # Attach to a session held by `backend`; values are read on first get(), not here
+    @classmethod
+    def open(cls, session_id: str, backend: SessionBackend, artifacts: Optional[ArtifactStore] = None, max_history: int = 200) -> "SessionStore":
+        store = cls(
+            session_id=session_id,
+            history=backend.history(session_id, max_history),
+            artifacts=artifacts,
+            backend=backend,
+            max_history=max_history,
+        )
+        store._unloaded = set(backend.keys(session_id))
+        return store
+
+    def _load(self, key: str):
+        self._unloaded.discard(key)
+        raw = self.backend.get(self.session_id, key)
+        if raw is not None:
+            self.data[key] = json.loads(raw)
 
-    def set(self, key: str, value: Any):
+    def keys(self) -> List[str]:
+        return sorted(set(self.data) | self._unloaded)
+
+    # ref: artifact reference already holding `value`, written into snapshots (and the backend) in its place
+    def set(self, key: str, value: Any, ref: Optional[Dict[str, Any]] = None):
         self.data[key] = value
+        self._unloaded.discard(key)
+        if ref is not None:
+            self.refs[key] = ref
+        else:
+            self.refs.pop(key, None)
+        if self.backend is not None:
+            stored = ref if ref is not None else value
+            self.backend.set(self.session_id, key, json.dumps(stored, ensure_ascii=False, separators=(",", ":")))
 
+    # Values restored as artifact references are loaded on first access
     def get(self, key: str, default: Optional[Any] = None) -> Any:
-        return self.data.get(key, default)
+        if key in self._unloaded:
+            self._load(key)
+        value = self.data.get(key, default)
+        if ArtifactStore.is_ref(value) and self.artifacts is not None:
+            ref = value
+            value = self.artifacts.get_text(ref)
+            self.data[key] = value
+            self.refs[key] = ref
+        return value
 
     def log_step(self, agent_name: str, output: str):
         ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        self.history.append({
+        entry = {
             "timestamp": ts,
             "agent": agent_name,
             "preview": output[:120] + ("..." if len(output) > 120 else "")
-        })
+        }
+        self.history.append(entry)
+        if self.backend is not None:
+            self.backend.append_history(self.session_id, entry, self.max_history)
 
     def snapshot(self) -> Dict[str, Any]:
+        for key in list(self._unloaded):
+            self._load(key)
         return {
             "session_id": self.session_id,
-            "data": self.data,
-            "history": self.history
+            "data": {k: self.refs.get(k, v) for k, v in self.data.items()},
+            "history": list(self.history)
         }
 
+    # Written to a temp file and renamed so a crash never leaves a half-written checkpoint
     def save_snapshot(self, path: str = "outputs/session_snapshot.json"):
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    # With a backend, the snapshot replaces whatever that backend held for the session
+    @classmethod
+    def load_snapshot(cls, path: str, artifacts: Optional[ArtifactStore] = None, backend: Optional[SessionBackend] = None, max_history: int = 200) -> Optional["SessionStore"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snap = json.load(f)
+        except (OSError, ValueError):
+            return None
+        store = cls(
+            session_id=snap.get("session_id", ""),
+            history=(snap.get("history") or [])[-max_history:],
+            artifacts=artifacts,
+            max_history=max_history,
+        )
+        if backend is not None:
+            store.backend = backend
+            backend.delete_session(store.session_id)
+            for entry in store.history:
+                backend.append_history(store.session_id, entry, max_history)
+        for key, value in (snap.get("data") or {}).items():
+            store.set(key, value)
+        return store
 
     def clear(self):
         self.data.clear()
+        self.refs.clear()
         self.history.clear()
+        self._unloaded.clear()
+        if self.backend is not None:
+            self.backend.delete_session(self.session_id)
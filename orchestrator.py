@@ -1,29 +1,35 @@
 import os
-import re
 import json
+import time
 import asyncio
 import argparse
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from google.adk.sessions import InMemorySessionService
-from google.adk.runners import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
 from google.genai import types
 
 from config import Config
 from memory.session_store import SessionStore
-
-# Calling Agents
-from agents.transcription_agent import build_transcription_agent
-from agents.research_agent import build_research_agent
-from agents.outline_agent import build_outline_agent
-from agents.show_notes_agent import build_show_notes_agent
-from agents.timestamp_agent import build_timestamp_agent
-from agents.quote_agent import build_quote_agent
-from agents.social_agent import build_social_agent
-from agents.seo_agent import build_seo_agent
+from memory.session_backends import get_session_backend
+from memory.artifact_store import ArtifactStore
+from memory.result_cache import ResultCache
+from memory.research_index import ResearchIndex, get_research_index
+from pipeline.json_stream import JsonStreamScanner, extract_first_json
+from pipeline.context import TranscriptContextBuilder, count_tokens
+from pipeline.summarize import MapReduceSummarizer, render_digest, transcript_fingerprint
+from pipeline.output_sink import LoopStallMonitor, default_sink
+from pipeline.events import get_event_bus
+from pipeline.tracing import get_tracer, write_metrics
+from pipeline.dag import Stage, StageGraph, StageSkipped, StageTiming, current_stage, print_stage_timings
+from pipeline.budget import EpisodeBudget, UsageLedger
+from pipeline.rate_limit import AdaptiveRateLimiter, get_rate_limiter, is_rate_limit_error, retry_after_seconds
+
+# Agents are built lazily by the registry, which also keeps one Runner per agent
+from pipeline.registry import APP_NAME, AgentRegistry, get_registry
 
 # Agent Schemas
 try:
@@ -36,13 +42,14 @@ try:
         QuotesOutput,
         SocialOutput,
         SEOOutput,
+        SummaryOutput,
     )
 except Exception as e:
     # Schema validation will be disabled if import fails
     console = Console()
     console.print(f"[yellow]⚠️  Schema validation disabled: {e}[/yellow]")
     TranscriptionOutput = ResearchOutput = OutlineOutput = ShowNotesOutput = None
-    TimestampOutput = QuotesOutput = SocialOutput = SEOOutput = None
+    TimestampOutput = QuotesOutput = SocialOutput = SEOOutput = SummaryOutput = None
 
 console = Console()
 
@@ -50,35 +57,114 @@ console = Console()
 class PodcastOrchestrator:
 
     # Configuration constants
-    TRANSCRIPT_SAMPLE_LENGTH = 15000
+    APP_NAME = APP_NAME
     MAX_RETRIES = 3
-    BACKOFF_BASE = 5
 
     # Initializes directory structure, session and all agents.
-    def __init__(self, session_id: str = "pod_001"):
+    # output_dir defaults to Config.OUTPUT_DIR; batch runs pass one directory per episode.
+    # rate_limiter defaults to the loop-wide AdaptiveRateLimiter shared by every orchestrator.
+    # use_cache=False bypasses the agent result cache and the research index (always call the model).
+    # registry defaults to the process-wide one, so agents and runners are reused across episodes.
+    def __init__(self, session_id: str = "pod_001", output_dir: Optional[str] = None, rate_limiter: Optional[AdaptiveRateLimiter] = None, show_progress: bool = True, use_cache: Optional[bool] = None, registry: Optional[AgentRegistry] = None):
         
         # directory  
-        self.output_dir = Config.OUTPUT_DIR
+        self.output_dir = output_dir or Config.OUTPUT_DIR
         self.raw_dir = os.path.join(self.output_dir, "agents_rawdata")
         
         # Create subdirectory if they don't exist
         os.makedirs(self.raw_dir, exist_ok=True)
 
-        # Session
-        self.store = SessionStore(session_id=session_id)
-        self.session_service = InMemorySessionService()
+        # Session snapshot doubles as the resume checkpoint
+        self.checkpoint_path = os.path.join(self.raw_dir, "session_snapshot.json")
+
+        # Large blobs (the transcript) are stored once; outputs and snapshots reference them
+        self.artifacts = ArtifactStore(os.path.join(self.output_dir, "artifacts"), Config.ARTIFACT_COMPRESSION)
+
+        # Session (state is written through to the SESSION_BACKEND key by key)
+        self.session_backend = get_session_backend(Config.SESSION_BACKEND, Config.SESSION_DB_PATH)
+        self.store = SessionStore(session_id=session_id, artifacts=self.artifacts, backend=self.session_backend, max_history=Config.SESSION_HISTORY_MAX)
+        self.registry = registry or get_registry()
+        self.session_service = self.registry.session_service
         self.session = None
+        self._sessions = []
         self.session_id = session_id
 
-        # Agent Initialization
-        self.transcriber = build_transcription_agent()
-        self.researcher = build_research_agent()
-        self.outliner = build_outline_agent()
-        self.show_notes = build_show_notes_agent()
-        self.timestamp_agent = build_timestamp_agent()
-        self.quote_agent = build_quote_agent()
-        self.social_agent = build_social_agent()
-        self.seo_agent = build_seo_agent()
+        # Concurrency
+        self.rate_limiter = rate_limiter
+        self.show_progress = show_progress
+        self.model_calls = 0
+        self.parse_failures = 0
+        self.stage_timings: List[Dict[str, Any]] = []
+        self.loop_stats: Dict[str, Any] = {}
+
+        # Output files are serialized and written off the event loop, atomically
+        self.sink = default_sink()
+
+        # Stage and agent progress, streamed live by the dashboard
+        self.events = get_event_bus()
+
+        # Spans for the run, every stage, agent call, attempt, backoff and tool call (TRACE_PATH, METRICS_PATH)
+        self.tracer = get_tracer()
+
+        # Tokens and estimated cost per agent, stage and model (saved to usage.json), and the budget they count against
+        self.usage = UsageLedger()
+        self.budget = EpisodeBudget(self.usage)
+        self.usage_path = os.path.join(self.output_dir, "usage.json")
+
+        # SSE streaming lets _run_agent parse JSON while the response is still arriving
+        self.run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+        # Result cache keyed on agent, instruction, model and input context
+        use_cache = Config.CACHE_ENABLED if use_cache is None else use_cache
+        self.cache = ResultCache(
+            Config.CACHE_DIR,
+            max_entries=Config.CACHE_MAX_ENTRIES,
+            max_bytes=Config.CACHE_MAX_BYTES,
+            max_age_seconds=Config.CACHE_MAX_AGE_HOURS * 3600,
+        ) if use_cache else None
+
+        # Earlier research results, shared across episodes and runs
+        self.research_index: Optional[ResearchIndex] = get_research_index(
+            Config.RESEARCH_INDEX_PATH, max_entries=Config.RESEARCH_INDEX_MAX_ENTRIES
+        ) if use_cache else None
+
+    # Agents (built on first access)
+
+    @property
+    def transcriber(self):
+        return self.registry.agent("transcriber")
+
+    @property
+    def researcher(self):
+        return self.registry.agent("researcher")
+
+    @property
+    def outliner(self):
+        return self.registry.agent("outliner")
+
+    @property
+    def show_notes(self):
+        return self.registry.agent("show_notes")
+
+    @property
+    def timestamp_agent(self):
+        return self.registry.agent("timestamp_agent")
+
+    @property
+    def quote_agent(self):
+        return self.registry.agent("quote_agent")
+
+    @property
+    def social_agent(self):
+        return self.registry.agent("social_agent")
+
+    @property
+    def seo_agent(self):
+        return self.registry.agent("seo_agent")
+
+    @property
+    def summarizer(self):
+        return self.registry.agent("summarizer")
 
     # Helper methods
     
@@ -88,123 +174,337 @@ class PodcastOrchestrator:
             user_id = os.environ.get("USER_ID", f"user_{self.session_id}")
             
             # Create session with Google ADK
-            self.session = await self.session_service.create_session(app_name="PodcastAutomator", user_id=user_id)
+            self.session = await self.session_service.create_session(app_name=self.APP_NAME, user_id=user_id)
+            self._sessions.append(self.session)
 
-    # save agent outputs
-    def _write_json(self, path: str, data: Any):
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
+    # Fresh session with no history, for calls that must not read or grow the shared conversation
+    async def _new_session(self):
+        await self._ensure_session()
+        session = await self.session_service.create_session(app_name=self.APP_NAME, user_id=self.session.user_id)
+        self._sessions.append(session)
+        return session
 
-    # save only JSON and avoid functional texts
-    def _extract_first_json(self, text: str) -> Dict[str, Any]:
-        markdown_match = re.search(r'```json\s*(\{.*?\})\s*```', text, re.DOTALL)
-        if markdown_match:
+    # The session service is shared process-wide, so drop this episode's sessions when it is done
+    async def _close_sessions(self):
+        for session in self._sessions:
             try:
-                return json.loads(markdown_match.group(1))
-            except json.JSONDecodeError:
+                await self.session_service.delete_session(app_name=self.APP_NAME, user_id=session.user_id, session_id=session.id)
+            except Exception:
                 pass
-        
-        # Regex pattern for balanced JSON with nesting
-        match = re.search(r"\{(?:[^{}]|(?:\{[^{}]*\}))*\}", text, re.DOTALL)
-        
-        if not match:
-            # No JSON pattern found
-            raise ValueError(
-                f"No JSON object found in agent output.\n"
-                f"Preview (first 200 chars): {text[:200]}"
+        self._sessions.clear()
+        self.session = None
+
+    # New session seeded with (author, prompt, response) exchanges: concurrent agents share context, not state.
+    # The replies are replayed as user turns, framed the way ADK presents other agents' replies: events authored
+    # by an agent outside the runner's tree only produce "Event from an unknown agent" warnings
+    async def _fork_session(self, seed):
+        session = await self._new_session()
+        for author, prompt, text in seed:
+            await self._append_history("user", prompt, f"For context: [{author}] said:\n{text}", session)
+        return session
+
+    # Text of the conversation so far; part of the cache key since agents see the session history
+    async def _session_context(self, session=None) -> str:
+        session = session or self.session
+        session = await self.session_service.get_session(app_name=self.APP_NAME, user_id=session.user_id, session_id=session.id)
+        # Consecutive turns by one author are merged, matching how cached exchanges are replayed
+        turns = []
+        for event in (session.events if session else []):
+            if event.content and event.content.parts:
+                text = "".join(part.text for part in event.content.parts if getattr(part, "text", None))
+                if not text:
+                    continue
+                if turns and turns[-1][0] == event.author:
+                    turns[-1][1].append(text)
+                else:
+                    turns.append((event.author, [text]))
+        return "\n".join(f"{author}: {''.join(texts)}" for author, texts in turns)
+
+    # Replay a cached exchange into the session so later agents see the same history as a live run
+    async def _append_history(self, author: str, prompt: str, text: str, session=None):
+        session = session or self.session
+        session = await self.session_service.get_session(app_name=self.APP_NAME, user_id=session.user_id, session_id=session.id)
+        invocation_id = Event.new_id()
+        for event_author, role, event_text in (("user", "user", prompt), (author, "user" if author == "user" else "model", text)):
+            event = Event(
+                id=Event.new_id(),
+                invocation_id=invocation_id,
+                author=event_author,
+                content=types.Content(role=role, parts=[types.Part(text=event_text)]),
             )
-        
-        # Extract the matched JSON string
-        json_str = match.group(0)
-        
+            await self.session_service.append_event(session, event)
+
+    def _emit(self, event_type: str, **fields: Any):
+        self.events.publish(event_type, session_id=self.session_id, **fields)
+
+    # Record a budget step (downgrade, shrink, skip) in usage.json and the event stream
+    def _budget_action(self, action: str, **fields: Any):
+        entry = self.budget.note(action, **fields)
+        self._emit(f"budget.{action}", **{k: v for k, v in entry.items() if k != "ts"})
+        details = ", ".join(f"{k}={v}" for k, v in fields.items())
+        console.print(f"[yellow]Budget {entry['used']:.0%} used: {action} ({details})[/yellow]")
+
+    # The agent itself, or its copy on the fallback model once the budget passes BUDGET_DOWNGRADE_AT
+    def _budgeted_agent(self, agent):
+        if not isinstance(agent.model, str):
+            return agent
+        variant = self.registry.with_model(agent, self.budget.model_for(agent.model))
+        if variant is not agent and not any(a["action"] == "downgrade" and a["agent"] == agent.name for a in self.budget.actions):
+            self._budget_action("downgrade", agent=agent.name, model=variant.model)
+        return variant
+
+    # Transcript excerpt for an agent, shrunk once the budget passes BUDGET_SHRINK_AT
+    def _excerpt(self, builder: TranscriptContextBuilder, context_key: str) -> str:
+        scale = self.budget.context_scale()
+        if scale < 1:
+            self._budget_action("shrink", stage=current_stage(), scale=scale)
+        return builder.for_agent(context_key, scale)
+
+    # Model name for usage and cost; agents may hold a model object (BaseLlm) instead of a name
+    @staticmethod
+    def _model_name(agent) -> str:
+        return agent.model if isinstance(agent.model, str) else getattr(agent.model, "model", str(agent.model))
+
+    def _usage_report(self) -> Dict[str, Any]:
+        return {"session_id": self.session_id, **self.usage.to_dict(), "budget": self.budget.to_dict()}
+
+    # save agent outputs (compact=None follows OUTPUT_JSON_FORMAT)
+    async def _write_json(self, path: str, data: Any, compact: Optional[bool] = None):
+        await self.sink.write_json(path, data, compact=compact)
+        self._emit("output.written", file=os.path.relpath(path, self.output_dir))
+
+    # Text above ARTIFACT_MIN_BYTES goes to the artifact store; returns its reference, or None to keep it inline
+    async def _store_artifact(self, text: str) -> Optional[Dict[str, Any]]:
+        if len(text) < Config.ARTIFACT_MIN_BYTES:
+            return None
+        return await asyncio.to_thread(self.artifacts.put_text, text)
+
+    # Record a finished stage and persist the checkpoint (ref: artifact holding the value, see _store_artifact).
+    # A durable backend already holds the new key, so the snapshot file is only rewritten without one.
+    async def _checkpoint(self, stage: str, key: str, value: Any, ref: Optional[Dict[str, Any]] = None):
+        self.store.set(key, value, ref=ref)
+        self.store.log_step(stage, value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+        if not self._durable_session:
+            await self.sink.write_json(self.checkpoint_path, self.store.snapshot(), compact=True)
+
+    @property
+    def _durable_session(self) -> bool:
+        return self.session_backend is not None and self.session_backend.durable
+
+    # Load the previous run's checkpoint if it belongs to the same topic and input
+    def _restore_checkpoint(self, topic: str, source: Optional[str]) -> bool:
+        restored = None
+        if self._durable_session:
+            restored = SessionStore.open(self.session_id, self.session_backend, artifacts=self.artifacts, max_history=Config.SESSION_HISTORY_MAX)
+            if not restored.keys():
+                restored = None
+        if restored is None:
+            restored = SessionStore.load_snapshot(self.checkpoint_path, artifacts=self.artifacts, backend=self.session_backend, max_history=Config.SESSION_HISTORY_MAX)
+        if restored is None:
+            console.print("[yellow]No checkpoint found — starting a fresh run.[/yellow]")
+            return False
+
+        if restored.get("topic") != topic or restored.get("source") != source:
+            console.print("[yellow]Checkpoint belongs to a different topic/input — starting a fresh run.[/yellow]")
+            return False
+
+        self.store = restored
+        done = [k for k in ("transcript", "research", "outline") if restored.get(k) is not None]
+        done += sorted((restored.get("assets") or {}).keys())
+        console.print(f"[cyan]Resuming from checkpoint; completed: {', '.join(done) or 'nothing'}[/cyan]")
+        return True
+
+    # save only JSON and avoid functional texts (any nesting depth, braces inside strings)
+    def _extract_first_json(self, text: str) -> Dict[str, Any]:
+        return extract_first_json(text)
+
+    @staticmethod
+    def _matches_schema(obj: Dict[str, Any], expected_schema: Optional[Any]) -> bool:
+        if not expected_schema:
+            return True
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            # Parsing failed
-            raise ValueError(
-                f"JSON parse error: {e}\n"
-                f"Extracted JSON preview (first 300 chars): {json_str[:300]}"
-            )
+            expected_schema.parse_obj(obj)
+            return True
+        except Exception:
+            return False
         
     # ----------------------------------------------------------- CORE EXECUTION ----------------------------------------------------------
 
-    async def _run_agent(self, agent, prompt: str,raw_filename: str,expected_schema: Optional[Any] = None,max_retries: Optional[int] = None,) -> Dict[str, Any]:
+    # session defaults to the shared episode session; pass another (e.g. _new_session()) to isolate the call
+    # Each call is an "agent" span; its attempts and backoff sleeps are recorded as child spans
+    async def _run_agent(self, agent, prompt: str,raw_filename: str,expected_schema: Optional[Any] = None,max_retries: Optional[int] = None, session=None) -> Dict[str, Any]:
+        agent = self._budgeted_agent(agent)
+        with self.tracer.span(agent.name, kind="agent", raw_file=raw_filename, model=self._model_name(agent)):
+            return await self._call_agent(agent, prompt, raw_filename, expected_schema, max_retries, session)
+
+    async def _call_agent(self, agent, prompt: str, raw_filename: str, expected_schema: Optional[Any], max_retries: Optional[int], session) -> Dict[str, Any]:
         # Ensure session exists before running agent
         await self._ensure_session()
+        session = session or self.session
 
         max_retries = max_retries or self.MAX_RETRIES
+        limiter = self.rate_limiter or get_rate_limiter()
+
+        # Cache lookup
+        context = await self._session_context(session)
+        cache_key = None
+        if self.cache:
+            cache_key = ResultCache.make_key(agent.name, agent.instruction, str(agent.model), prompt, context)
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                await self._append_history(agent.name, prompt, cached["text"], session)
+                console.print(f"[dim]Cache hit: {agent.name}[/dim]")
+                self._emit("agent.cached", agent=agent.name)
+                self.tracer.current().set(cached=True)
+                self.usage.record(agent.name, self._model_name(agent), 0, 0, stage=current_stage(), cached=True)
+                return cached["result"]
+
+        # Refuse the call outright on a spent budget rather than fail partway through the episode
+        self.budget.check(agent.name)
         
+        # Charged to the TPM bucket up front, corrected with the reported usage afterwards
+        est_in = count_tokens(agent.instruction) + count_tokens(context) + count_tokens(prompt)
+        est_tokens = est_in + Config.EXPECTED_OUTPUT_TOKENS
+
+        # Agents with an output_schema (the ones without tools) get it as the response schema, so the model
+        # is constrained to it while generating and the reply is validated whole; the others fall back to
+        # scanning the reply for the first object matching expected_schema
+        structured = getattr(agent, "output_schema", None)
+        if not hasattr(structured, "model_validate_json"):
+            structured = None
+        output_mode = "schema" if structured else "extract"
+
         attempt = 0
+        rate_limited = 0
+        started = time.perf_counter()
 
         while attempt < max_retries:
             attempt += 1
+            self._emit("agent.started", agent=agent.name, attempt=attempt + rate_limited)
+            attempt_span = self.tracer.start_span(agent.name, kind="attempt", attempt=attempt + rate_limited, output=output_mode)
+            # In-flight calls count against the budget at their estimate until their usage is recorded
+            reservation = self.budget.reserve(self._model_name(agent), est_in, Config.EXPECTED_OUTPUT_TOKENS)
             
             try:
-                # Create a fresh Runner for this agent call
-                runner = Runner(agent=agent, app_name="PodcastAutomator", session_service=self.session_service)
+                # Pooled Runner, reused across retries and episodes
+                runner = self.registry.runner(agent)
 
                 # Construct user message
                 message = types.Content(role="user", parts=[types.Part(text=prompt)])
                 
-                # Stream the prompt response and concatenate text chunks
-                final_text = ""
-                async for event in runner.run_async(session_id=self.session.id, user_id=self.session.user_id, new_message=message):
-                    # Extract text from response events
-                    if event.content and event.content.parts:
-                        for part in event.content.parts:
-                            if getattr(part, "text", None):
-                                final_text += part.text
+                # Stream the response and scan for JSON as the text arrives;
+                # committed holds the text of completed turns, i.e. what the session records
+                committed: List[str] = []
+                scanner = JsonStreamScanner()
+                parsed = None
+                in_partial_turn = False
+                used_tokens = None
+                tokens_in = tokens_out = None
+                async with limiter.slot(est_tokens) as ticket:
+                    self.model_calls += 1
+                    events = runner.run_async(session_id=session.id, user_id=session.user_id, new_message=message, run_config=self.run_config)
+                    try:
+                        async for event in events:
+                            # The closing event of a streamed turn repeats its partial text
+                            repeated = in_partial_turn and not event.partial
+                            in_partial_turn = bool(event.partial)
+                            if event.usage_metadata and event.usage_metadata.total_token_count:
+                                used_tokens = event.usage_metadata.total_token_count
+                                tokens_in = event.usage_metadata.prompt_token_count
+                                tokens_out = event.usage_metadata.candidates_token_count
+
+                            parts = event.content.parts if event.content and event.content.parts else []
+                            text = "".join(part.text for part in parts if getattr(part, "text", None))
+                            if not event.partial and text:
+                                committed.append(text)
+
+                            # Schema-valid object received: stop once its turn is committed to the session
+                            if parsed is not None:
+                                if not event.partial:
+                                    break
+                                continue
+
+                            if repeated or not text or structured:
+                                continue
+
+                            for obj in scanner.feed(text):
+                                if self._matches_schema(obj, expected_schema):
+                                    parsed = obj
+                                    break
+
+                            if parsed is not None and not event.partial:
+                                break
+                    finally:
+                        await events.aclose()
+                limiter.settle(ticket, used_tokens)
+                await limiter.record_success()
+                attempt_span.set(tokens_in=tokens_in, tokens_out=tokens_out)
+
+                final_text = "".join(committed)
+                self.usage.record(
+                    agent.name, self._model_name(agent),
+                    tokens_in if tokens_in is not None else est_in,
+                    tokens_out if tokens_out is not None else count_tokens(final_text),
+                    stage=current_stage(),
+                )
 
                 # Save complete agent response for debugging
-                raw_path = os.path.join(self.raw_dir, raw_filename)
-                with open(raw_path, "w", encoding="utf-8") as fh:
-                    fh.write(final_text)
-
-                # Agent may use tools without returning text
-                if not final_text or final_text.strip() == "":
-                    return {"status": "tool_used"}
-
-                # Extract JSON
-                parsed = self._extract_first_json(final_text)
-
-                # Validate schema structure
-                if expected_schema:
-                    expected_schema.parse_obj(parsed)
+                await self.sink.write_text(os.path.join(self.raw_dir, raw_filename), final_text)
+
+                # Every agent answers with its JSON in a single turn (outputs are written by the
+                # orchestrator, not by a tool), so an empty reply is a parse failure and retried
+                if structured:
+                    parsed = structured.model_validate_json(final_text).model_dump(mode="json")
+                elif parsed is None:
+                    # No object matched the schema: validate the first one to surface the error
+                    parsed = scanner.objects[0] if scanner.objects else self._extract_first_json(final_text)
+                    if expected_schema:
+                        expected_schema.parse_obj(parsed)
 
                 # Success
+                if cache_key:
+                    await asyncio.to_thread(self.cache.put, cache_key, {"result": parsed, "text": final_text})
+                self._emit("agent.completed", agent=agent.name, duration_s=round(time.perf_counter() - started, 3), tokens=used_tokens, attempts=attempt + rate_limited)
                 return parsed
 
+            except asyncio.CancelledError:
+                self.tracer.finish(attempt_span, status="cancelled")
+                raise
+
             except Exception as e:
                 err = str(e)
+
+                # Parsing/validation failures, counted per agent and output mode (podcast_parse_failures_total)
+                parsing_error_indicators = ["JSON", "parse", "Schema", "validation"]
+                parse_failure = not is_rate_limit_error(e) and any(indicator in err for indicator in parsing_error_indicators)
+                if parse_failure:
+                    self.parse_failures += 1
+                    attempt_span.set(parse_failure=True)
+                self.tracer.finish(attempt_span, error=e)
                 
-                # API errors 
-                rate_limit_indicators = [
-                    "429",                  # HTTP 429 Too Many Requests
-                    "RESOURCE_EXHAUSTED",   # gRPC status code
-                    "Rate limit",           # Error message text
-                    "quota"                 # Quota exceeded messages
-                ]
-                
-                if any(indicator in err for indicator in rate_limit_indicators):
-                    # exponential backoff: 5s, 10s, 15s
-                    wait = self.BACKOFF_BASE * attempt
+                # API errors: the shared limiter backs off every caller, this call retries after its jittered delay.
+                # Rate limits have their own retry budget and do not use up regular attempts.
+                if is_rate_limit_error(e) and rate_limited < Config.MAX_RATE_LIMIT_RETRIES:
+                    rate_limited += 1
+                    attempt -= 1
+                    wait = limiter.on_rate_limited(retry_after_seconds(e), rate_limited)
                     console.print(
-                        f"[yellow]Transient error (rate limit); "
-                        f"backing off {wait}s (attempt {attempt}/{max_retries})[/yellow]"
+                        f"[yellow]Rate limited ({agent.name}); "
+                        f"retrying in {wait:.1f}s (retry {rate_limited}/{Config.MAX_RATE_LIMIT_RETRIES}, "
+                        f"concurrency {limiter.stats()['concurrency_limit']})[/yellow]"
                     )
-                    await asyncio.sleep(wait)
+                    self._emit("agent.backoff", agent=agent.name, wait_s=round(wait, 2), retry=rate_limited, concurrency=limiter.stats()["concurrency_limit"])
+                    with self.tracer.span("backoff", kind="backoff", agent=agent.name, wait_s=round(wait, 2), retry=rate_limited):
+                        await asyncio.sleep(wait)
                     continue
 
                 # Retry on parsing errors
-                parsing_error_indicators = ["JSON", "parse", "Schema", "validation"]
-                
-                if attempt == 1 and any(
-                    indicator in err for indicator in parsing_error_indicators
-                ):
+                if attempt == 1 and parse_failure:
                     console.print(
                         "[yellow]Parsing/validation failed — "
                         "retrying with JSON-only instruction.[/yellow]"
                     )
+                    self._emit("agent.retry", agent=agent.name, reason="parse", error=err[:200])
                     # Add clarification
                     prompt = (
                         f"{prompt}\n\n"
@@ -215,9 +515,16 @@ class PodcastOrchestrator:
 
                 # Errors
                 console.print(f"[red]Permanent error running agent: {err}[/red]")
+                self._emit("agent.failed", agent=agent.name, duration_s=round(time.perf_counter() - started, 3), error=err[:200])
                 raise
 
+            finally:
+                # Successful returns; failed attempts were finished before any retry or backoff
+                self.tracer.finish(attempt_span)
+                self.budget.release(reservation)
+
         # Max Retires Exceeded
+        self._emit("agent.failed", agent=agent.name, duration_s=round(time.perf_counter() - started, 3), error=f"failed after {max_retries} attempts")
         raise RuntimeError(
             f"Agent failed after {max_retries} attempts. "
             f"Check {os.path.join(self.raw_dir, raw_filename)} for details."
@@ -225,131 +532,300 @@ class PodcastOrchestrator:
 
     # ----------------------------------------------------------- MAIN PIPELINE ----------------------------------------------------------
 
-    async def run_lifecycle(self, topic: str = "General Podcast", audio_path: Optional[str] = None, transcript_path: Optional[str] = None):
-        # Progress indicator
+    # Research for the topic: reuse a fresh close match from the research index, refresh an older
+    # or looser match starting from its result, otherwise research from scratch
+    async def _research(self, topic: str, research_prompt: str) -> Dict[str, Any]:
+        match = None
+        if self.research_index is not None:
+            match = self.research_index.lookup(topic, max_age_seconds=Config.RESEARCH_MAX_AGE_DAYS * 86400)
+
+        if match and match.score >= Config.RESEARCH_REUSE_SIMILARITY and match.age_seconds <= Config.RESEARCH_FRESH_DAYS * 86400:
+            console.print(f"[dim]Reusing research on '{match.topic}' (similarity {match.score:.2f})[/dim]")
+            # Recorded under the normal prompt so later agents see the same session as in a live run
+            await self._ensure_session()
+            await self._append_history(self.researcher.name, research_prompt, json.dumps(match.research, ensure_ascii=False))
+            self.store.log_step("ResearchIndex", f"reused '{match.topic}' (similarity {match.score})")
+            return match.research
+
+        prompt = research_prompt
+        if match and match.score >= Config.RESEARCH_REFRESH_SIMILARITY:
+            console.print(f"[dim]Refreshing earlier research on '{match.topic}' (similarity {match.score:.2f})[/dim]")
+            prompt = (
+                f"{research_prompt}\n\n"
+                f"Earlier research on a related topic ('{match.topic}'):\n{json.dumps(match.research, ensure_ascii=False)}\n"
+                "Start from it: keep what still applies, update or replace what is outdated or off-topic, "
+                "and search only for what is missing."
+            )
+            self.store.log_step("ResearchIndex", f"refreshing '{match.topic}' (similarity {match.score})")
+
+        research = await self._run_agent(self.researcher, prompt, "research_raw.json", expected_schema=ResearchOutput)
+        if self.research_index is not None:
+            self.research_index.add(topic, research)
+        return research
+
+    # Episode digest for transcripts above DIGEST_THRESHOLD_TOKENS, cached in the SessionStore by transcript hash
+    async def _build_digest(self, progress, task) -> Optional[Dict[str, Any]]:
+        transcript = self.store.get("transcript") or ""
+        if await asyncio.to_thread(count_tokens, transcript) <= Config.DIGEST_THRESHOLD_TOKENS:
+            return None
+
+        fingerprint = transcript_fingerprint(transcript)
+        cached = self.store.get("digest")
+        if cached and cached.get("transcript_sha256") == fingerprint:
+            console.print("[dim]Digest: reusing cached episode digest.[/dim]")
+            return cached["digest"]
+
+        progress.update(task, description="Summarizing long transcript (map-reduce)...")
+
+        # Every chunk/merge call runs in its own empty session so the shared history stays small
+        async def summarize(prompt: str, raw_filename: str) -> Dict[str, Any]:
+            return await self._run_agent(self.summarizer, prompt, raw_filename, expected_schema=SummaryOutput, session=await self._new_session())
+
+        summarizer = MapReduceSummarizer(summarize)
+        digest = await summarizer.run(transcript)
+        await self._write_json(os.path.join(self.raw_dir, "digest.json"), digest)
+        await self._checkpoint("SummaryAgent", "digest", {"transcript_sha256": fingerprint, "digest": digest})
+        console.print(f"[dim]Digest: {digest['chunks']} chunks, {digest['levels']} merge level(s), {summarizer.calls} calls.[/dim]")
+        return digest
+
+    # resume=True skips stages recorded in the checkpoint and reruns only failed or missing assets
+    async def run_lifecycle(self, topic: str = "General Podcast", audio_path: Optional[str] = None, transcript_path: Optional[str] = None, resume: bool = False):
+        try:
+            with self.tracer.span("run_lifecycle", kind="run", session_id=self.session_id, topic=topic, resume=resume):
+                await self._run_lifecycle(topic, audio_path, transcript_path, resume)
+        finally:
+            await asyncio.to_thread(write_metrics)
+
+    async def _run_lifecycle(self, topic: str, audio_path: Optional[str], transcript_path: Optional[str], resume: bool):
+        source = audio_path or transcript_path
+        # Reads session storage (and may load artifacts), so it runs off the event loop
+        resumed = resume and await asyncio.to_thread(self._restore_checkpoint, topic, source)
+        if not resumed:
+            # Drop whatever an earlier run left under this session_id
+            self.store.clear()
+        self.store.set("topic", topic)
+        self.store.set("source", source)
+        self._emit("run.started", topic=topic, source=source, resumed=resumed)
+        run_started = time.perf_counter()
+
+        # Progress indicator (rich allows one live display at a time, so batch runs disable it)
         with Progress(
             SpinnerColumn(), 
-            TextColumn("[progress.description]{task.description}")
+            TextColumn("[progress.description]{task.description}"),
+            disable=not self.show_progress,
         ) as progress:
             
             task = progress.add_task("Starting podcast automation...", total=None)
             
             try:
-                # STAGE 1: INGEST (SEQUENTIAL)
-                progress.update(task, description="Ingest: preparing transcript...")
-                transcript_text = ""
-
-                # Priority 1: Transcribe audio file
-                if audio_path and os.path.exists(audio_path):
-                    from tools.audio_tool import transcribe_audio
-                    
-                    loop = asyncio.get_event_loop()
-                    console.print("[cyan]Transcribing audio (this may take a while)...[/cyan]")
-                    
-                    # Run blocking transcription in executor to Keeps responsiveness
-                    res = await loop.run_in_executor(None, lambda: transcribe_audio(audio_path))
-
-                    # Validate transcription result
-                    if not isinstance(res, dict) or not res.get("ok"):
-                        error_msg = (
-                            res.get("error", "unknown") 
-                            if isinstance(res, dict) 
-                            else str(res)
-                        )
-                        raise RuntimeError(f"Transcription failed: {error_msg}")
-
-                    # Extract transcript and save
-                    transcript_text = res["data"]["transcript"]
-                    self.store.set("transcript", transcript_text)
-                    self._write_json( os.path.join(self.output_dir, "transcription.json"), {"transcript": transcript_text})
-
-                # Priority 2: Load transcript file
-                elif transcript_path and os.path.exists(transcript_path):
-                    from tools.custom_tools import read_transcript
-                    
-                    transcript_text = read_transcript(transcript_path)
-                    self.store.set("transcript", transcript_text)
-                    self._write_json(os.path.join(self.output_dir, "transcription.json"), {"transcript": transcript_text})
-
-                # Priority 3: fallback
-                else:
-                    transcript_text = self.store.get("transcript") or "No transcript provided."
-                    self.store.set("transcript", transcript_text)
-                    self._write_json(os.path.join(self.output_dir, "transcription.json"), {"transcript": transcript_text})
-
-                progress.update(task, description="Ingest completed.")
-
-                ## STAGE 2: RESEARCH (SEQUENTIAL)
-
-                progress.update(task, description="Researching topic...")
-                research_prompt = f"Research this podcast topic: {topic}. Return JSON with fields: 'summary', 'bullets', 'citations'."
-                research = await self._run_agent(self.researcher, research_prompt, "research_raw.json", expected_schema=ResearchOutput)
-                self._write_json(os.path.join(self.output_dir, "research.json"), research)
-                self.store.set("research", research)
-                progress.update(task, description="Research done.")
-
-                ### STAGE 3: OUTLINE (SEQUENTIAL)
-                
-                progress.update(task, description="Creating outline...")
-                """ Use first N characters of transcript to avoid token limits"""
-                transcript_sample = (self.store.get("transcript") or "")[:self.TRANSCRIPT_SAMPLE_LENGTH]
-                outline_prompt = "Create a podcast outline using the research and transcript sample. Return JSON with fields: 'hook', 'segments', 'closing'."
-                outline = await self._run_agent(self.outliner, outline_prompt, "outline_raw.json", expected_schema=OutlineOutput)
-                self._write_json(os.path.join(self.output_dir, "outline.json"), outline)
-                self.store.set("outline", outline)
-                
-                progress.update(task, description="Outline done.")
-
-                #### STAGE 4: Output Content Bundle Generation (PARALLEL)
-                progress.update(task, description="Generating assets (parallel)...")
-
-                async def run_and_save(agent, prompt, raw_name, out_name, schema):
-                    output = await self._run_agent(agent, prompt, raw_name, expected_schema=schema)
-                    self._write_json(os.path.join(self.output_dir, out_name), output)
-                    return output
-
-                # Create parallel tasks for all asset agents
-                tasks = [
-                    asyncio.create_task(run_and_save(self.show_notes, "Write comprehensive show notes in JSON format.", "show_notes_raw.json", "show_notes.json", ShowNotesOutput)),
-                    asyncio.create_task(run_and_save(self.timestamp_agent, "Generate exactly 8 chapter timestamps with descriptions (JSON).", "timestamps_raw.json", "timestamps.json", TimestampOutput)),
-                    asyncio.create_task(run_and_save(self.quote_agent, "Extract 5 memorable and shareable quotes (JSON).", "quotes_raw.json", "quotes.json", QuotesOutput)),
-                    asyncio.create_task(run_and_save(self.social_agent, "Create social media posts: twitter_thread, linkedin_posts, instagram_captions (JSON).", "social_raw.json", "social.json", SocialOutput)),
-                    asyncio.create_task(run_and_save(self.seo_agent, "Generate SEO metadata: title, meta_description, keywords (JSON).", "seo_raw.json", "seo.json", SEOOutput)),
+                # The lifecycle is a stage graph: each stage starts as soon as the stages it needs
+                # are done, so research overlaps ingest and assets that skip the outline start early
+                running: List[str] = []
+
+                def on_stage(timing: StageTiming):
+                    self._emit(f"stage.{timing.status}", stage=timing.name, needs=list(timing.needs), duration_s=round(timing.duration, 3), error=timing.error)
+                    if timing.status == "running":
+                        running.append(timing.name)
+                    elif timing.name in running:
+                        running.remove(timing.name)
+                    progress.update(task, description=f"Running: {', '.join(running)}" if running else "Finishing stages...")
+
+                # Prompt exchanges of research and outline, replayed into the asset sessions that need them
+                exchanges: Dict[str, tuple] = {}
+
+                # STAGE 1: INGEST
+                async def ingest(_):
+                    # Resume: transcript already in checkpoint
+                    if resumed and self.store.get("transcript") is not None:
+                        console.print("[dim]Ingest: using checkpointed transcript.[/dim]")
+                    else:
+                        segments = None
+
+                        # Priority 1: Transcribe audio file
+                        if audio_path and os.path.exists(audio_path):
+                            from tools.audio_tool import transcribe_audio_chunked_async
+
+                            console.print("[cyan]Transcribing audio (this may take a while)...[/cyan]")
+
+                            # Async upload/poll on the shared client; long audio is split into concurrent chunks
+                            res = await transcribe_audio_chunked_async(audio_path)
+
+                            # Validate transcription result
+                            if not isinstance(res, dict) or not res.get("ok"):
+                                error_msg = (
+                                    res.get("error", "unknown")
+                                    if isinstance(res, dict)
+                                    else str(res)
+                                )
+                                raise RuntimeError(f"Transcription failed: {error_msg}")
+
+                            transcript_text = res["data"]["transcript"]
+                            segments = res["data"].get("segments")
+
+                        # Priority 2: Load transcript file
+                        elif transcript_path and os.path.exists(transcript_path):
+                            from tools.custom_tools import read_transcript
+
+                            transcript_text = await asyncio.to_thread(read_transcript, transcript_path)
+
+                        # Priority 3: fallback
+                        else:
+                            transcript_text = self.store.get("transcript") or "No transcript provided."
+
+                        # Long transcripts are stored once; transcription.json and the snapshot reference them
+                        ref = await self._store_artifact(transcript_text)
+                        transcription = {"transcript": ref or transcript_text}
+                        if segments:
+                            transcription["segments"] = segments
+                        await self._write_json(os.path.join(self.output_dir, "transcription.json"), transcription)
+                        await self._checkpoint("Ingest", "transcript", transcript_text, ref=ref)
+
+                    return self.store.get("transcript")
+
+                # STAGE 1b: DIGEST (MAP-REDUCE, long transcripts only)
+                async def digest(_):
+                    return await self._build_digest(progress, task)
+
+                # Representative transcript windows under each agent's token budget (tokenized off the loop)
+                async def transcript_context(inputs):
+                    builder = await asyncio.to_thread(TranscriptContextBuilder, inputs["ingest"] or "")
+                    digest_text = f"\n\nEpisode digest:\n{render_digest(inputs['digest'])}" if inputs["digest"] else ""
+                    return builder, digest_text
+
+                ## STAGE 2: RESEARCH (needs only the topic)
+                async def research(_):
+                    research_prompt = f"Research this podcast topic: {topic}. Return JSON with fields: 'summary', 'bullets', 'citations'."
+                    result = self.store.get("research") if resumed else None
+                    if result is not None:
+                        # Replay into the main ADK session so its history matches a live run
+                        await self._ensure_session()
+                        await self._append_history(self.researcher.name, research_prompt, json.dumps(result, ensure_ascii=False))
+                    else:
+                        result = await self._research(topic, research_prompt)
+                        await self._write_json(os.path.join(self.output_dir, "research.json"), result)
+                        await self._checkpoint("ResearchAgent", "research", result)
+                    exchanges["research"] = (self.researcher.name, research_prompt, json.dumps(result, ensure_ascii=False))
+                    return result
+
+                ### STAGE 3: OUTLINE (own session seeded with the research, like the assets below)
+                async def outline(inputs):
+                    builder, digest_text = inputs["context"]
+                    outline_prompt = (
+                        "Create a podcast outline using the research and transcript sample. Return JSON with fields: 'hook', 'segments', 'closing'."
+                        f"{digest_text}\n\nTranscript sample:\n{self._excerpt(builder, 'outline')}"
+                    )
+                    result = self.store.get("outline") if resumed else None
+                    if result is not None:
+                        await self._ensure_session()
+                        await self._append_history(self.outliner.name, outline_prompt, json.dumps(result, ensure_ascii=False))
+                    else:
+                        session = await self._fork_session([exchanges["research"]])
+                        result = await self._run_agent(self.outliner, outline_prompt, "outline_raw.json", expected_schema=OutlineOutput, session=session)
+                        await self._write_json(os.path.join(self.output_dir, "outline.json"), result)
+                        await self._checkpoint("OutlineAgent", "outline", result)
+                    exchanges["outline"] = (self.outliner.name, outline_prompt, json.dumps(result, ensure_ascii=False))
+                    return result
+
+                #### STAGE 4: Output Content Bundle Generation
+
+                # Completed assets are checkpointed one by one, so a resume reruns only the rest
+                assets = dict(self.store.get("assets") or {}) if resumed else {}
+
+                # (stage, agent, prompt, context budget key, raw file, output file, schema, upstream agent outputs it uses)
+                asset_specs = [
+                    ("show_notes", self.show_notes, "Write comprehensive show notes in JSON format.", "show_notes", "show_notes_raw.json", "show_notes.json", ShowNotesOutput, ("research", "outline")),
+                    ("timestamps", self.timestamp_agent, "Generate exactly 8 chapter timestamps with descriptions (JSON).", "timestamps", "timestamps_raw.json", "timestamps.json", TimestampOutput, ("outline",)),
+                    ("quotes", self.quote_agent, "Extract 5 memorable and shareable quotes (JSON).", "quotes", "quotes_raw.json", "quotes.json", QuotesOutput, ()),
+                    ("social", self.social_agent, "Create social media posts: twitter_thread, linkedin_posts, instagram_captions (JSON).", "social", "social_raw.json", "social.json", SocialOutput, ("research", "outline")),
+                    ("seo", self.seo_agent, "Generate SEO metadata: title, meta_description, keywords (JSON).", "seo", "seo_raw.json", "seo.json", SEOOutput, ("research",)),
                 ]
-
-
-                # Execute all tasks in parallel
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Report failures but continue pipeline
-                failed_count = 0
-                for idx, res in enumerate(results):
-                    if isinstance(res, Exception):
-                        failed_count += 1
-                        console.print(
-                            f"[red]Asset task #{idx} failed: {res}[/red]"
-                        )
-                
-                if failed_count > 0:
-                    console.print(f"[yellow]⚠️  {failed_count} asset(s) failed, Check raw outputs for details.[/yellow]")
+                done_assets = sum(1 for spec in asset_specs if spec[5] in assets)
+                if done_assets:
+                    console.print(f"[dim]Skipping {done_assets} checkpointed asset(s).[/dim]")
+
+                # Each asset agent runs in its own session seeded only with the upstream exchanges it uses,
+                # so prompts do not grow with sibling outputs and results do not depend on ordering
+                # The agent returns its JSON in one turn, without tools; only run_and_save writes the file
+                def asset_stage(agent, prompt, context_key, raw_name, out_name, schema, uses):
+                    async def run_and_save(inputs):
+                        if out_name in assets:
+                            return assets[out_name]
+                        builder, digest_text = inputs["context"]
+                        excerpt = self._excerpt(builder, context_key)
+                        full_prompt = f"{prompt}\n\nTranscript excerpts:\n{excerpt}{digest_text}" if excerpt else f"{prompt}{digest_text}"
+                        seed = [exchanges[key] for key in uses]
+
+                        # Assets are optional: skip this one rather than let it run the budget out
+                        model = self._model_name(self._budgeted_agent(agent))
+                        est_in = count_tokens(agent.instruction) + count_tokens(full_prompt) + sum(count_tokens(p) + count_tokens(t) for _, p, t in seed)
+                        reason = self.budget.skip_reason(current_stage(), model, est_in, Config.EXPECTED_OUTPUT_TOKENS)
+                        if reason:
+                            self._budget_action("skip", stage=current_stage(), reason=reason)
+                            raise StageSkipped(f"over budget: {reason}")
+
+                        session = await self._fork_session(seed)
+                        output = await self._run_agent(agent, full_prompt, raw_name, expected_schema=schema, session=session)
+                        await self._write_json(os.path.join(self.output_dir, out_name), output)
+                        assets[out_name] = output
+                        await self._checkpoint(agent.name, "assets", assets)
+                        return output
+                    return run_and_save
+
+                stages = [
+                    Stage("ingest", ingest),
+                    Stage("research", research),
+                    Stage("digest", digest, needs=("ingest",)),
+                    Stage("context", transcript_context, needs=("ingest", "digest")),
+                    Stage("outline", outline, needs=("research", "context")),
+                ] + [
+                    Stage(name, asset_stage(agent, prompt, key, raw, out, schema, uses), needs=("context",) + uses, optional=True)
+                    for name, agent, prompt, key, raw, out, schema, uses in asset_specs
+                ]
+                graph = StageGraph(stages, on_event=on_stage)
+                # Heartbeat measuring how long anything blocks the event loop while the stages run
+                monitor = LoopStallMonitor()
+                try:
+                    async with monitor:
+                        await graph.run()
+                finally:
+                    self.stage_timings = graph.report()
+                    self.loop_stats = monitor.stats()
+                    await self._write_json(os.path.join(self.raw_dir, "stage_timings.json"), self.stage_timings)
+                    await self._write_json(self.usage_path, self._usage_report())
+                    self.store.log_step("StageGraph", ", ".join(f"{t['stage']} {t['duration_s']}s" for t in self.stage_timings))
+                    self.store.log_step("EventLoop", f"max stall {self.loop_stats['max_stall_ms']}ms, {self.loop_stats['stalls_over_threshold']} stall(s) over {self.loop_stats['threshold_ms']}ms")
+
+                # Report asset failures but continue pipeline
+                failed = graph.failed()
+                for timing in failed:
+                    console.print(f"[red]Asset {timing.name} failed: {timing.error}[/red]")
+
+                if failed:
+                    console.print(f"[yellow]⚠️  {len(failed)} asset(s) failed, Check raw outputs for details. Rerun with --resume to retry only those.[/yellow]")
 
                 progress.update(task, description="Content Bundle generation completed.")
+                if self.show_progress:
+                    print_stage_timings(self.stage_timings)
+                    console.print(f"[dim]Event loop: max stall {self.loop_stats['max_stall_ms']}ms, {self.loop_stats['stalled_ms']}ms in stalls over {self.loop_stats['threshold_ms']}ms[/dim]")
+                    episode = self.usage.episode
+                    console.print(f"[dim]Usage: {episode.calls} model calls ({episode.cached_calls} cached, {self.parse_failures} parse failures), {episode.tokens_in} tokens in, {episode.tokens_out} out, ~${episode.cost_usd:.4f}[/dim]")
 
                 # STAGE 5: SAVE CONTEXT & SNAPSHOTS
                 context = {
                     "topic": topic,
-                    "transcript": self.store.get("transcript"),
+                    "transcript": self.store.refs.get("transcript") or self.store.get("transcript"),
                     "research": self.store.get("research"),
                     "outline": self.store.get("outline"),
                 }
-                self._write_json(os.path.join(self.raw_dir, "context.json"), context)
+                await self._write_json(os.path.join(self.raw_dir, "context.json"), context, compact=True)
 
                 if hasattr(self.store, "snapshot") and callable(getattr(self.store, "snapshot")):
-                    self._write_json(os.path.join(self.raw_dir, "session_snapshot.json"), self.store.snapshot())
+                    await self._write_json(os.path.join(self.raw_dir, "session_snapshot.json"), self.store.snapshot(), compact=True)
 
                 # GOOD TO GO
                 progress.update(task, description="Finalizing...")
                 
+                self._emit("run.completed", duration_s=round(time.perf_counter() - run_started, 3), failed=[t.name for t in failed], model_calls=self.model_calls, parse_failures=self.parse_failures, tokens=self.usage.episode.tokens, cost_usd=round(self.usage.episode.cost_usd, 6))
                 console.print("[bold green]✅ Podcast Lifecycle Completed![/bold green]")
                 console.print(f"Final JSON outputs: {self.output_dir}")
                 console.print(f"Raw agent traces: {self.raw_dir}")
@@ -360,8 +836,18 @@ class PodcastOrchestrator:
                 
             except Exception as e:
                 console.print(f"[bold red]❌ CRITICAL ERROR[/bold red] {e}")
+                self._emit("run.failed", duration_s=round(time.perf_counter() - run_started, 3), error=str(e)[:200])
                 raise
 
+            finally:
+                # Research added during the run is written once, off the loop
+                if self.research_index is not None:
+                    try:
+                        await asyncio.to_thread(self.research_index.flush)
+                    except OSError as e:
+                        console.print(f"[yellow]⚠️  Could not save the research index: {e}[/yellow]")
+                await self._close_sessions()
+
 
 # ENTRY POINT
 if __name__ == "__main__":
@@ -371,10 +857,12 @@ if __name__ == "__main__":
     p.add_argument("--topic", default="General Podcast", help="Episode topic/title")
     p.add_argument("--audio", default=None, help="Path to audio file (optional)")
     p.add_argument("--transcript", default=None, help="Path to transcript file (optional)")
+    p.add_argument("--no-cache", action="store_true", help="Bypass the agent result cache")
+    p.add_argument("--resume", action="store_true", help="Resume from the last checkpoint in outputs/agents_rawdata")
     args = p.parse_args()
 
-    orchestrator = PodcastOrchestrator()
+    orchestrator = PodcastOrchestrator(use_cache=not args.no_cache)
     try:
-        asyncio.run(orchestrator.run_lifecycle(topic=args.topic, audio_path=args.audio, transcript_path=args.transcript))
+        asyncio.run(orchestrator.run_lifecycle(topic=args.topic, audio_path=args.audio, transcript_path=args.transcript, resume=args.resume))
     except KeyboardInterrupt:
         console.print("\n[red]Interrupted by user[/red]")
\ No newline at end of file
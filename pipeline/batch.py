@@ -0,0 +1,211 @@
+import os
+import re
+import json
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from config import Config
+from pipeline.rate_limit import AdaptiveRateLimiter
+
+console = Console()
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a")
+TRANSCRIPT_EXTENSIONS = (".txt",)
+
+
+@dataclass
+class Episode:
+    name: str
+    topic: str
+    audio_path: Optional[str] = None
+    transcript_path: Optional[str] = None
+
+
+@dataclass
+class EpisodeResult:
+    episode: Episode
+    ok: bool
+    duration: float
+    model_calls: int = 0
+    output_dir: str = ""
+    error: Optional[str] = None
+    tokens: int = 0
+    cost_usd: float = 0.0
+
+
+@dataclass
+class BatchSummary:
+    results: List[EpisodeResult] = field(default_factory=list)
+    wall_time: float = 0.0
+    rate_limit: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def model_calls(self) -> int:
+        return sum(r.model_calls for r in self.results)
+
+    @property
+    def tokens(self) -> int:
+        return sum(r.tokens for r in self.results)
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(r.cost_usd for r in self.results)
+
+    def to_dict(self) -> Dict[str, Any]:
+        minutes = self.wall_time / 60 if self.wall_time else 0.0
+        return {
+            "episodes": len(self.results),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_time_s": round(self.wall_time, 2),
+            "episodes_per_min": round(len(self.results) / minutes, 2) if minutes else 0.0,
+            "model_calls": self.model_calls,
+            "model_calls_per_min": round(self.model_calls / minutes, 2) if minutes else 0.0,
+            "tokens": self.tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "rate_limit": self.rate_limit,
+            "results": [
+                {
+                    "episode": r.episode.name,
+                    "topic": r.episode.topic,
+                    "ok": r.ok,
+                    "duration_s": round(r.duration, 2),
+                    "model_calls": r.model_calls,
+                    "tokens": r.tokens,
+                    "cost_usd": round(r.cost_usd, 6),
+                    "output_dir": r.output_dir,
+                    "error": r.error,
+                }
+                for r in self.results
+            ],
+        }
+
+
+# "ep_12-AI_in_healthcare.mp3" -> "ep_12-ai_in_healthcare"
+def episode_slug(filename: str) -> str:
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return re.sub(r"[^a-z0-9_-]+", "_", stem.lower()).strip("_") or "episode"
+
+
+# "ep_12-AI_in_healthcare.mp3" -> "ep 12 AI in healthcare"
+def topic_from_filename(filename: str) -> str:
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return re.sub(r"[_\-]+", " ", stem).strip() or "General Podcast"
+
+
+def discover_episodes(audio_dir: str = Config.AUDIO_DIR, transcript_dir: str = Config.TESTDATA_DIR, topic: Optional[str] = None) -> List[Episode]:
+    """
+    Collect every episode found in the input folders (alphabetical order).
+    An audio file and a transcript with the same stem count as one episode; audio wins.
+    """
+    episodes: Dict[str, Episode] = {}
+
+    for directory, extensions, is_audio in ((audio_dir, AUDIO_EXTENSIONS, True), (transcript_dir, TRANSCRIPT_EXTENSIONS, False)):
+        if not directory or not os.path.isdir(directory):
+            continue
+        for f in sorted(os.listdir(directory)):
+            if not f.lower().endswith(extensions):
+                continue
+            slug = episode_slug(f)
+            if slug in episodes:
+                continue
+            path = os.path.join(directory, f)
+            episodes[slug] = Episode(
+                name=slug,
+                topic=topic or topic_from_filename(f),
+                audio_path=path if is_audio else None,
+                transcript_path=None if is_audio else path,
+            )
+
+    return list(episodes.values())
+
+
+async def _run_episode(episode: Episode, output_root: str, episode_slots: asyncio.Semaphore, rate_limiter: AdaptiveRateLimiter, use_cache: Optional[bool], resume: bool) -> EpisodeResult:
+    # Imported lazily so discovery works without the ADK installed
+    from orchestrator import PodcastOrchestrator
+
+    output_dir = os.path.join(output_root, episode.name)
+
+    async with episode_slots:
+        start = time.perf_counter()
+        orchestrator = PodcastOrchestrator(
+            session_id=f"pod_{episode.name}",
+            output_dir=output_dir,
+            rate_limiter=rate_limiter,
+            show_progress=False,
+            use_cache=use_cache,
+        )
+        console.print(f"[cyan]▶ {episode.name}[/cyan] ({episode.topic})")
+        usage = orchestrator.usage.episode
+        try:
+            await orchestrator.run_lifecycle(topic=episode.topic, audio_path=episode.audio_path, transcript_path=episode.transcript_path, resume=resume)
+        except Exception as e:
+            return EpisodeResult(episode, False, time.perf_counter() - start, orchestrator.model_calls, output_dir, str(e), usage.tokens, usage.cost_usd)
+        return EpisodeResult(episode, True, time.perf_counter() - start, orchestrator.model_calls, output_dir, tokens=usage.tokens, cost_usd=usage.cost_usd)
+
+
+async def run_batch(episodes: List[Episode], output_root: Optional[str] = None, max_episodes: Optional[int] = None, max_model_calls: Optional[int] = None, use_cache: Optional[bool] = None, resume: bool = False) -> BatchSummary:
+    """
+    Run the full lifecycle for many episodes in one event loop.
+
+    max_episodes bounds how many pipelines are in flight (memory, open uploads);
+    max_model_calls caps the adaptive limiter shared by every agent call of every episode
+    (it lowers itself on rate limits and grows back towards the cap).
+    Each episode writes into its own <output_root>/<episode>/ directory.
+    """
+    output_root = output_root or Config.OUTPUT_DIR
+    episode_slots = asyncio.Semaphore(max_episodes or Config.BATCH_MAX_EPISODES)
+    rate_limiter = AdaptiveRateLimiter(max_concurrency=max_model_calls or Config.MAX_CONCURRENT_MODEL_CALLS)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_run_episode(ep, output_root, episode_slots, rate_limiter, use_cache, resume) for ep in episodes))
+    summary = BatchSummary(results=list(results), wall_time=time.perf_counter() - start, rate_limit=rate_limiter.stats())
+
+    print_summary(summary)
+
+    os.makedirs(output_root, exist_ok=True)
+    with open(os.path.join(output_root, "batch_summary.json"), "w", encoding="utf-8") as fh:
+        json.dump(summary.to_dict(), fh, ensure_ascii=False, indent=2)
+
+    return summary
+
+
+def print_summary(summary: BatchSummary):
+    table = Table(title="Batch Summary")
+    table.add_column("Episode")
+    table.add_column("Status")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Model calls", justify="right")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Cost ($)", justify="right")
+
+    for r in summary.results:
+        status = "[green]ok[/green]" if r.ok else f"[red]failed[/red] {r.error or ''}"
+        table.add_row(r.episode.name, status, f"{r.duration:.1f}", str(r.model_calls), str(r.tokens), f"{r.cost_usd:.4f}")
+
+    console.print(table)
+
+    stats = summary.to_dict()
+    console.print(
+        f"[bold]{stats['succeeded']}/{stats['episodes']} episodes[/bold] in {stats['wall_time_s']}s — "
+        f"{stats['episodes_per_min']} episodes/min, {stats['model_calls']} model calls "
+        f"({stats['model_calls_per_min']}/min), {stats['tokens']} tokens, ~${stats['cost_usd']:.4f}"
+    )
+    if summary.rate_limit.get("rate_limited"):
+        console.print(
+            f"[yellow]{summary.rate_limit['rate_limited']} rate-limited calls; "
+            f"concurrency settled at {summary.rate_limit['concurrency_limit']}[/yellow]"
+        )
@@ -0,0 +1,179 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from config import Config
+
+
+class BudgetExceeded(RuntimeError):
+    """A required agent call was refused because the episode budget is spent."""
+
+
+@dataclass
+class Usage:
+    calls: int = 0
+    cached_calls: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def tokens(self) -> int:
+        return self.tokens_in + self.tokens_out
+
+    def add(self, tokens_in: int, tokens_out: int, cost_usd: float, cached: bool):
+        if cached:
+            self.cached_calls += 1
+            return
+        self.calls += 1
+        self.tokens_in += tokens_in
+        self.tokens_out += tokens_out
+        self.cost_usd += cost_usd
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "tokens": self.tokens,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+def call_cost(model: str, tokens_in: int, tokens_out: int) -> float:
+    price_in, price_out = Config.model_price(model)
+    return (tokens_in * price_in + tokens_out * price_out) / 1_000_000
+
+
+@dataclass
+class UsageLedger:
+    """Model tokens and estimated cost of one episode, per agent, per stage and per model."""
+    episode: Usage = field(default_factory=Usage)
+    by_agent: Dict[str, Usage] = field(default_factory=dict)
+    by_stage: Dict[str, Usage] = field(default_factory=dict)
+    by_model: Dict[str, Usage] = field(default_factory=dict)
+
+    # One model call (or cache hit); stage is the DAG stage the call ran in, if any
+    def record(self, agent: str, model: str, tokens_in: Optional[int], tokens_out: Optional[int], stage: Optional[str] = None, cached: bool = False) -> float:
+        tokens_in, tokens_out = int(tokens_in or 0), int(tokens_out or 0)
+        cost = 0.0 if cached else call_cost(model, tokens_in, tokens_out)
+        buckets = [self.episode, self.by_agent.setdefault(agent, Usage()), self.by_stage.setdefault(stage or "-", Usage())]
+        if not cached:
+            buckets.append(self.by_model.setdefault(model, Usage()))
+        for usage in buckets:
+            usage.add(tokens_in, tokens_out, cost, cached)
+        return cost
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "episode": self.episode.to_dict(),
+            "by_agent": {k: v.to_dict() for k, v in sorted(self.by_agent.items())},
+            "by_stage": {k: v.to_dict() for k, v in sorted(self.by_stage.items())},
+            "by_model": {k: v.to_dict() for k, v in sorted(self.by_model.items())},
+        }
+
+
+class EpisodeBudget:
+    """
+    Token/cost budget for one episode, applied before each model call so the
+    episode degrades step by step instead of failing partway through:
+
+      used >= BUDGET_DOWNGRADE_AT  calls switch to BUDGET_FALLBACK_MODEL
+      used >= BUDGET_SHRINK_AT     transcript excerpts shrink by BUDGET_SHRINK_FACTOR
+      used >= BUDGET_SKIP_AT       optional assets in BUDGET_SKIP_ORDER are skipped one at a
+                                   time, the first at BUDGET_SKIP_AT and the rest at even
+                                   steps between it and the full budget
+      call would overrun           any optional asset is skipped
+      budget spent                 required calls are refused (BudgetExceeded)
+
+    `used` is the larger of the token and cost fractions (a limit of 0 is
+    unlimited) and counts calls still in flight at their estimate, so assets
+    started together cannot all pass the same check.
+    """
+
+    def __init__(self, ledger: UsageLedger, max_tokens: Optional[int] = None, max_cost_usd: Optional[float] = None, fallback_model: Optional[str] = None, skip_order: Optional[Sequence[str]] = None):
+        self.ledger = ledger
+        self.max_tokens = Config.EPISODE_TOKEN_BUDGET if max_tokens is None else max_tokens
+        self.max_cost_usd = Config.EPISODE_COST_BUDGET_USD if max_cost_usd is None else max_cost_usd
+        self.fallback_model = Config.BUDGET_FALLBACK_MODEL if fallback_model is None else fallback_model
+        self.skip_order = list(Config.BUDGET_SKIP_ORDER if skip_order is None else skip_order)
+        self.reserved_tokens = 0
+        self.reserved_cost = 0.0
+        self.actions: List[Dict[str, Any]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_tokens > 0 or self.max_cost_usd > 0
+
+    def _fraction(self, extra_tokens: int = 0, extra_cost: float = 0.0) -> float:
+        fractions = [0.0]
+        if self.max_tokens > 0:
+            fractions.append((self.ledger.episode.tokens + self.reserved_tokens + extra_tokens) / self.max_tokens)
+        if self.max_cost_usd > 0:
+            fractions.append((self.ledger.episode.cost_usd + self.reserved_cost + extra_cost) / self.max_cost_usd)
+        return max(fractions)
+
+    @property
+    def used(self) -> float:
+        return self._fraction()
+
+    # Record a degradation step taken by the caller (downgrade, shrink, skip)
+    def note(self, action: str, **fields: Any) -> Dict[str, Any]:
+        entry = {"action": action, "used": round(self.used, 3), "ts": round(time.time(), 3), **fields}
+        self.actions.append(entry)
+        return entry
+
+    # Model for the next call of an agent currently on `model`
+    def model_for(self, model: str) -> str:
+        if self.enabled and self.fallback_model and self.used >= Config.BUDGET_DOWNGRADE_AT:
+            return self.fallback_model
+        return model
+
+    # Multiplier for transcript excerpt budgets
+    def context_scale(self) -> float:
+        if self.enabled and self.used >= Config.BUDGET_SHRINK_AT:
+            return Config.BUDGET_SHRINK_FACTOR
+        return 1.0
+
+    # Budget fraction from which `stage` is skipped: social, seo, quotes at 85%, 90%, 95% by default
+    def skip_threshold(self, stage: str) -> Optional[float]:
+        if stage not in self.skip_order:
+            return None
+        step = (1.0 - Config.BUDGET_SKIP_AT) / len(self.skip_order)
+        return Config.BUDGET_SKIP_AT + self.skip_order.index(stage) * step
+
+    # Reason to skip an optional stage whose call is estimated at est_in/est_out tokens, or None to run it
+    def skip_reason(self, stage: str, model: str, est_in: int, est_out: int) -> Optional[str]:
+        if not self.enabled:
+            return None
+        threshold = self.skip_threshold(stage)
+        if threshold is not None and self.used >= threshold:
+            return f"budget {self.used:.0%} used ({stage} is skipped from {threshold:.0%})"
+        if self._fraction(est_in + est_out, call_cost(model, est_in, est_out)) > 1.0:
+            return f"estimated {est_in + est_out} tokens would exceed the budget ({self.used:.0%} used)"
+        return None
+
+    # Required calls still run on a nearly spent budget, but not on a spent one
+    def check(self, agent: str):
+        if self.enabled and self._fraction() >= 1.0:
+            raise BudgetExceeded(f"Episode budget spent ({self.used:.0%}); refusing to call {agent}.")
+
+    def reserve(self, model: str, est_in: int, est_out: int) -> tuple:
+        ticket = (est_in + est_out, call_cost(model, est_in, est_out))
+        self.reserved_tokens += ticket[0]
+        self.reserved_cost += ticket[1]
+        return ticket
+
+    def release(self, ticket: tuple):
+        self.reserved_tokens -= ticket[0]
+        self.reserved_cost -= ticket[1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_tokens": self.max_tokens,
+            "max_cost_usd": self.max_cost_usd,
+            "used": round(self.used, 4),
+            "fallback_model": self.fallback_model,
+            "actions": self.actions,
+        }
@@ -0,0 +1,105 @@
+import re
+import array
+import bisect
+from typing import List, Optional, Tuple
+
+from config import Config
+
+# Approximate tokenizer: words and individual punctuation marks. It tracks
+# model tokenizers closely enough for budgeting and needs no network call.
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text: str) -> int:
+    return sum(1 for _ in _TOKEN_RE.finditer(text or ""))
+
+
+class TranscriptContextBuilder:
+    """
+    Picks representative transcript windows under a token budget.
+
+    Short transcripts are returned whole. Longer ones get the opening of the
+    episode (where hosts usually set up the topic) plus evenly spread windows
+    across the rest, each labelled with its position, so agents see the whole
+    arc of the episode instead of only the first N characters.
+    """
+
+    def __init__(self, transcript: str, window_tokens: Optional[int] = None, head_fraction: float = 0.3):
+        self.transcript = transcript or ""
+        self.window_tokens = window_tokens or Config.CONTEXT_WINDOW_TOKENS
+        self.head_fraction = head_fraction
+        # Character offset where each token starts
+        self._starts = array.array("q", (m.start() for m in _TOKEN_RE.finditer(self.transcript)))
+
+    @property
+    def total_tokens(self) -> int:
+        return len(self._starts)
+
+    def _char_span(self, first: int, last: int) -> Tuple[int, int]:
+        """Character span covering tokens [first, last), widened to whole lines where cheap."""
+        start = self._starts[first]
+        end = self._starts[last] if last < len(self._starts) else len(self.transcript)
+        line_start = self.transcript.rfind("\n", 0, start)
+        if line_start >= 0 and start - line_start < 200:
+            start = line_start + 1
+        return start, end
+
+    def windows(self, budget_tokens: int) -> List[Tuple[int, int]]:
+        """Token ranges [first, last) to include for the given budget."""
+        total = self.total_tokens
+        if total <= budget_tokens:
+            return [(0, total)]
+
+        head = max(1, int(budget_tokens * self.head_fraction))
+        remaining = budget_tokens - head
+        count = max(1, remaining // self.window_tokens)
+        size = remaining // count
+
+        spans = [(0, head)]
+        # Window centres evenly spaced over the rest of the episode, ending near the close
+        region = total - head
+        for i in range(count):
+            centre = head + int(region * (i + 1) / count) - size // 2
+            first = max(spans[-1][1], min(centre, total - size))
+            last = min(total, first + size)
+            if last > first:
+                spans.append((first, last))
+        return spans
+
+    def build(self, budget_tokens: int) -> str:
+        if budget_tokens <= 0 or not self.transcript:
+            return ""
+
+        spans = self.windows(budget_tokens)
+        if len(spans) == 1 and spans[0] == (0, self.total_tokens):
+            return self.transcript
+
+        total = self.total_tokens
+        parts = []
+        for first, last in spans:
+            start, end = self._char_span(first, last)
+            label = "start of episode" if first == 0 else f"~{100 * first // total}% into the episode"
+            parts.append(f"[{label}]\n{self.transcript[start:end].strip()}")
+        return "\n[...]\n".join(parts)
+
+    def chunks(self, chunk_tokens: int) -> List[str]:
+        """Split the whole transcript into consecutive pieces of about chunk_tokens, cut at line breaks where possible."""
+        total = self.total_tokens
+        pieces = []
+        start = 0
+        first = 0
+        while first < total:
+            last = min(total, first + chunk_tokens)
+            end = self._starts[last] if last < total else len(self.transcript)
+            if last < total:
+                newline = self.transcript.rfind("\n", start, end)
+                if newline > start + (end - start) // 2:
+                    end = newline + 1
+                    last = bisect.bisect_left(self._starts, end)
+            pieces.append(self.transcript[start:end].strip())
+            start, first = end, last
+        return [p for p in pieces if p]
+
+    # scale < 1 shrinks the excerpt, e.g. when the episode budget is running low
+    def for_agent(self, agent_key: str, scale: float = 1.0) -> str:
+        return self.build(int(Config.context_budget(agent_key) * scale))
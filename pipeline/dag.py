@@ -0,0 +1,214 @@
+import time
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from pipeline.tracing import Tracer, get_tracer
+
+console = Console()
+
+# A stage receives the outputs of the stages it needs, keyed by stage name
+StageFn = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class Stage:
+    name: str
+    run: StageFn
+    needs: Tuple[str, ...] = ()
+    # Optional stages may fail without stopping the pipeline; their dependents are skipped
+    optional: bool = False
+
+
+@dataclass
+class StageTiming:
+    name: str
+    status: str = "pending"          # pending | running | ok | failed | skipped | cancelled
+    needs: Tuple[str, ...] = ()
+    start: float = 0.0               # seconds since the graph started
+    end: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.name,
+            "status": self.status,
+            "needs": list(self.needs),
+            "start_s": round(self.start, 3),
+            "end_s": round(self.end, 3),
+            "duration_s": round(self.duration, 3),
+            "error": self.error,
+        }
+
+
+class StageSkipped(Exception):
+    """Raised by a stage to skip itself (e.g. over budget); it is reported as skipped, not failed."""
+
+
+# Name of the stage whose task is running (None outside a graph), e.g. for usage accounting
+_current_stage: ContextVar[Optional[str]] = ContextVar("current_stage", default=None)
+
+
+def current_stage() -> Optional[str]:
+    return _current_stage.get()
+
+
+class _Skipped:
+    """Result of a stage that failed or was skipped; dependents are skipped in turn."""
+
+
+SKIPPED = _Skipped()
+
+
+class StageGraph:
+    """
+    Declarative stage DAG with an async executor.
+
+    Every stage starts as soon as all the stages it needs have finished, so
+    independent branches overlap (e.g. research alongside transcription). A
+    failing required stage cancels the rest of the graph and re-raises; a failing
+    optional stage only skips its dependents, as does a stage raising StageSkipped.
+    Timings for every stage are kept in `timings` and reported through
+    `on_event(timing)` on each status change.
+    Each stage that runs is also recorded as a "stage" span.
+    """
+
+    def __init__(self, stages: List[Stage], on_event: Optional[Callable[[StageTiming], None]] = None, tracer: Optional[Tracer] = None):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names in graph.")
+        self.order = self._topological_order()
+        self.on_event = on_event
+        self.tracer = tracer or get_tracer()
+        self.timings: Dict[str, StageTiming] = {s.name: StageTiming(s.name, needs=s.needs) for s in stages}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._t0 = 0.0
+
+    def _topological_order(self) -> List[str]:
+        for stage in self.stages.values():
+            missing = [d for d in stage.needs if d not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' needs unknown stage(s): {', '.join(missing)}")
+
+        indegree = {name: len(s.needs) for name, s in self.stages.items()}
+        ready = [name for name, n in indegree.items() if n == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for other in self.stages.values():
+                if name in other.needs:
+                    indegree[other.name] -= 1
+                    if indegree[other.name] == 0:
+                        ready.append(other.name)
+        if len(order) != len(self.stages):
+            raise ValueError("Stage graph has a cycle.")
+        return order
+
+    def _emit(self, timing: StageTiming):
+        if self.on_event:
+            self.on_event(timing)
+
+    async def _run_stage(self, stage: Stage) -> Any:
+        timing = self.timings[stage.name]
+        inputs = {}
+        for dep in stage.needs:
+            try:
+                value = await self._tasks[dep]
+            except asyncio.CancelledError:
+                timing.status = "cancelled"
+                raise
+            except Exception:
+                # A required stage failed; the graph is being torn down
+                value = SKIPPED
+            if value is SKIPPED:
+                timing.status = "skipped"
+                timing.error = f"needs '{dep}', which did not complete"
+                timing.start = timing.end = time.perf_counter() - self._t0
+                self._emit(timing)
+                return SKIPPED
+            inputs[dep] = value
+
+        timing.status = "running"
+        timing.start = time.perf_counter() - self._t0
+        self._emit(timing)
+        _current_stage.set(stage.name)
+        try:
+            with self.tracer.span(stage.name, kind="stage", needs=",".join(stage.needs) or None):
+                result = await stage.run(inputs)
+        except asyncio.CancelledError:
+            timing.status = "cancelled"
+            timing.end = time.perf_counter() - self._t0
+            raise
+        except StageSkipped as e:
+            timing.status = "skipped"
+            timing.error = str(e)
+            timing.end = time.perf_counter() - self._t0
+            self._emit(timing)
+            return SKIPPED
+        except Exception as e:
+            timing.status = "failed"
+            timing.error = str(e)
+            timing.end = time.perf_counter() - self._t0
+            self._emit(timing)
+            if stage.optional:
+                return SKIPPED
+            raise
+
+        timing.status = "ok"
+        timing.end = time.perf_counter() - self._t0
+        self._emit(timing)
+        return result
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the graph; returns the outputs of the stages that completed."""
+        self._t0 = time.perf_counter()
+        # Created in dependency order so every stage can await the tasks it needs
+        for name in self.order:
+            self._tasks[name] = asyncio.create_task(self._run_stage(self.stages[name]), name=f"stage:{name}")
+
+        pending = set(self._tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+                # Read every exception so none is reported as never retrieved
+                errors = [t.exception() for t in done if not t.cancelled() and t.exception() is not None]
+                if errors:
+                    raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return {name: task.result() for name, task in self._tasks.items() if task.result() is not SKIPPED}
+
+    def failed(self) -> List[StageTiming]:
+        return [t for t in self.timings.values() if t.status == "failed"]
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Stage timings in start order."""
+        return [t.to_dict() for t in sorted(self.timings.values(), key=lambda t: (t.start, t.name))]
+
+
+def print_stage_timings(report: List[Dict[str, Any]]):
+    table = Table(title="Stage Timings")
+    table.add_column("Stage")
+    table.add_column("Needs")
+    table.add_column("Status")
+    table.add_column("Start (s)", justify="right")
+    table.add_column("Duration (s)", justify="right")
+
+    for t in report:
+        status = "[green]ok[/green]" if t["status"] == "ok" else f"[red]{t['status']}[/red]"
+        table.add_row(t["stage"], ", ".join(t["needs"]) or "-", status, f"{t['start_s']:.2f}", f"{t['duration_s']:.2f}")
+
+    console.print(table)
@@ -0,0 +1,80 @@
+import os
+import json
+import time
+import uuid
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+from config import Config
+
+
+class EventBus:
+    """
+    Pipeline progress events: stage and agent start, retry, backoff, done,
+    with durations and token counts.
+
+    Events go to in-process subscribers (asyncio queues) and are appended to a
+    JSON Lines file that other processes tail; the dashboard streams it to the
+    browser over SSE. The file is started afresh by the first event of each
+    process. Every event carries the process `run_id`, and orchestrators add
+    their `session_id`, so batch episodes can be told apart.
+    """
+
+    def __init__(self, path: Optional[str] = None, queue_size: int = 1000):
+        self.path = path
+        self.queue_size = queue_size
+        self.run_id = uuid.uuid4().hex[:12]
+        self.seq = 0
+        self._subscribers: List[asyncio.Queue] = []
+        self._lock = threading.Lock()
+        self._fh = None
+
+    def _file(self):
+        if self._fh is None and self.path:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._fh = open(self.path, "w", encoding="utf-8")
+        return self._fh
+
+    # Called from the event loop; one short line per event is cheap enough to append inline
+    def publish(self, event_type: str, **fields: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.seq += 1
+            event = {"seq": self.seq, "ts": round(time.time(), 3), "run_id": self.run_id, "type": event_type, **fields}
+            fh = self._file()
+            if fh is not None:
+                fh.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+                fh.flush()
+
+        for queue in list(self._subscribers):
+            # Slow subscribers lose their oldest events rather than holding up the pipeline
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+        return event
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Process-wide bus writing to EVENTS_PATH (empty: in-process subscribers only)."""
+    global _bus
+    if _bus is None:
+        _bus = EventBus(Config.EVENTS_PATH or None)
+    return _bus
@@ -0,0 +1,91 @@
+import json
+from typing import Any, Dict, List, Optional
+
+
+class JsonStreamScanner:
+    """
+    Incremental, bracket-aware scanner for JSON objects embedded in streamed text.
+
+    Text is fed chunk by chunk as model events arrive. Braces are counted only
+    outside JSON strings (escapes included), so objects of any nesting depth and
+    strings containing '{' or '}' are handled. Each time a top-level object
+    closes it is parsed and returned from feed(); prose, markdown fences and
+    brace pairs that are not valid JSON are skipped.
+    """
+
+    def __init__(self):
+        self._buf: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.objects: List[Dict[str, Any]] = []
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        found = []
+        for ch in chunk:
+            if self._depth == 0:
+                if ch == "{":
+                    self._buf = [ch]
+                    self._depth = 1
+                continue
+
+            self._buf.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    obj = self._parse("".join(self._buf))
+                    self._buf = []
+                    if obj is not None:
+                        found.append(obj)
+
+        self.objects.extend(found)
+        return found
+
+    @staticmethod
+    def _parse(text: str) -> Optional[Dict[str, Any]]:
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return obj if isinstance(obj, dict) else None
+
+
+def iter_json_objects(text: str) -> List[Dict[str, Any]]:
+    """
+    All JSON objects in `text`, in order. If a stray '{' in prose swallows the
+    rest of the text, scanning restarts after it so later objects are still found.
+    """
+    pos = 0
+    while True:
+        start = text.find("{", pos)
+        if start < 0:
+            return []
+        scanner = JsonStreamScanner()
+        objects = scanner.feed(text[start:])
+        if objects:
+            return objects
+        pos = start + 1
+
+
+def extract_first_json(text: str) -> Dict[str, Any]:
+    objects = iter_json_objects(text)
+    if not objects:
+        raise ValueError(
+            f"No JSON object found in agent output.\n"
+            f"Preview (first 200 chars): {text[:200]}"
+        )
+    return objects[0]
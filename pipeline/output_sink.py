@@ -0,0 +1,127 @@
+import os
+import json
+import time
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from config import Config
+
+
+def _detach(obj: Any) -> Any:
+    """Copy dict/list containers so later mutation on the loop cannot race the writer thread (leaves are immutable)."""
+    if isinstance(obj, dict):
+        return {k: _detach(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_detach(v) for v in obj]
+    return obj
+
+
+class OutputSink:
+    """
+    Writes output files without blocking the event loop.
+
+    JSON encoding and disk I/O run in a worker thread. Every file is written to a
+    temp file in the same directory and renamed into place, so readers (the
+    dashboard) only ever see complete files. Writes to one path are serialized;
+    while one is in progress, further writes to that path collapse into the
+    newest, so a burst of checkpoints is encoded once, not once per stage.
+
+    `indent=None` writes compact JSON; individual writes can override it.
+    """
+
+    def __init__(self, indent: Optional[int] = 2):
+        self.indent = indent
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next: Dict[str, Callable[[], bytes]] = {}
+        self.writes = 0
+        self.coalesced = 0
+        self.bytes_written = 0
+
+    def _write_atomic(self, path: str, render: Callable[[], bytes]):
+        payload = render()
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp_path, path)
+        self.writes += 1
+        self.bytes_written += len(payload)
+
+    async def _submit(self, path: str, render: Callable[[], bytes]):
+        # Returns once content at least as new as this call's is on disk
+        self._next[path] = render
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            render = self._next.pop(path, None)
+            if render is None:
+                # Superseded and already written by a later call
+                self.coalesced += 1
+                return
+            await asyncio.to_thread(self._write_atomic, path, render)
+
+    async def write_json(self, path: str, data: Any, compact: Optional[bool] = None):
+        indent = self.indent if compact is None else (None if compact else 2)
+        data = _detach(data)
+
+        def render() -> bytes:
+            if indent is None:
+                return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            return json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+
+        await self._submit(path, render)
+
+    async def write_text(self, path: str, text: str):
+        payload = (text or "").encode("utf-8")
+        await self._submit(path, lambda: payload)
+
+
+class LoopStallMonitor:
+    """
+    Measures how long the event loop is blocked.
+
+    A heartbeat task sleeps `interval` seconds at a time; any extra delay before
+    it wakes up is time the loop spent running something else without yielding.
+    Stalls longer than `threshold` are counted.
+    """
+
+    def __init__(self, interval: float = 0.01, threshold: float = 0.05):
+        self.interval = interval
+        self.threshold = threshold
+        self.max_stall = 0.0
+        self.total_stall = 0.0
+        self.stalls = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _beat(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            if lag > self.max_stall:
+                self.max_stall = lag
+            if lag > self.threshold:
+                self.stalls += 1
+                self.total_stall += lag
+
+    async def __aenter__(self) -> "LoopStallMonitor":
+        self._task = asyncio.create_task(self._beat())
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_stall_ms": round(self.max_stall * 1000, 1),
+            "stalls_over_threshold": self.stalls,
+            "stalled_ms": round(self.total_stall * 1000, 1),
+            "threshold_ms": round(self.threshold * 1000, 1),
+        }
+
+
+def default_sink() -> OutputSink:
+    return OutputSink(indent=None if Config.OUTPUT_JSON_FORMAT == "compact" else 2)
@@ -0,0 +1,229 @@
+import re
+import time
+import random
+import asyncio
+import weakref
+import contextlib
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from config import Config
+
+RATE_LIMIT_INDICATORS = (
+    "429",                  # HTTP 429 Too Many Requests
+    "RESOURCE_EXHAUSTED",   # gRPC status code
+    "Rate limit",           # Error message text
+    "quota",                # Quota exceeded messages
+)
+
+_RETRY_DELAY_RE = re.compile(r"""["']?retryDelay["']?\s*[:=]\s*["']?(\d+(?:\.\d+)?)s""")
+_RETRY_AFTER_RE = re.compile(r"retry[- ]?(?:after|in)[:\s]+(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def is_rate_limit_error(err: BaseException) -> bool:
+    if getattr(err, "code", None) == 429:
+        return True
+    text = str(err)
+    return any(indicator in text for indicator in RATE_LIMIT_INDICATORS)
+
+
+def retry_after_seconds(err: BaseException) -> Optional[float]:
+    """Server retry hint from a rate-limit error (google.rpc.RetryInfo or a Retry-After header/message), if any."""
+    response = getattr(err, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            pass
+
+    text = f"{getattr(err, 'details', '')} {err}"
+    for pattern in (_RETRY_DELAY_RE, _RETRY_AFTER_RE):
+        match = pattern.search(text)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class TokenBucket:
+    """
+    Refills `per_minute` units evenly over a minute, holding at most one minute's worth.
+
+    reserve() deducts immediately and returns how long the caller must wait for
+    the balance to be non-negative again, so callers are served in arrival order
+    without polling.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        now = time.monotonic()
+        self._refill(now)
+        # A single request larger than the bucket waits for a full bucket instead of forever
+        self.tokens -= min(amount, self.capacity)
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self, amount: float):
+        self._refill(time.monotonic())
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+@dataclass
+class RateTicket:
+    tokens: int
+    waited: float = 0.0
+
+
+class AdaptiveRateLimiter:
+    """
+    One gate in front of every model call in the process.
+
+    - rpm / tpm: token buckets for requests and tokens per minute (0 disables one).
+    - Concurrency adapts AIMD-style: +1 after a full window of successes, halved
+      on a rate limit (at most once per backoff period, so a burst of 429s from
+      parallel agents counts as one congestion signal).
+    - On a rate limit every caller pauses until the server's retry-after (or an
+      exponential backoff) has passed; retries then add full jitter so they do
+      not hit the API in lockstep.
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+    ):
+        rpm = Config.MODEL_RPM if rpm is None else rpm
+        tpm = Config.MODEL_TPM if tpm is None else tpm
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+
+        self.max_concurrency = max(1, max_concurrency or Config.MAX_CONCURRENT_MODEL_CALLS)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.limit = float(self.max_concurrency)
+        self.backoff_base = Config.BACKOFF_BASE_SECONDS if backoff_base is None else backoff_base
+        self.backoff_max = Config.BACKOFF_MAX_SECONDS if backoff_max is None else backoff_max
+
+        self.in_flight = 0
+        self.pause_until = 0.0
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+        # Counters
+        self.calls = 0
+        self.rate_limited = 0
+        self.max_in_flight = 0
+        self.wait_seconds = 0.0
+
+    async def _wait_for_pause(self) -> float:
+        waited = 0.0
+        while True:
+            delay = self.pause_until - time.monotonic()
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    @contextlib.asynccontextmanager
+    async def slot(self, est_tokens: int = 0) -> AsyncIterator[RateTicket]:
+        """Hold one model call slot; est_tokens is charged to the TPM bucket up front and refunded if the call fails."""
+        start = time.monotonic()
+        await self._wait_for_pause()
+
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        reserved = 0
+        try:
+            wait = self.requests.reserve(1) if self.requests else 0.0
+            if self.tokens and est_tokens:
+                wait = max(wait, self.tokens.reserve(est_tokens))
+                reserved = min(est_tokens, self.tokens.capacity)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            # A 429 may have arrived while this call was queued
+            await self._wait_for_pause()
+
+            ticket = RateTicket(tokens=est_tokens, waited=time.monotonic() - start)
+            self.wait_seconds += ticket.waited
+            self.calls += 1
+            yield ticket
+        except BaseException:
+            # The call never completed (rate limited, failed or cancelled), so settle() will not
+            # run: give back the estimate instead of leaving it as phantom TPM debt
+            if reserved:
+                self.tokens.refund(reserved)
+            raise
+        finally:
+            async with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def settle(self, ticket: RateTicket, used_tokens: Optional[int]):
+        """Correct the TPM bucket once the real token usage of a call is known."""
+        if self.tokens and used_tokens is not None:
+            self.tokens.refund(ticket.tokens - used_tokens)
+
+    async def record_success(self):
+        # Additive increase: one more slot per window of `limit` successful calls
+        self._successes += 1
+        if self._successes >= int(self.limit) and self.limit < self.max_concurrency:
+            self._successes = 0
+            async with self._cond:
+                self.limit = min(self.max_concurrency, self.limit + 1)
+                self._cond.notify_all()
+
+    def on_rate_limited(self, retry_after: Optional[float], attempt: int) -> float:
+        """Register a 429 and return how long the failed call should wait before retrying."""
+        now = time.monotonic()
+        self.rate_limited += 1
+        self._successes = 0
+
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** max(0, attempt - 1)))
+        pause = min(self.backoff_max, retry_after) if retry_after is not None else backoff
+
+        # Multiplicative decrease, once per congestion event
+        if now >= self._last_decrease + pause:
+            self.limit = max(float(self.min_concurrency), self.limit / 2)
+            self._last_decrease = now
+
+        self.pause_until = max(self.pause_until, now + pause)
+        # Full jitter on top of the shared pause spreads the retries out
+        return pause + random.uniform(0, backoff)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "rate_limited": self.rate_limited,
+            "concurrency_limit": int(self.limit),
+            "max_in_flight": self.max_in_flight,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+# One limiter per event loop (asyncio primitives cannot be shared across loops)
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AdaptiveRateLimiter]" = weakref.WeakKeyDictionary()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Process-wide limiter for the running loop, shared by every orchestrator and agent call."""
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = AdaptiveRateLimiter()
+    return limiter
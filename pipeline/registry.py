@@ -0,0 +1,93 @@
+import time
+from typing import Any, Callable, Dict, Optional
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from agents.transcription_agent import build_transcription_agent
+from agents.research_agent import build_research_agent
+from agents.outline_agent import build_outline_agent
+from agents.show_notes_agent import build_show_notes_agent
+from agents.timestamp_agent import build_timestamp_agent
+from agents.quote_agent import build_quote_agent
+from agents.social_agent import build_social_agent
+from agents.seo_agent import build_seo_agent
+from agents.summary_agent import build_summary_agent
+
+APP_NAME = "PodcastAutomator"
+
+AGENT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "transcriber": build_transcription_agent,
+    "researcher": build_research_agent,
+    "outliner": build_outline_agent,
+    "show_notes": build_show_notes_agent,
+    "timestamp_agent": build_timestamp_agent,
+    "quote_agent": build_quote_agent,
+    "social_agent": build_social_agent,
+    "seo_agent": build_seo_agent,
+    "summarizer": build_summary_agent,
+}
+
+
+class AgentRegistry:
+    """
+    Builds each agent lazily on first use and keeps one Runner per agent.
+
+    Runners hold no per-call state, so the same instance serves retries,
+    concurrent calls on different sessions, and every episode of a batch.
+    All runners share the registry's session service.
+    """
+
+    def __init__(self, session_service: Optional[InMemorySessionService] = None, app_name: str = APP_NAME):
+        self.session_service = session_service or InMemorySessionService()
+        self.app_name = app_name
+        self._agents: Dict[str, Any] = {}
+        self._runners: Dict[int, Runner] = {}
+        self.build_seconds: Dict[str, float] = {}
+        self.runner_builds = 0
+
+    def agent(self, key: str) -> Any:
+        agent = self._agents.get(key)
+        if agent is None:
+            start = time.perf_counter()
+            agent = self._agents[key] = AGENT_FACTORIES[key]()
+            self.build_seconds[key] = time.perf_counter() - start
+        return agent
+
+    # Copy of an agent running on another model (e.g. a cheaper one when the budget runs low), built once.
+    # Agents whose model is an object rather than a model name (test doubles) are returned unchanged.
+    def with_model(self, agent: Any, model: str) -> Any:
+        if not isinstance(agent.model, str) or agent.model == model:
+            return agent
+        key = f"{agent.name}@{model}"
+        variant = self._agents.get(key)
+        if variant is None:
+            variant = self._agents[key] = agent.clone(update={"model": model})
+        return variant
+
+    def runner(self, agent: Any) -> Runner:
+        runner = self._runners.get(id(agent))
+        if runner is None or runner.agent is not agent:
+            runner = Runner(agent=agent, app_name=self.app_name, session_service=self.session_service)
+            self._runners[id(agent)] = runner
+            self.runner_builds += 1
+        return runner
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "agents_built": sorted(self._agents),
+            "agent_build_ms": {k: round(v * 1000, 2) for k, v in self.build_seconds.items()},
+            "runners": len(self._runners),
+            "runner_builds": self.runner_builds,
+        }
+
+
+_default_registry: Optional[AgentRegistry] = None
+
+
+def get_registry() -> AgentRegistry:
+    """Process-wide registry shared by every orchestrator (single runs and batch episodes)."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = AgentRegistry()
+    return _default_registry
@@ -0,0 +1,78 @@
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from config import Config
+from pipeline.context import TranscriptContextBuilder
+
+# (prompt, raw_filename) -> validated {"summary": str, "key_points": [str]}
+SummarizeFn = Callable[[str, str], Awaitable[Dict[str, Any]]]
+
+
+def transcript_fingerprint(transcript: str) -> str:
+    return hashlib.sha256((transcript or "").encode("utf-8")).hexdigest()
+
+
+def render_digest(digest: Dict[str, Any]) -> str:
+    points = "\n".join(f"- {p}" for p in digest.get("key_points") or [])
+    return f"{digest.get('summary', '')}\n{points}".strip()
+
+
+class MapReduceSummarizer:
+    """
+    Hierarchical map-reduce summarization for transcripts larger than a model context.
+
+    Map: the transcript is cut into chunks of `chunk_tokens` and every chunk is
+    summarized concurrently (at most `max_concurrency` calls in flight).
+    Reduce: summaries are merged `fan_in` at a time, level by level, until a
+    single episode digest remains. Prompt size per call stays roughly fixed
+    regardless of episode length; depth grows with log_fan_in(chunks).
+    """
+
+    def __init__(self, summarize: SummarizeFn, chunk_tokens: Optional[int] = None, max_concurrency: Optional[int] = None, fan_in: Optional[int] = None):
+        self.summarize = summarize
+        self.chunk_tokens = chunk_tokens or Config.DIGEST_CHUNK_TOKENS
+        self.max_concurrency = max_concurrency or Config.DIGEST_MAX_CONCURRENCY
+        self.fan_in = max(2, fan_in or Config.DIGEST_FAN_IN)
+        self.calls = 0
+
+    async def _bounded(self, slots: asyncio.Semaphore, prompt: str, raw_filename: str) -> Dict[str, Any]:
+        async with slots:
+            self.calls += 1
+            return await self.summarize(prompt, raw_filename)
+
+    async def run(self, transcript: str) -> Dict[str, Any]:
+        slots = asyncio.Semaphore(self.max_concurrency)
+        # Tokenizing a long transcript is CPU-bound, so it runs off the event loop
+        chunks = await asyncio.to_thread(lambda: TranscriptContextBuilder(transcript).chunks(self.chunk_tokens))
+        total = len(chunks)
+
+        # MAP
+        summaries = await asyncio.gather(*(
+            self._bounded(
+                slots,
+                f"Summarize part {i + 1} of {total} of a podcast transcript.\n\nTranscript part:\n{chunk}",
+                f"digest_map_{i:03d}_raw.json",
+            )
+            for i, chunk in enumerate(chunks)
+        ))
+
+        # REDUCE
+        level = 0
+        while len(summaries) > 1:
+            level += 1
+            groups = [summaries[i:i + self.fan_in] for i in range(0, len(summaries), self.fan_in)]
+            summaries = await asyncio.gather(*(
+                self._bounded(
+                    slots,
+                    "Merge these consecutive summaries of one podcast episode into a single summary, in order.\n\n"
+                    + "\n\n".join(f"Summary {j + 1}:\n{render_digest(s)}" for j, s in enumerate(group)),
+                    f"digest_reduce_{level}_{g:03d}_raw.json",
+                )
+                for g, group in enumerate(groups)
+            ))
+
+        digest = dict(summaries[0]) if summaries else {"summary": "", "key_points": []}
+        digest["chunks"] = total
+        digest["levels"] = level
+        return digest
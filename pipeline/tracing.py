@@ -0,0 +1,286 @@
+import os
+import json
+import time
+import uuid
+import asyncio
+import inspect
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import Config
+
+
+@dataclass
+class Span:
+    """One timed operation: a run, stage, agent call, attempt, backoff sleep or tool call."""
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start: float = 0.0              # epoch seconds
+    duration: float = 0.0           # seconds
+    status: str = "ok"              # ok | error | cancelled
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    ended: bool = False
+    _t0: float = field(default=0.0, repr=False)
+    _token: Optional[Token] = field(default=None, repr=False)
+
+    def set(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": round(self.start, 6),
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+# The span enclosing the running code; asyncio tasks inherit it when they are created
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Records nested spans and hands each finished one to the exporters.
+
+    Parents are tracked with a ContextVar, so spans opened in a stage task,
+    an agent call or a tool (including ones run in worker threads through
+    asyncio.to_thread) nest under whatever span was current when the task started.
+    """
+
+    def __init__(self, exporters: Optional[List[Any]] = None):
+        self.exporters = list(exporters or [])
+
+    @staticmethod
+    def current() -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(self, name: str, kind: str = "internal", **attributes: Any) -> Span:
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attributes={k: v for k, v in attributes.items() if v is not None},
+            _t0=time.perf_counter(),
+        )
+        span._token = _current_span.set(span)
+        return span
+
+    # Idempotent; must run in the context (task) that started the span
+    def finish(self, span: Span, error: Optional[BaseException] = None, status: Optional[str] = None):
+        if span.ended:
+            return
+        span.ended = True
+        span.duration = time.perf_counter() - span._t0
+        if error is not None:
+            span.status = "error"
+            span.error = str(error)[:300]
+        if status is not None:
+            span.status = status
+        if span._token is not None:
+            try:
+                _current_span.reset(span._token)
+            except ValueError:
+                # Finished from another context; leave that context's current span alone
+                pass
+            span._token = None
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+        span = self.start_span(name, kind, **attributes)
+        try:
+            yield span
+        except asyncio.CancelledError:
+            self.finish(span, status="cancelled")
+            raise
+        except BaseException as e:
+            self.finish(span, error=e)
+            raise
+        self.finish(span)
+
+
+class JsonlExporter:
+    """One JSON line per finished span; the file is started afresh by the first span of each process."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._fh is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._fh = open(self.path, "w", encoding="utf-8")
+            self._fh.write(line)
+            self._fh.flush()
+
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class PrometheusExporter:
+    """
+    Aggregates spans into Prometheus metrics, written in the text exposition
+    format (e.g. for node_exporter's textfile collector):
+      podcast_span_duration_seconds   histogram by kind and name
+      podcast_spans_total             count by kind, name and status
+      podcast_tokens_total            model tokens by agent and direction (in/out)
+      podcast_attempts_total          model attempts by agent and output mode (schema/extract)
+      podcast_parse_failures_total    attempts whose reply failed to parse or validate, likewise;
+                                      divided by podcast_attempts_total, the parse-failure retry rate
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[Tuple[str, str], List[int]] = {}
+        self.sums: Dict[Tuple[str, str], float] = {}
+        self.counts: Dict[Tuple[str, str, str], int] = {}
+        self.tokens: Dict[Tuple[str, str], int] = {}
+        self.attempts: Dict[Tuple[str, str], int] = {}
+        self.parse_failures: Dict[Tuple[str, str], int] = {}
+
+    def export(self, span: Span):
+        key = (span.kind, span.name)
+        with self._lock:
+            buckets = self.durations.setdefault(key, [0] * (len(DURATION_BUCKETS) + 1))
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if span.duration <= bound:
+                    buckets[i] += 1
+            buckets[-1] += 1
+            self.sums[key] = self.sums.get(key, 0.0) + span.duration
+            status_key = (span.kind, span.name, span.status)
+            self.counts[status_key] = self.counts.get(status_key, 0) + 1
+            for direction in ("in", "out"):
+                n = span.attributes.get(f"tokens_{direction}")
+                if n:
+                    token_key = (span.name, direction)
+                    self.tokens[token_key] = self.tokens.get(token_key, 0) + int(n)
+            if span.kind == "attempt":
+                mode_key = (span.name, str(span.attributes.get("output", "extract")))
+                self.attempts[mode_key] = self.attempts.get(mode_key, 0) + 1
+                if span.attributes.get("parse_failure"):
+                    self.parse_failures[mode_key] = self.parse_failures.get(mode_key, 0) + 1
+
+    def render(self) -> str:
+        lines = [
+            "# HELP podcast_span_duration_seconds Duration of pipeline spans.",
+            "# TYPE podcast_span_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (kind, name), buckets in sorted(self.durations.items()):
+                for bound, count in zip(DURATION_BUCKETS, buckets):
+                    lines.append(f"podcast_span_duration_seconds_bucket{_labels(kind=kind, name=name, le=f'{bound:g}')} {count}")
+                lines.append(f"podcast_span_duration_seconds_bucket{_labels(kind=kind, name=name, le='+Inf')} {buckets[-1]}")
+                lines.append(f"podcast_span_duration_seconds_sum{_labels(kind=kind, name=name)} {self.sums[(kind, name)]:.6f}")
+                lines.append(f"podcast_span_duration_seconds_count{_labels(kind=kind, name=name)} {buckets[-1]}")
+
+            lines += ["# HELP podcast_spans_total Finished spans by status.", "# TYPE podcast_spans_total counter"]
+            for (kind, name, status), count in sorted(self.counts.items()):
+                lines.append(f"podcast_spans_total{_labels(kind=kind, name=name, status=status)} {count}")
+
+            lines += ["# HELP podcast_tokens_total Model tokens by agent and direction.", "# TYPE podcast_tokens_total counter"]
+            for (agent, direction), count in sorted(self.tokens.items()):
+                lines.append(f"podcast_tokens_total{_labels(agent=agent, direction=direction)} {count}")
+
+            lines += ["# HELP podcast_attempts_total Model attempts by agent and output mode.", "# TYPE podcast_attempts_total counter"]
+            for (agent, output), count in sorted(self.attempts.items()):
+                lines.append(f"podcast_attempts_total{_labels(agent=agent, output=output)} {count}")
+
+            lines += ["# HELP podcast_parse_failures_total Attempts whose reply failed to parse or validate.", "# TYPE podcast_parse_failures_total counter"]
+            for (agent, output), count in sorted(self.attempts.items()):
+                lines.append(f"podcast_parse_failures_total{_labels(agent=agent, output=output)} {self.parse_failures.get((agent, output), 0)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write(self.render())
+        os.replace(tmp_path, path)
+
+
+def traced(name: Optional[str] = None, kind: str = "tool") -> Callable:
+    """
+    Decorator recording a span per call of a sync or async function. A returned
+    ToolResult dict with ok=False marks the span as an error. The wrapper keeps
+    the signature and docstring, so ADK builds the same tool declaration.
+    """
+    def decorate(fn: Callable) -> Callable:
+        span_name = name or fn.__name__
+
+        def record(span: Span, result: Any):
+            if isinstance(result, dict) and result.get("ok") is False:
+                span.status = "error"
+                span.error = str(result.get("error"))[:300]
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with get_tracer().span(span_name, kind=kind) as span:
+                    result = await fn(*args, **kwargs)
+                    record(span, result)
+                    return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name, kind=kind) as span:
+                result = fn(*args, **kwargs)
+                record(span, result)
+                return result
+        return wrapper
+
+    return decorate
+
+
+_tracer: Optional[Tracer] = None
+_metrics: Optional[PrometheusExporter] = None
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer exporting to TRACE_PATH (JSONL) and to the Prometheus metrics (METRICS_PATH)."""
+    global _tracer, _metrics
+    if _tracer is None:
+        exporters: List[Any] = []
+        if Config.TRACING_ENABLED:
+            if Config.TRACE_PATH:
+                exporters.append(JsonlExporter(Config.TRACE_PATH))
+            _metrics = PrometheusExporter()
+            exporters.append(_metrics)
+        _tracer = Tracer(exporters)
+    return _tracer
+
+
+def write_metrics(path: Optional[str] = None):
+    """Write the metrics aggregated so far (a no-op when tracing is disabled)."""
+    path = path if path is not None else Config.METRICS_PATH
+    if _metrics is not None and path:
+        _metrics.write(path)
@@ -0,0 +1,53 @@
+import os
+import asyncio
+import tempfile
+
+from tools import audio_tool
+from tools.audio_chunker import TranscriptSegment, stitch_segments
+from tools.stub_genai import ScriptedResponder, StubGenAIClient, synth_wav
+
+# Long-audio transcription against the offline GenAI stub: python test_audio_chunking.py (or pytest)
+
+
+def test_overlap_words_are_dropped_once():
+    first = [TranscriptSegment(0, "welcome to the show today we talk about"), TranscriptSegment(5, "rate limits and retries")]
+    second = [TranscriptSegment(8, "about rate limits and retries"), TranscriptSegment(12, "in production systems")]
+    merged = stitch_segments([first, second])
+    words = " ".join(s.text for s in merged).split()
+    assert words == "welcome to the show today we talk about rate limits and retries in production systems".split()
+    assert merged[-1].start == 12
+
+
+def test_no_overlap_keeps_every_word():
+    first = [TranscriptSegment(0, "one two three")]
+    second = [TranscriptSegment(4, "four five six")]
+    assert [s.text for s in stitch_segments([first, second])] == ["one two three", "four five six"]
+
+
+def test_chunked_transcript_matches_the_script():
+    with tempfile.TemporaryDirectory() as workdir:
+        wav_path = os.path.join(workdir, "episode.wav")
+        synth_wav(wav_path, 130)
+        client = StubGenAIClient(responder=ScriptedResponder(wav_path), processing_polls=2)
+        result = asyncio.run(audio_tool.transcribe_audio_chunked_async(
+            wav_path, chunk_seconds=30, overlap_seconds=4, max_workers=3, client=client, poll_interval=0.01,
+        ))
+
+    assert result["ok"], result.get("error")
+    chunks = result["meta"]["chunks"]
+    assert len(chunks) > 1
+    # Neighbouring chunks overlap, so the stub transcribes some words twice
+    assert all(nxt["start"] < prev["end"] for prev, nxt in zip(chunks, chunks[1:]))
+    words = " ".join(s["text"] for s in result["data"]["segments"]).split()
+    assert words == [f"w{n}" for n in range(int(130 * 2.5))]
+    # Timecodes are absolute, not relative to each chunk
+    assert result["data"]["segments"][-1]["start"] > chunks[-1]["start"]
+    assert client.uploads == len(chunks)
+    assert client.max_in_flight <= 3
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print("ok", name)
@@ -0,0 +1,63 @@
+import asyncio
+
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+from agents.fake_llm import CANNED_RESPONSES, FakeBackend, FakeLlm
+from pipeline.json_stream import JsonStreamScanner, extract_first_json, iter_json_objects
+
+# Incremental JSON scanning of streamed agent output: python test_json_stream.py (or pytest)
+
+
+def test_object_split_across_chunks_is_returned_when_it_closes():
+    scanner = JsonStreamScanner()
+    chunks = ['Here you go:\n```json\n{"title": "Ep', 'isode {1}", "tags": ["a", ', '"b"], "meta": {"n": 2}}', "\n```"]
+    found = [scanner.feed(chunk) for chunk in chunks]
+    assert found[:2] == [[], []]
+    assert found[2] == [{"title": "Episode {1}", "tags": ["a", "b"], "meta": {"n": 2}}]
+    assert scanner.objects == found[2]
+
+
+def test_escaped_quotes_and_braces_inside_strings():
+    scanner = JsonStreamScanner()
+    text = '{"quote": "She said \\"}{\\" twice", "ok": true}'
+    for ch in text:
+        scanner.feed(ch)
+    assert scanner.objects == [{"quote": 'She said "}{" twice', "ok": True}]
+
+
+def test_invalid_brace_pairs_are_skipped():
+    assert JsonStreamScanner().feed("{not json} then {\"a\": 1}") == [{"a": 1}]
+    # A stray '{' in prose would swallow the rest; scanning restarts after it
+    assert iter_json_objects('Use {curly braces like this. {"b": 2}') == [{"b": 2}]
+    try:
+        extract_first_json("no json here")
+    except ValueError as e:
+        assert "No JSON object found" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_fake_model_stream_parses_to_the_canned_reply():
+    backend = FakeBackend(latency=0.0, chunk_chars=5)
+    llm = FakeLlm(model="fake-SocialMediaAgent", agent_name="SocialMediaAgent", backend=backend)
+    request = LlmRequest(contents=[types.Content(role="user", parts=[types.Part(text="Write posts.")])])
+
+    async def collect():
+        scanner, partial_chunks = JsonStreamScanner(), 0
+        async for response in llm.generate_content_async(request, stream=True):
+            if response.partial:
+                partial_chunks += 1
+                scanner.feed(response.content.parts[0].text)
+        return scanner, partial_chunks
+
+    scanner, partial_chunks = asyncio.run(collect())
+    assert partial_chunks > 10
+    assert scanner.objects == [CANNED_RESPONSES["SocialMediaAgent"]]
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print("ok", name)
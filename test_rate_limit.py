@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import tempfile
+import time
+
+from config import Config
+from agents.fake_llm import CANNED_RESPONSES, FakeBackend, use_fake_models
+from agents.schemas import OutlineOutput
+from pipeline.rate_limit import AdaptiveRateLimiter, is_rate_limit_error, retry_after_seconds
+from pipeline.registry import AgentRegistry
+
+# 429 handling against the offline fake model: python test_rate_limit.py (or pytest)
+
+# No event log, trace or session database for these runs
+QUIET_CONFIG = {"EVENTS_PATH": "", "TRACING_ENABLED": False, "SESSION_BACKEND": "memory"}
+
+
+@contextlib.contextmanager
+def isolated_config(**overrides):
+    """Config overrides for one test, restored afterwards so other tests see the defaults."""
+    saved = {name: getattr(Config, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(Config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(Config, name, value)
+
+
+class RejectFirstCalls(FakeBackend):
+    """Rate limits the first `rejections` calls, then answers normally."""
+
+    def __init__(self, rejections: int, **kwargs):
+        super().__init__(**kwargs)
+        self.rejections = rejections
+
+    def should_reject(self) -> bool:
+        return self.calls <= self.rejections
+
+
+def test_fake_429_is_recognised_with_its_retry_delay():
+    err = FakeBackend(retry_after=0.3).rate_limit_error()
+    assert is_rate_limit_error(err)
+    assert retry_after_seconds(err) == 0.3
+    assert not is_rate_limit_error(FakeBackend().server_error())
+
+
+def test_limiter_halves_concurrency_once_per_congestion_event():
+    limiter = AdaptiveRateLimiter(rpm=0, tpm=0, max_concurrency=8, backoff_base=0.1, backoff_max=1.0)
+    wait = limiter.on_rate_limited(0.3, attempt=1)
+    assert 0.3 <= wait <= 0.4
+    assert limiter.stats()["concurrency_limit"] == 4
+    # A burst of 429s from parallel callers within the pause counts once
+    limiter.on_rate_limited(0.3, attempt=1)
+    assert limiter.stats()["concurrency_limit"] == 4
+    assert limiter.pause_until > time.monotonic()
+
+
+def test_rejected_call_gives_back_its_tpm_reservation():
+    limiter = AdaptiveRateLimiter(rpm=0, tpm=6000, max_concurrency=4, backoff_base=0.01, backoff_max=0.05)
+
+    async def rejected():
+        async with limiter.slot(4000):
+            raise FakeBackend(retry_after=0.01).rate_limit_error()
+
+    try:
+        asyncio.run(rejected())
+    except Exception as e:
+        assert is_rate_limit_error(e)
+    else:
+        raise AssertionError("expected the rate limit error to surface")
+    # The 429'd call used no tokens, so the next call is not held back by its estimate
+    assert limiter.tokens.tokens > 5900
+
+
+def _run_outline(backend: FakeBackend, limiter: AdaptiveRateLimiter):
+    from orchestrator import PodcastOrchestrator
+
+    registry = AgentRegistry()
+    use_fake_models(registry, backend)
+    with isolated_config(**QUIET_CONFIG), tempfile.TemporaryDirectory() as output_dir:
+        orchestrator = PodcastOrchestrator(output_dir=output_dir, rate_limiter=limiter, show_progress=False, use_cache=False, registry=registry)
+
+        async def run():
+            try:
+                return await orchestrator._run_agent(orchestrator.outliner, "Outline an episode on rate limits.", "outline_raw.json", expected_schema=OutlineOutput)
+            finally:
+                await orchestrator._close_sessions()
+
+        return orchestrator, asyncio.run(run())
+
+
+def test_agent_call_backs_off_and_retries_after_429():
+    backend = RejectFirstCalls(2, latency=0.0, retry_after=0.05)
+    limiter = AdaptiveRateLimiter(rpm=0, tpm=0, max_concurrency=4, backoff_base=0.01, backoff_max=0.2)
+    start = time.perf_counter()
+    orchestrator, result = _run_outline(backend, limiter)
+
+    assert result == CANNED_RESPONSES["OutlineAgent"]
+    assert backend.rate_limited == 2 and backend.calls == 3
+    assert limiter.rate_limited == 2
+    assert orchestrator.model_calls == 3
+    # Waited out the server's retryDelay before each retry
+    assert time.perf_counter() - start >= 0.1
+    assert orchestrator.parse_failures == 0
+
+
+def test_agent_call_gives_up_after_max_rate_limit_retries():
+    backend = RejectFirstCalls(10 ** 6, latency=0.0, retry_after=0.01)
+    limiter = AdaptiveRateLimiter(rpm=0, tpm=0, max_concurrency=4, backoff_base=0.01, backoff_max=0.05)
+    try:
+        _run_outline(backend, limiter)
+    except Exception as e:
+        assert is_rate_limit_error(e)
+    else:
+        raise AssertionError("expected the rate limit error to surface")
+    assert backend.rate_limited == Config.MAX_RATE_LIMIT_RETRIES + 1
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print("ok", name)
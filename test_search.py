@@ -0,0 +1,61 @@
+import asyncio
+import tempfile
+
+from config import Config
+from tools import search_tool
+from tools.search_fixture_server import render_results_page, start_fixture_server
+
+# web_search against the local DuckDuckGo fixture: python test_search.py (or pytest)
+
+
+def test_parse_results_reads_title_url_and_snippet():
+    results = search_tool.parse_results(render_results_page("AI & podcasts", count=5), 3)
+    assert len(results) == 3
+    assert results[0] == {
+        "title": "AI & podcasts — result 1",
+        "url": "https://example.com/ai-&-podcasts/1",
+        "snippet": "Snippet 1 about AI & podcasts.",
+    }
+    assert search_tool.parse_results("<html><body>No results.</body></html>", 3) == []
+
+
+def test_web_search_fetches_once_then_serves_from_cache():
+    server, endpoint = start_fixture_server()
+    handler = server.RequestHandlerClass
+    endpoint_before, cache_dir_before = Config.SEARCH_ENDPOINT, Config.SEARCH_CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            Config.SEARCH_ENDPOINT, Config.SEARCH_CACHE_DIR = endpoint, cache_dir
+            search_tool._cache = None
+
+            async def run():
+                first = await search_tool.web_search("remote work", 3)
+                again = await search_tool.web_search("remote work", 3)
+                recent = await search_tool.web_search("remote work", 3, recency_days=7)
+                many = await search_tool.web_search_many(["ai ethics", "remote work"], 3)
+                return first, again, recent, many
+
+            first, again, recent, many = asyncio.run(run())
+    finally:
+        server.shutdown()
+        Config.SEARCH_ENDPOINT, Config.SEARCH_CACHE_DIR = endpoint_before, cache_dir_before
+        search_tool._cache = None
+
+    assert first["ok"] and len(first["data"]) == 3
+    assert first["data"][0]["url"] == "https://example.com/remote-work/1"
+    assert not first["meta"].get("cached")
+    assert again["meta"]["cached"] and again["data"] == first["data"]
+    # The recency filter is part of the cache key and is sent as DuckDuckGo's df parameter
+    assert not recent["meta"].get("cached")
+    assert recent["data"][0]["snippet"].endswith("(past w).")
+    assert many["ok"] and many["meta"] == {"queries": 2, "succeeded": 2}
+    assert [entry["query"] for entry in many["data"]] == ["ai ethics", "remote work"]
+    # remote work, its recent variant and ai ethics; every repeat came from the cache
+    assert handler.requests_served == 3
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print("ok", name)
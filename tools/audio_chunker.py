@@ -0,0 +1,192 @@
+import os
+import re
+import math
+import wave
+import array
+import shutil
+import subprocess
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Audio is decoded with the stdlib `wave` module. Other formats (.mp3, .m4a)
+# are converted to 16 kHz mono WAV with ffmpeg when it is installed.
+
+ENERGY_WINDOW_SECONDS = 0.1
+
+
+@dataclass
+class AudioChunk:
+    index: int
+    start: float
+    end: float
+    path: str
+
+
+@dataclass
+class TranscriptSegment:
+    start: float
+    text: str
+
+
+def ffmpeg_available() -> bool:
+    return shutil.which("ffmpeg") is not None
+
+
+def to_wav(filepath: str, workdir: str) -> str:
+    """Return a WAV path for `filepath`, converting with ffmpeg if needed."""
+    if filepath.lower().endswith(".wav"):
+        return filepath
+    if not ffmpeg_available():
+        raise RuntimeError("ffmpeg is required to split non-WAV audio.")
+
+    out_path = os.path.join(workdir, "source.wav")
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", filepath, "-ac", "1", "-ar", "16000", out_path],
+        check=True,
+    )
+    return out_path
+
+
+def wav_duration(path: str) -> float:
+    with wave.open(path, "rb") as wf:
+        return wf.getnframes() / float(wf.getframerate())
+
+
+def _window_energy(wf: wave.Wave_read, start_frame: int, n_frames: int) -> float:
+    wf.setpos(start_frame)
+    raw = wf.readframes(n_frames)
+    if wf.getsampwidth() != 2 or not raw:
+        return 0.0
+    samples = array.array("h", raw)[::wf.getnchannels()]
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+def _quietest_point(wf: wave.Wave_read, target: float, search_seconds: float, total: float) -> float:
+    """Quietest ENERGY_WINDOW_SECONDS window within +/- search_seconds of target."""
+    if wf.getsampwidth() != 2 or search_seconds <= 0:
+        return target
+
+    rate = wf.getframerate()
+    window = max(1, int(ENERGY_WINDOW_SECONDS * rate))
+    lo = max(0.0, target - search_seconds)
+    hi = min(total, target + search_seconds)
+
+    best_t, best_e = target, None
+    t = lo
+    while t + ENERGY_WINDOW_SECONDS <= hi:
+        e = _window_energy(wf, int(t * rate), window)
+        if best_e is None or e < best_e:
+            best_t, best_e = t + ENERGY_WINDOW_SECONDS / 2, e
+        t += ENERGY_WINDOW_SECONDS
+    return best_t
+
+
+def plan_chunks(wav_path: str, chunk_seconds: float, overlap_seconds: float, search_seconds: float = 10.0) -> List[Tuple[float, float]]:
+    """
+    Split [0, duration] into windows of about `chunk_seconds`.
+    Each cut is moved to the quietest point near the target so words are not split,
+    and every chunk after the first starts `overlap_seconds` before the previous cut.
+    """
+    with wave.open(wav_path, "rb") as wf:
+        total = wf.getnframes() / float(wf.getframerate())
+        spans: List[Tuple[float, float]] = []
+        start = 0.0
+        while start < total:
+            target = start + chunk_seconds
+            if target >= total - overlap_seconds:
+                spans.append((start, total))
+                break
+            cut = _quietest_point(wf, target, min(search_seconds, chunk_seconds / 4), total)
+            spans.append((start, cut))
+            start = max(cut - overlap_seconds, start + overlap_seconds)
+    return spans
+
+
+def write_chunks(wav_path: str, spans: List[Tuple[float, float]], workdir: str) -> List[AudioChunk]:
+    chunks = []
+    with wave.open(wav_path, "rb") as wf:
+        params = wf.getparams()
+        rate = wf.getframerate()
+        for i, (start, end) in enumerate(spans):
+            wf.setpos(int(start * rate))
+            frames = wf.readframes(int((end - start) * rate))
+            path = os.path.join(workdir, f"chunk_{i:04d}.wav")
+            with wave.open(path, "wb") as out:
+                out.setparams(params)
+                out.writeframes(frames)
+            chunks.append(AudioChunk(index=i, start=start, end=end, path=path))
+    return chunks
+
+
+# ----------------------------------------------------------- STITCHING ----------------------------------------------------------
+
+_TIMECODE = re.compile(r"^\s*\[?(?:(\d{1,2}):)?(\d{1,2}):(\d{2})(?:\.\d+)?\]?\s*[-–:]?\s*(.*)$")
+
+
+def parse_timecoded(text: str, offset: float = 0.0) -> List[TranscriptSegment]:
+    """Parse '[MM:SS] text' / '[HH:MM:SS] text' lines; untimed lines join the previous segment."""
+    segments: List[TranscriptSegment] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        m = _TIMECODE.match(line)
+        if m and m.group(4):
+            h, mnt, sec = int(m.group(1) or 0), int(m.group(2)), int(m.group(3))
+            segments.append(TranscriptSegment(start=offset + h * 3600 + mnt * 60 + sec, text=m.group(4).strip()))
+        elif segments:
+            segments[-1].text = f"{segments[-1].text} {line}"
+        else:
+            segments.append(TranscriptSegment(start=offset, text=line))
+    return segments
+
+
+def _norm(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def _drop_leading_words(segments: List[TranscriptSegment], n: int) -> List[TranscriptSegment]:
+    out = []
+    for seg in segments:
+        words = seg.text.split()
+        if n >= len(words):
+            n -= len(words)
+            continue
+        out.append(TranscriptSegment(start=seg.start, text=" ".join(words[n:])))
+        n = 0
+    return out
+
+
+def overlap_length(prev_words: List[str], next_words: List[str], max_words: int, min_match: int = 3) -> int:
+    """Longest k (>= min_match) such that the last k words of prev equal the first k of next."""
+    prev = [_norm(w) for w in prev_words[-max_words:]]
+    nxt = [_norm(w) for w in next_words[:max_words]]
+    for k in range(min(len(prev), len(nxt)), min_match - 1, -1):
+        if prev[-k:] == nxt[:k]:
+            return k
+    return 0
+
+
+def stitch_segments(chunks: List[List[TranscriptSegment]], max_overlap_words: int = 80) -> List[TranscriptSegment]:
+    """Concatenate per-chunk segments, removing words repeated in the overlap between chunks."""
+    merged: List[TranscriptSegment] = []
+    for segments in chunks:
+        if merged and segments:
+            prev_words = " ".join(s.text for s in merged[-20:]).split()
+            next_words = " ".join(s.text for s in segments[:20]).split()
+            k = overlap_length(prev_words, next_words, max_overlap_words)
+            if k:
+                segments = _drop_leading_words(segments, k)
+        merged.extend(segments)
+    return merged
+
+
+def format_timecode(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def render_transcript(segments: List[TranscriptSegment]) -> str:
+    return "\n".join(f"[{format_timecode(s.start)}] {s.text}" for s in segments)
@@ -1,23 +1,94 @@
 import time
-from typing import Dict
+import asyncio
+import tempfile
+import threading
+import weakref
+from typing import Any, Dict, Optional
 from google.genai import Client, types
 from config import Config
+from pipeline.tracing import traced
 from .adk_tool_wrappers import success, failure
+from . import audio_chunker
 
-def transcribe_audio(filepath: str, poll_interval: float = 2.0, timeout: int = 300) -> dict:
+TRANSCRIBE_PROMPT = (
+    "Please generate a verbatim transcript of the provided audio file. "
+    "Return only the transcript text in the response."
+)
+
+CHUNK_TRANSCRIBE_PROMPT = (
+    "Please generate a verbatim transcript of the provided audio clip. "
+    "Start every line with a [MM:SS] timestamp relative to the start of this clip. "
+    "Return only the transcript lines in the response."
+)
+
+
+_client: Optional[Any] = None
+_client_lock = threading.Lock()
+
+# Upload slots are per event loop (asyncio primitives cannot be shared across loops)
+_upload_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def get_client() -> Any:
     """
-    Upload audio file and request a verbatim transcript via GenAI.
-    Explicit signature: filepath (string).
-    Returns ToolResult-style dict from adk_tool_wrappers.
+    Process-wide GenAI client for transcription, created once and reused.
+    GENAI_STUB=1 returns the offline stub.
     """
-    if not Config.API_KEY:
-        return failure("GOOGLE_API_KEY not set in environment.")
+    global _client
+    with _client_lock:
+        if _client is None:
+            if Config.GENAI_STUB:
+                from .stub_genai import StubGenAIClient
+                _client = StubGenAIClient()
+            else:
+                _client = Client(api_key=Config.API_KEY)
+        return _client
 
-    try:
-        client = Client(api_key=Config.API_KEY)
-    except Exception as e:
-        return failure(f"Failed to create GenAI client: {e}")
 
+def _upload_slot() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _upload_slots.get(loop)
+    if slots is None:
+        slots = _upload_slots[loop] = asyncio.Semaphore(Config.TRANSCRIBE_MAX_UPLOADS)
+    return slots
+
+
+def _request_contents(file_ref: Any, prompt: str) -> list:
+    return [
+        types.Content(
+            role="user",
+            parts=[
+                types.Part(file_data=types.FileData(
+                    mime_type=file_ref.mime_type,
+                    file_uri=file_ref.uri
+                )),
+                types.Part(text=prompt)
+            ]
+        )
+    ]
+
+
+def _response_text(response: Any) -> str:
+    text = getattr(response, "text", None)
+    if not text:
+        try:
+            text = ""
+            if getattr(response, "content", None):
+                for c in response.content:
+                    if getattr(c, "parts", None):
+                        for p in c.parts:
+                            if getattr(p, "text", None):
+                                text += p.text
+        except Exception:
+            pass
+    return text or ""
+
+
+def _file_state(file_ref: Any) -> str:
+    return getattr(file_ref.state, "name", str(file_ref.state)).upper()
+
+
+def _transcribe_file(client: Any, filepath: str, prompt: str, poll_interval: float, timeout: int) -> dict:
     # Upload file
     try:
         file_ref = client.files.upload(file=filepath)
@@ -31,7 +102,7 @@ def transcribe_audio(filepath: str, poll_interval: float = 2.0, timeout: int = 3
         except Exception as e:
             return failure(f"Error polling file status: {e}")
 
-        state = getattr(file_ref.state, "name", str(file_ref.state)).upper()
+        state = _file_state(file_ref)
         if state == "ACTIVE":
             break
         if state == "FAILED":
@@ -42,42 +113,168 @@ def transcribe_audio(filepath: str, poll_interval: float = 2.0, timeout: int = 3
 
     # transcript generation
     try:
-        response = client.models.generate_content(
-            model=Config.MODEL_NAME,
-            contents=[
-                types.Content(
-                    role="user",
-                    parts=[
-                        types.Part(file_data=types.FileData(
-                            mime_type=file_ref.mime_type,
-                            file_uri=file_ref.uri
-                        )),
-                        types.Part(text=(
-                            "Please generate a verbatim transcript of the provided audio file. "
-                            "Return only the transcript text in the response."
-                        ))
-                    ]
-                )
-            ],
-        )
+        response = client.models.generate_content(model=Config.MODEL_NAME, contents=_request_contents(file_ref, prompt))
     except Exception as e:
         return failure(f"Error generating transcript: {e}")
 
     # Extract transcript text
-    text = getattr(response, "text", None)
+    text = _response_text(response)
     if not text:
+        return failure("No transcript text returned from model.")
+
+    return success({"transcript": text}, meta={"source_uri": getattr(file_ref, "uri", "")})
+
+
+@traced("transcribe_file")
+async def _transcribe_file_async(client: Any, filepath: str, prompt: str, poll_interval: float, timeout: int, max_poll_interval: float) -> dict:
+    # Upload and processing wait hold an upload slot; generation runs outside it
+    async with _upload_slot():
         try:
-            text = ""
-            if getattr(response, "content", None):
-                for c in response.content:
-                    if getattr(c, "parts", None):
-                        for p in c.parts:
-                            if getattr(p, "text", None):
-                                text += p.text
-        except Exception:
-            pass
+            file_ref = await client.aio.files.upload(file=filepath)
+        except Exception as e:
+            return failure(f"Error uploading file: {e}")
+
+        # Poll without blocking the loop, backing off from poll_interval up to max_poll_interval
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = poll_interval
+        while True:
+            try:
+                file_ref = await client.aio.files.get(name=file_ref.name)
+            except Exception as e:
+                return failure(f"Error polling file status: {e}")
 
+            state = _file_state(file_ref)
+            if state == "ACTIVE":
+                break
+            if state == "FAILED":
+                return failure("Audio processing failed on provider side.")
+            if loop.time() + delay > deadline:
+                return failure("Timeout waiting for audio processing.")
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, max_poll_interval)
+
+    # transcript generation
+    try:
+        response = await client.aio.models.generate_content(model=Config.MODEL_NAME, contents=_request_contents(file_ref, prompt))
+    except Exception as e:
+        return failure(f"Error generating transcript: {e}")
+
+    text = _response_text(response)
     if not text:
         return failure("No transcript text returned from model.")
 
     return success({"transcript": text}, meta={"source_uri": getattr(file_ref, "uri", "")})
+
+
+@traced()
+def transcribe_audio(filepath: str, poll_interval: float = 2.0, timeout: int = 300) -> dict:
+    """
+    Upload audio file and request a verbatim transcript via GenAI.
+    Explicit signature: filepath (string).
+    Returns ToolResult-style dict from adk_tool_wrappers.
+    """
+    if not Config.API_KEY and not Config.GENAI_STUB:
+        return failure("GOOGLE_API_KEY not set in environment.")
+
+    try:
+        client = get_client()
+    except Exception as e:
+        return failure(f"Failed to create GenAI client: {e}")
+
+    return _transcribe_file(client, filepath, TRANSCRIBE_PROMPT, poll_interval, timeout)
+
+
+@traced()
+async def transcribe_audio_async(filepath: str, poll_interval: float = 1.0, timeout: int = 300, max_poll_interval: float = 10.0, client: Optional[Any] = None) -> dict:
+    """
+    asyncio-native transcribe_audio: shares one client, polls with asyncio.sleep
+    and exponential backoff, and limits concurrent uploads (TRANSCRIBE_MAX_UPLOADS).
+    """
+    if client is None and not Config.API_KEY and not Config.GENAI_STUB:
+        return failure("GOOGLE_API_KEY not set in environment.")
+
+    try:
+        client = client or get_client()
+    except Exception as e:
+        return failure(f"Failed to create GenAI client: {e}")
+
+    return await _transcribe_file_async(client, filepath, TRANSCRIBE_PROMPT, poll_interval, timeout, max_poll_interval)
+
+
+@traced()
+async def transcribe_audio_chunked_async(
+    filepath: str,
+    chunk_seconds: Optional[float] = None,
+    overlap_seconds: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    client: Optional[Any] = None,
+    poll_interval: float = 1.0,
+    timeout: int = 300,
+    max_poll_interval: float = 10.0,
+) -> dict:
+    """
+    Transcribe long audio as overlapping chunks cut near silences, concurrently.
+    Chunk transcripts are shifted by their start offset, words repeated in the
+    overlaps are removed, and the result carries absolute [HH:MM:SS] timecodes.
+    Audio no longer than one chunk (or that cannot be decoded) is sent in one call.
+    """
+    chunk_seconds = chunk_seconds or Config.TRANSCRIBE_CHUNK_SECONDS
+    overlap_seconds = Config.TRANSCRIBE_CHUNK_OVERLAP_SECONDS if overlap_seconds is None else overlap_seconds
+    max_workers = max_workers or Config.TRANSCRIBE_MAX_WORKERS
+
+    if client is None and not Config.API_KEY and not Config.GENAI_STUB:
+        return failure("GOOGLE_API_KEY not set in environment.")
+
+    try:
+        client = client or get_client()
+    except Exception as e:
+        return failure(f"Failed to create GenAI client: {e}")
+
+    with tempfile.TemporaryDirectory(prefix="podcast_chunks_") as workdir:
+        # Decoding and splitting are blocking file work, kept off the loop
+        try:
+            wav_path = await asyncio.to_thread(audio_chunker.to_wav, filepath, workdir)
+            duration = audio_chunker.wav_duration(wav_path)
+        except Exception:
+            # Undecodable here (e.g. mp3 without ffmpeg): let the provider handle the whole file
+            return await _transcribe_file_async(client, filepath, TRANSCRIBE_PROMPT, poll_interval, timeout, max_poll_interval)
+
+        if duration <= chunk_seconds + overlap_seconds:
+            return await _transcribe_file_async(client, filepath, TRANSCRIBE_PROMPT, poll_interval, timeout, max_poll_interval)
+
+        spans = await asyncio.to_thread(audio_chunker.plan_chunks, wav_path, chunk_seconds, overlap_seconds)
+        chunks = await asyncio.to_thread(audio_chunker.write_chunks, wav_path, spans, workdir)
+
+        workers = asyncio.Semaphore(max_workers)
+
+        async def transcribe_chunk(chunk: audio_chunker.AudioChunk) -> dict:
+            async with workers:
+                return await _transcribe_file_async(client, chunk.path, CHUNK_TRANSCRIBE_PROMPT, poll_interval, timeout, max_poll_interval)
+
+        results = await asyncio.gather(*(transcribe_chunk(c) for c in chunks))
+
+    chunk_segments = []
+    for chunk, res in zip(chunks, results):
+        if not res.get("ok"):
+            return failure(f"Chunk {chunk.index} ({chunk.start:.0f}s-{chunk.end:.0f}s) failed: {res.get('error')}")
+        chunk_segments.append(audio_chunker.parse_timecoded(res["data"]["transcript"], offset=chunk.start))
+
+    segments = audio_chunker.stitch_segments(chunk_segments)
+    chunk_meta: Dict[str, Any] = {
+        "chunked": True,
+        "duration": round(duration, 2),
+        "chunks": [{"index": c.index, "start": round(c.start, 2), "end": round(c.end, 2)} for c in chunks],
+    }
+    return success(
+        {
+            "transcript": audio_chunker.render_transcript(segments),
+            "segments": [{"start": round(s.start, 2), "text": s.text} for s in segments],
+        },
+        meta=chunk_meta,
+    )
+
+
+def transcribe_audio_chunked(filepath: str, **kwargs) -> dict:
+    """Blocking wrapper around transcribe_audio_chunked_async for scripts outside an event loop."""
+    return asyncio.run(transcribe_audio_chunked_async(filepath, **kwargs))
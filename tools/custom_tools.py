@@ -1,12 +1,14 @@
 import os
 import json
 from typing import Any
+from pipeline.tracing import traced
 from .adk_tool_wrappers import success, failure
 
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "outputs")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # Save content to outputs/
+@traced()
 def save_to_file(filename: str, content: str) -> dict:
     try:
         if not filename or not isinstance(filename, str):
@@ -0,0 +1,96 @@
+"""
+Local stand-in for the DuckDuckGo HTML endpoint, for tests and offline runs.
+
+    python -m tools.search_fixture_server --port 8765
+    SEARCH_ENDPOINT=http://127.0.0.1:8765/html/ python main.py --topic "..."
+
+Results are generated deterministically from the query, so repeated searches
+return the same page.
+"""
+import time
+import html
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+from urllib.parse import parse_qs, urlparse
+
+RESULT_TEMPLATE = """
+<div class="result results_links results_links_deep web-result">
+  <div class="links_main links_deep result__body">
+    <h2 class="result__title"><a rel="nofollow" class="result__a" href="{url}">{title}</a></h2>
+    <a class="result__snippet" href="{url}">{snippet}</a>
+  </div>
+</div>
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>{query} at DuckDuckGo</title></head>
+<body><div id="links" class="results">{results}</div></body></html>
+"""
+
+
+def render_results_page(query: str, count: int = 10, recency: str = "") -> str:
+    slug = "-".join(query.lower().split()) or "empty"
+    results = "".join(
+        RESULT_TEMPLATE.format(
+            url=html.escape(f"https://example.com/{slug}/{i}"),
+            title=html.escape(f"{query} — result {i}"),
+            snippet=html.escape(f"Snippet {i} about {query}{' (past ' + recency + ')' if recency else ''}."),
+        )
+        for i in range(1, count + 1)
+    )
+    return PAGE_TEMPLATE.format(query=html.escape(query), results=results)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    result_count = 10
+    requests_served = 0
+
+    def _respond(self, params: dict):
+        type(self).requests_served += 1
+        if self.latency:
+            time.sleep(self.latency)
+        query = params.get("q", [""])[0]
+        recency = params.get("df", [""])[0]
+        body = render_results_page(query, self.result_count, recency).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(parse_qs(urlparse(self.path).query))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._respond(parse_qs(self.rfile.read(length).decode("utf-8")))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve fixture pages on a background thread; returns (server, endpoint URL). Call server.shutdown() to stop."""
+    handler = type("Handler", (FixtureHandler,), {"latency": latency})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/html/"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local DuckDuckGo-style search fixture")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each response")
+    args = parser.parse_args()
+
+    handler = type("Handler", (FixtureHandler,), {"latency": args.latency})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Search fixture on http://{args.host}:{args.port}/html/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -1,28 +1,126 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+import asyncio
+import weakref
 from typing import List, Dict, Optional
+
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import Config
+from memory.result_cache import ResultCache
+from pipeline.tracing import traced
 from .adk_tool_wrappers import success, failure
 
-def web_search(query: str, num_results: int = 3, recency_days: Optional[int] = None) -> dict:
+HEADERS = {"User-Agent": "podcast-lifecycle-agent/1.0 (+https://example.local)"}
+
+# lxml (in requirements.txt) is several times faster than the pure-Python parser, which stays as a fallback
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only result blocks are built into the tree; the rest of the page is skipped while parsing.
+# Matched by regex because the strainer sees the raw multi-class attribute string.
+RESULT_STRAINER = SoupStrainer("div", class_=re.compile(r"\bresult__body\b"))
+
+# One pooled client per event loop (httpx connections cannot move between loops)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_cache: Optional[ResultCache] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=Config.SEARCH_TIMEOUT,
+            limits=httpx.Limits(max_connections=Config.SEARCH_MAX_CONNECTIONS, max_keepalive_connections=Config.SEARCH_MAX_CONNECTIONS),
+            follow_redirects=True,
+        )
+    return client
+
+
+def get_cache() -> Optional[ResultCache]:
+    global _cache
+    if _cache is None and Config.SEARCH_CACHE_TTL_HOURS > 0:
+        _cache = ResultCache(Config.SEARCH_CACHE_DIR, max_entries=Config.CACHE_MAX_ENTRIES, max_age_seconds=Config.SEARCH_CACHE_TTL_HOURS * 3600)
+    return _cache
+
+
+def _recency_filter(recency_days: Optional[int]) -> Optional[str]:
+    # DuckDuckGo date filter: past day / week / month / year
+    if not recency_days:
+        return None
+    if recency_days <= 1:
+        return "d"
+    if recency_days <= 7:
+        return "w"
+    if recency_days <= 31:
+        return "m"
+    return "y"
+
+
+def parse_results(html: str, num_results: int) -> List[Dict[str, str]]:
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=RESULT_STRAINER)
+
+    results: List[Dict[str, str]] = []
+    for r in soup.find_all("div", {"class": "result__body"}, limit=num_results):
+        title_tag = r.find("a", {"class": "result__a"})
+        snippet_tag = r.find("a", {"class": "result__snippet"}) or r.find("div", {"class": "result__snippet"})
+        href = title_tag["href"] if title_tag and title_tag.has_attr("href") else ""
+        title = title_tag.get_text(strip=True) if title_tag else ""
+        snippet = snippet_tag.get_text(strip=True) if snippet_tag else ""
+        results.append({"title": title, "url": href, "snippet": snippet})
+    return results
+
+
+@traced()
+async def web_search(query: str, num_results: int = 3, recency_days: Optional[int] = None) -> dict:
+    """
+    Search the web for `query` and return up to num_results results (title, url, snippet).
+    recency_days limits results to roughly the last N days.
+    """
+    cache = get_cache()
+    key = ResultCache.make_key("web_search", Config.SEARCH_ENDPOINT, query, num_results, recency_days)
+    if cache:
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            return success(cached, meta={"query": query, "num_results": len(cached), "cached": True})
+
     try:
-        url = "https://html.duckduckgo.com/html/"
         params = {"q": query}
-        headers = {"User-Agent": "podcast-lifecycle-agent/1.0 (+https://example.local)"}
-        resp = requests.post(url, data=params, headers=headers, timeout=10)
+        df = _recency_filter(recency_days)
+        if df:
+            params["df"] = df
+        resp = await get_client().post(Config.SEARCH_ENDPOINT, data=params)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        results: List[Dict[str, str]] = []
-        for r in soup.find_all("div", {"class": "result__body"}, limit=num_results):
-            title_tag = r.find("a", {"class": "result__a"})
-            snippet_tag = r.find("a", {"class": "result__snippet"}) or r.find("div", {"class": "result__snippet"})
-            href = title_tag["href"] if title_tag and title_tag.has_attr("href") else ""
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            snippet = snippet_tag.get_text(strip=True) if snippet_tag else ""
-            results.append({"title": title, "url": href, "snippet": snippet})
-
-        if not results:
-            return failure("No search results found.")
-        return success(results, meta={"query": query, "num_results": len(results)})
+        # Parsing is CPU-bound; off the loop so parallel searches and other stages keep running
+        results = await asyncio.to_thread(parse_results, resp.text, num_results)
     except Exception as e:
         return failure(f"Search failed: {e}")
+
+    if not results:
+        return failure("No search results found.")
+
+    if cache:
+        await asyncio.to_thread(cache.put, key, results)
+    return success(results, meta={"query": query, "num_results": len(results)})
+
+
+@traced()
+async def web_search_many(queries: List[str], num_results: int = 3, recency_days: Optional[int] = None) -> dict:
+    """
+    Run several web searches in parallel.
+    Returns one entry per query with its results or error.
+    """
+    responses = await asyncio.gather(*(web_search(q, num_results, recency_days) for q in queries))
+
+    data = [
+        {"query": q, "results": r["data"]} if r["ok"] else {"query": q, "error": r["error"]}
+        for q, r in zip(queries, responses)
+    ]
+    if not any(r["ok"] for r in responses):
+        return failure("No search results found.", meta={"queries": len(queries)})
+    return success(data, meta={"queries": len(queries), "succeeded": sum(1 for r in responses if r["ok"])})
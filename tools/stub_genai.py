@@ -0,0 +1,194 @@
+import os
+import math
+import time
+import asyncio
+import wave
+import array
+import random
+import itertools
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+# Offline stand-in for google.genai.Client, covering the calls made by tools/audio_tool.py:
+#   client.files.upload(file=...), client.files.get(name=...), client.models.generate_content(...)
+#   and the same calls under client.aio
+
+Responder = Callable[[str, str], str]
+
+
+def default_responder(path: str, prompt: str) -> str:
+    try:
+        with wave.open(path, "rb") as wf:
+            duration = wf.getnframes() / float(wf.getframerate())
+    except Exception:
+        duration = 0.0
+    return f"[00:00] stub transcript of {os.path.basename(path)} ({duration:.1f}s)"
+
+
+class ScriptedResponder:
+    """
+    Transcribes audio produced by synth_wav() as a deterministic word sequence:
+    word N is "spoken" at N / words_per_second seconds into the source file.
+    Chunk offsets are recovered by locating the chunk's samples inside the source,
+    so stitched chunk transcripts can be checked against the full script.
+    """
+
+    def __init__(self, source_wav: str, words_per_second: float = 2.5, line_seconds: float = 5.0):
+        self.words_per_second = words_per_second
+        self.line_seconds = line_seconds
+        with wave.open(source_wav, "rb") as wf:
+            self.rate = wf.getframerate()
+            self.frame_size = wf.getsampwidth() * wf.getnchannels()
+            self.source = wf.readframes(wf.getnframes())
+
+    def word(self, n: int) -> str:
+        return f"w{n}"
+
+    def _offset(self, frames: bytes) -> float:
+        probe = frames[: self.frame_size * 400]
+        pos = self.source.find(probe) if probe else 0
+        return max(pos, 0) / self.frame_size / self.rate
+
+    def __call__(self, path: str, prompt: str) -> str:
+        with wave.open(path, "rb") as wf:
+            frames = wf.readframes(wf.getnframes())
+            duration = wf.getnframes() / float(wf.getframerate())
+        offset = self._offset(frames)
+
+        # Group the words inside [offset, offset + duration) into lines of line_seconds
+        lines = {}
+        n = math.ceil(offset * self.words_per_second)
+        while n / self.words_per_second < offset + duration:
+            rel = n / self.words_per_second - offset
+            lines.setdefault(int(rel // self.line_seconds), (rel, []))[1].append(self.word(n))
+            n += 1
+
+        out = []
+        for _, (rel, words) in sorted(lines.items()):
+            rel = int(rel)
+            out.append(f"[{rel // 60:02d}:{rel % 60:02d}] {' '.join(words)}")
+        return "\n".join(out)
+
+
+def synth_wav(path: str, seconds: float, rate: int = 16000, pause_every: float = 7.0, pause_seconds: float = 0.4, seed: int = 7):
+    """Write mono 16-bit noise with quiet pauses; samples never repeat, so chunks can be located."""
+    rng = random.Random(seed)
+    samples = array.array("h")
+    for i in range(int(seconds * rate)):
+        t = i / rate
+        amplitude = 60 if (t % pause_every) < pause_seconds else 8000
+        samples.append(rng.randint(-amplitude, amplitude))
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(samples.tobytes())
+
+
+class _StubFiles:
+    def __init__(self, client: "StubGenAIClient"):
+        self._client = client
+        self._files = {}
+        self._polls = {}
+        self._ids = itertools.count(1)
+
+    def _register(self, file: str):
+        name = f"files/stub-{next(self._ids)}"
+        self._files[name] = file
+        self._polls[name] = 0
+        self._client.uploads += 1
+        return self._ref(name)
+
+    def _poll(self, name: str):
+        self._polls[name] += 1
+        return self._ref(name)
+
+    def upload(self, file: str, **kwargs):
+        time.sleep(self._client.latency)
+        return self._register(file)
+
+    def get(self, name: str, **kwargs):
+        time.sleep(self._client.latency)
+        return self._poll(name)
+
+    def _ref(self, name: str):
+        ready = self._polls[name] >= self._client.processing_polls
+        return SimpleNamespace(
+            name=name,
+            uri=f"stub://{name}",
+            mime_type="audio/wav",
+            state=SimpleNamespace(name="ACTIVE" if ready else "PROCESSING"),
+        )
+
+    def path_for(self, uri: str) -> Optional[str]:
+        return self._files.get(uri.replace("stub://", "", 1))
+
+
+class _StubModels:
+    def __init__(self, client: "StubGenAIClient"):
+        self._client = client
+
+    def _generate(self, contents):
+        self._client.generate_calls += 1
+        path, prompt = None, ""
+        for content in contents:
+            for part in getattr(content, "parts", None) or []:
+                file_data = getattr(part, "file_data", None)
+                if file_data is not None:
+                    path = self._client.files.path_for(file_data.file_uri)
+                if getattr(part, "text", None):
+                    prompt += part.text
+        return SimpleNamespace(text=self._client.responder(path or "", prompt))
+
+    def generate_content(self, model: str, contents, **kwargs):
+        time.sleep(self._client.latency)
+        return self._generate(contents)
+
+
+class _AsyncStubFiles:
+    def __init__(self, client: "StubGenAIClient"):
+        self._client = client
+
+    async def upload(self, file: str, **kwargs):
+        client = self._client
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        try:
+            await asyncio.sleep(client.latency)
+            return client.files._register(file)
+        finally:
+            client.in_flight -= 1
+
+    async def get(self, name: str, **kwargs):
+        await asyncio.sleep(self._client.latency)
+        return self._client.files._poll(name)
+
+
+class _AsyncStubModels:
+    def __init__(self, client: "StubGenAIClient"):
+        self._client = client
+
+    async def generate_content(self, model: str, contents, **kwargs):
+        await asyncio.sleep(self._client.latency)
+        return self._client.models._generate(contents)
+
+
+class StubGenAIClient:
+    """
+    Drop-in for google.genai.Client in the transcription path (sync and `.aio`).
+    `latency` is slept on every call, `processing_polls` is how many files.get
+    calls return PROCESSING before ACTIVE, and `responder(path, prompt)` makes the text.
+    `max_in_flight` records the peak number of concurrent async uploads.
+    """
+
+    def __init__(self, responder: Optional[Responder] = None, latency: float = 0.0, processing_polls: int = 1):
+        self.responder = responder or default_responder
+        self.latency = latency
+        self.processing_polls = processing_polls
+        self.uploads = 0
+        self.generate_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.files = _StubFiles(self)
+        self.models = _StubModels(self)
+        self.aio = SimpleNamespace(files=_AsyncStubFiles(self), models=_AsyncStubModels(self))